@@ -13,6 +13,7 @@ import structlog
 from meltano.cli import (
     add,
     config,
+    discover,
     docs,
     dragon,
     elt,
@@ -46,6 +47,7 @@ if t.TYPE_CHECKING:
 cli.add_command(add.add)
 cli.add_command(compile_module.compile_command)
 cli.add_command(config.config)
+cli.add_command(discover.discover)
 cli.add_command(docs.docs)
 cli.add_command(dragon.dragon)
 cli.add_command(elt.el)
@@ -0,0 +1,133 @@
+"""CLI command `meltano discover`."""
+
+from __future__ import annotations
+
+import typing as t
+from contextlib import closing
+
+import click
+import structlog
+
+from meltano.cli.params import get_install_options, pass_project
+from meltano.cli.utils import CliEnvironmentBehavior, CliError, InstrumentedCmd
+from meltano.core.db import project_engine
+from meltano.core.discovery_service import CatalogDiscoveryService
+from meltano.core.plugin import PluginType
+from meltano.core.plugin_install_service import PluginInstallReason
+from meltano.core.utils import run_async
+
+if t.TYPE_CHECKING:
+    from meltano.cli.params import InstallPlugins
+    from meltano.core.discovery_service import CatalogDiscoveryResult
+    from meltano.core.project import Project
+
+logger = structlog.stdlib.get_logger(__name__)
+
+install, no_install, only_install = get_install_options(include_only_install=True)
+
+
+def discovery_status_update(result: CatalogDiscoveryResult) -> None:
+    """Report the result of discovering the catalog of an extractor.
+
+    Args:
+        result: The result of discovering the catalog.
+    """
+    duration_seconds = round(result.duration, 3)
+    if result.successful:
+        logger.info(
+            "Discovered catalog",
+            plugin_name=result.plugin.name,
+            duration_seconds=duration_seconds,
+        )
+    else:
+        logger.error(
+            "Catalog discovery failed",
+            plugin_name=result.plugin.name,
+            duration_seconds=duration_seconds,
+            error=result.error,
+        )
+
+
+@click.command(
+    cls=InstrumentedCmd,
+    short_help="Discover the catalogs of extractors.",
+    environment_behavior=CliEnvironmentBehavior.environment_optional_use_default,
+)
+@click.argument("extractor", nargs=-1, required=False)
+@click.option(
+    "--all",
+    "all_extractors",
+    is_flag=True,
+    help="Discover the catalogs of all extractors supporting discovery.",
+)
+@click.option(
+    "--parallelism",
+    "-p",
+    type=click.INT,
+    default=None,
+    help=(
+        "Limit the number of extractors to run in discovery mode in parallel. "
+        "Defaults to the number of cores."
+    ),
+)
+@click.option(
+    "--refresh-catalog",
+    is_flag=True,
+    help="Discover catalogs even if a valid one is cached.",
+)
+@install
+@no_install
+@only_install
+@pass_project(migrate=True)
+@run_async
+async def discover(
+    project: Project,
+    extractor: tuple[str, ...],
+    install_plugins: InstallPlugins,
+    *,
+    all_extractors: bool,
+    parallelism: int | None,
+    refresh_catalog: bool,
+) -> None:
+    """Discover the catalogs of extractors, to have them cached for later runs.
+
+    \b
+    Read more at https://docs.meltano.com/reference/command-line-interface#discover
+    """  # noqa: D301
+    if all_extractors:
+        plugins = [
+            plugin
+            for plugin in project.plugins.get_plugins_of_type(PluginType.EXTRACTORS)
+            if "discover" in (plugin.capabilities or [])
+        ]
+    elif extractor:
+        plugins = [
+            project.plugins.find_plugin(name, plugin_type=PluginType.EXTRACTORS)
+            for name in extractor
+        ]
+    else:
+        msg = "Provide the extractors to discover the catalogs of, or use --all"
+        raise CliError(msg)
+
+    await install_plugins(project, plugins, reason=PluginInstallReason.AUTO)
+
+    _, session_maker = project_engine(project)
+    with closing(session_maker()) as session:
+        discovery_service = CatalogDiscoveryService(
+            project,
+            session,
+            status_cb=discovery_status_update,
+            parallelism=parallelism,
+            refresh=refresh_catalog,
+        )
+        results = await discovery_service.discover_catalogs(plugins)
+
+    num_failed = len([result for result in results if not result.successful])
+    logger.info(
+        "Discovered %d/%d catalogs",
+        len(results) - num_failed,
+        len(results),
+    )
+    if num_failed:
+        msg = f"Catalog discovery failed for {num_failed} extractor(s)"
+        raise CliError(msg)
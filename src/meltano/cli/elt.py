@@ -25,6 +25,7 @@ from meltano.core.job.stale_job_failer import fail_stale_jobs
 from meltano.core.logging import JobLoggingService, OutputLogger
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.error import PluginNotFoundError
+from meltano.core.plugin.singer.catalog_streaming import format_catalog
 from meltano.core.plugin_install_service import PluginInstallReason
 from meltano.core.runner import RunnerError
 from meltano.core.runner.dbt import DbtRunner
@@ -441,6 +442,8 @@ async def dump_file(context_builder: ELTContextBuilder, dumpable: str) -> None:
         async with invoker.prepared(elt_context.session):
             content = await invoker.dump(file_id)
 
+        if file_id == "catalog":
+            content = format_catalog(content)
         click.echo(content)
     except FileNotFoundError as err:
         raise CliError(f"Could not find {dumpable} file for this pipeline") from err  # noqa: EM102, TRY003
@@ -471,7 +474,7 @@ async def _run_job(
         job_logging_service = JobLoggingService(project)
         log_file = job_logging_service.generate_log_name(job.job_name, job.run_id)
 
-        output_logger = OutputLogger(log_file)
+        output_logger = OutputLogger.from_settings(log_file, project.settings)
         context_builder.set_base_output_logger(output_logger)
 
         log = logger.bind(name="meltano", run_id=str(job.run_id), state_id=job.job_name)
@@ -24,6 +24,7 @@ from meltano.core.db import project_engine
 from meltano.core.error import AsyncSubprocessError
 from meltano.core.logging.utils import capture_subprocess_output
 from meltano.core.plugin.error import PluginNotFoundError
+from meltano.core.plugin.singer.catalog_streaming import format_catalog
 from meltano.core.plugin_install_service import PluginInstallReason
 from meltano.core.plugin_invoker import (
     UnknownCommandError,
@@ -309,4 +310,6 @@ async def dump_file(invoker: PluginInvoker, file_id: str) -> None:
         raise CliError(f"Could not find {file_id}") from err  # noqa: EM102, TRY003
     except Exception as err:
         raise CliError(f"Could not dump {file_id}: {err}") from err  # noqa: EM102, TRY003
+    if file_id == "catalog":
+        content = format_catalog(content)
     print(content)  # noqa: T201
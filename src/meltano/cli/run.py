@@ -16,7 +16,11 @@ from meltano.cli.params import (
 )
 from meltano.cli.utils import CliEnvironmentBehavior, CliError, PartialInstrumentedCmd
 from meltano.core._state import StateStrategy
-from meltano.core.block.block_parser import BlockParser, validate_block_sets
+from meltano.core.block.block_parser import (
+    BlockParser,
+    block_dependencies,
+    validate_block_sets,
+)
 from meltano.core.block.extract_load import ExtractLoadBlocks
 from meltano.core.block.plugin_command import InvokerCommand
 from meltano.core.logging.utils import change_console_log_level
@@ -123,6 +127,39 @@ install, no_install, only_install = get_install_options(include_only_install=Tru
         "the pipeline will be gracefully terminated."
     ),
 )
+@click.option(
+    "--parallelism",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    show_envvar=True,
+    envvar="MELTANO_RUN_PARALLELISM",
+    help=(
+        "Maximum number of blocks to run concurrently. Extract/load block sets "
+        "run concurrently unless they share an extractor or state ID, while "
+        "command blocks wait for all preceding blocks."
+    ),
+)
+@click.option(
+    "--spool",
+    help=(
+        "Spool the output of extractors to disk, so a failed loader can be "
+        "resumed without extracting the data again."
+    ),
+    show_envvar=True,
+    envvar="MELTANO_RUN_SPOOL",
+    is_flag=True,
+)
+@click.option(
+    "--resume-from-spool",
+    help=(
+        "Replay extractor output spooled by an earlier run into the loader, "
+        "starting after the last state it acknowledged. Implies --spool."
+    ),
+    show_envvar=True,
+    envvar="MELTANO_RUN_RESUME_FROM_SPOOL",
+    is_flag=True,
+)
 @click.argument(
     "blocks",
     nargs=-1,
@@ -147,6 +184,9 @@ async def run(
     state_strategy: str,
     run_id: uuid.UUID | None,
     timeout: int | None,
+    parallelism: int,
+    spool: bool,
+    resume_from_spool: bool,
     blocks: list[str],
     install_plugins: InstallPlugins,
 ) -> None:
@@ -200,6 +240,9 @@ async def run(
             state_id_suffix=state_id_suffix,
             state_strategy=_state_strategy,
             run_id=run_id,
+            isolate_run_dirs=parallelism > 1,
+            spool=spool,
+            resume_from_spool=resume_from_spool,
         )
         parsed_blocks = list(parser.find_blocks(0))
         if not parsed_blocks:
@@ -228,13 +271,17 @@ async def run(
     run_start_time = time.perf_counter()
     success = False
     try:
+        run_blocks = _run_blocks(
+            ctx,
+            tracker,
+            parsed_blocks,
+            dry_run=dry_run,
+            parallelism=parallelism,
+        )
         if timeout is not None:
-            await asyncio.wait_for(
-                _run_blocks(ctx, tracker, parsed_blocks, dry_run=dry_run),
-                timeout=timeout,
-            )
+            await asyncio.wait_for(run_blocks, timeout=timeout)
         else:
-            await _run_blocks(ctx, tracker, parsed_blocks, dry_run=dry_run)
+            await run_blocks
         success = True
     except asyncio.TimeoutError:
         run_end_time = time.perf_counter()
@@ -266,75 +313,157 @@ async def _run_blocks(
     parsed_blocks: list[InvokerCommand | ExtractLoadBlocks],
     *,
     dry_run: bool,
+    parallelism: int = 1,
 ) -> None:
-    current_block = None
+    if parallelism > 1:
+        await _run_blocks_concurrently(
+            ctx,
+            tracker,
+            parsed_blocks,
+            dry_run=dry_run,
+            parallelism=parallelism,
+        )
+        return
+
     for idx, blk in enumerate(parsed_blocks):
-        current_block = blk
-        blk_name = blk.__class__.__name__
-        tracking_ctx = PluginsTrackingContext.from_block(blk)
-        with tracker.with_contexts(tracking_ctx):
-            tracker.track_block_event(blk_name, BlockEvents.initialized)
-        if dry_run:
-            msg = f"Dry run, but would have run block {idx + 1}/{len(parsed_blocks)}."
-            if isinstance(blk, ExtractLoadBlocks):
-                logger.info(
-                    msg,
-                    block_type=blk_name,
-                    comprised_of=[plugin.string_id for plugin in blk.blocks],
-                )
-            elif isinstance(blk, InvokerCommand):  # pragma: no branch
+        await _run_block(ctx, tracker, parsed_blocks, idx, blk, dry_run=dry_run)
+
+
+async def _run_blocks_concurrently(
+    ctx: click.Context,
+    tracker: Tracker,
+    parsed_blocks: list[InvokerCommand | ExtractLoadBlocks],
+    *,
+    dry_run: bool,
+    parallelism: int,
+) -> None:
+    """Run blocks concurrently, as soon as the blocks they depend on completed.
+
+    Once a block fails, blocks that didn't start yet are skipped, while blocks
+    already running are allowed to complete.
+    """
+    dependencies = block_dependencies(parsed_blocks)
+    semaphore = asyncio.Semaphore(parallelism)
+    failed = asyncio.Event()
+    tasks: list[asyncio.Task] = []
+
+    async def run_when_ready(idx: int, blk: InvokerCommand | ExtractLoadBlocks) -> None:
+        if upstream := [tasks[dep] for dep in dependencies[idx]]:
+            await asyncio.wait(upstream)
+
+        async with semaphore:
+            if failed.is_set():
                 logger.info(
-                    msg,
-                    block_type=blk_name,
-                    comprised_of=f"{blk.string_id}:{blk.command}",
+                    "Skipping block after an earlier failure",
+                    set_number=idx,
+                    block_type=blk.__class__.__name__,
                 )
-            continue
-
-        block_start_time = time.perf_counter()
-        try:
-            await blk.run()
-        except RunnerError as err:
-            block_end_time = time.perf_counter()
-            block_duration = block_end_time - block_start_time
-            logger.error(  # noqa: TRY400
-                "Block run completed",
-                set_number=idx,
+                return
+
+            try:
+                with structlog.contextvars.bound_contextvars(set_number=idx):
+                    await _run_block(
+                        ctx,
+                        tracker,
+                        parsed_blocks,
+                        idx,
+                        blk,
+                        dry_run=dry_run,
+                    )
+            except BaseException:
+                failed.set()
+                raise
+
+    for idx, blk in enumerate(parsed_blocks):
+        tasks.append(asyncio.ensure_future(run_when_ready(idx, blk)))
+
+    try:
+        await asyncio.wait(tasks)
+    finally:
+        # Only reached with pending tasks if we were cancelled, e.g. on timeout
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in tasks:
+        if not task.cancelled() and (err := task.exception()):
+            raise err
+
+
+async def _run_block(
+    ctx: click.Context,
+    tracker: Tracker,
+    parsed_blocks: list[InvokerCommand | ExtractLoadBlocks],
+    idx: int,
+    blk: InvokerCommand | ExtractLoadBlocks,
+    *,
+    dry_run: bool,
+) -> None:
+    blk_name = blk.__class__.__name__
+    tracking_ctx = PluginsTrackingContext.from_block(blk)
+    with tracker.with_contexts(tracking_ctx):
+        tracker.track_block_event(blk_name, BlockEvents.initialized)
+    if dry_run:
+        msg = f"Dry run, but would have run block {idx + 1}/{len(parsed_blocks)}."
+        if isinstance(blk, ExtractLoadBlocks):
+            logger.info(
+                msg,
                 block_type=blk_name,
-                success=False,
-                err=err.args[0] if err.args else err.__class__.__name__,
-                exit_codes=err.exitcodes,
-                duration_seconds=round(block_duration, 3),
+                comprised_of=[plugin.string_id for plugin in blk.blocks],
             )
-            with tracker.with_contexts(tracking_ctx):
-                tracker.track_block_event(blk_name, BlockEvents.failed)
-            ctx.exit(1)
-        except asyncio.CancelledError:
-            # Handle graceful termination on timeout
+        elif isinstance(blk, InvokerCommand):  # pragma: no branch
             logger.info(
-                "Attempting graceful termination of current block",
-                block_type=current_block.__class__.__name__,
+                msg,
+                block_type=blk_name,
+                comprised_of=f"{blk.string_id}:{blk.command}",
             )
-            if isinstance(current_block, ExtractLoadBlocks):
-                await current_block.terminate(graceful=True)
-            else:
-                await current_block.stop(kill=False)
-            raise
-        except Exception as bare_err:
-            # make sure we also fire block failed events for all other exceptions
-            with tracker.with_contexts(tracking_ctx):
-                tracker.track_block_event(blk_name, BlockEvents.failed)
-            raise bare_err  # noqa: TRY201
+        return
 
+    block_start_time = time.perf_counter()
+    try:
+        await blk.run()
+    except RunnerError as err:
         block_end_time = time.perf_counter()
         block_duration = block_end_time - block_start_time
-
-        logger.info(
+        logger.error(  # noqa: TRY400
             "Block run completed",
             set_number=idx,
             block_type=blk_name,
-            success=True,
-            err=None,
+            success=False,
+            err=err.args[0] if err.args else err.__class__.__name__,
+            exit_codes=err.exitcodes,
             duration_seconds=round(block_duration, 3),
         )
         with tracker.with_contexts(tracking_ctx):
-            tracker.track_block_event(blk_name, BlockEvents.completed)
+            tracker.track_block_event(blk_name, BlockEvents.failed)
+        ctx.exit(1)
+    except asyncio.CancelledError:
+        # Handle graceful termination on timeout
+        logger.info(
+            "Attempting graceful termination of current block",
+            block_type=blk_name,
+        )
+        if isinstance(blk, ExtractLoadBlocks):
+            await blk.terminate(graceful=True)
+        else:
+            await blk.stop(kill=False)
+        raise
+    except Exception as bare_err:
+        # make sure we also fire block failed events for all other exceptions
+        with tracker.with_contexts(tracking_ctx):
+            tracker.track_block_event(blk_name, BlockEvents.failed)
+        raise bare_err  # noqa: TRY201
+
+    block_end_time = time.perf_counter()
+    block_duration = block_end_time - block_start_time
+
+    logger.info(
+        "Block run completed",
+        set_number=idx,
+        block_type=blk_name,
+        success=True,
+        err=None,
+        duration_seconds=round(block_duration, 3),
+    )
+    with tracker.with_contexts(tracking_ctx):
+        tracker.track_block_event(blk_name, BlockEvents.completed)
@@ -4,6 +4,9 @@ import typing as t
 
 from meltano.core._state import StateStrategy
 
+if t.TYPE_CHECKING:
+    from meltano.core.plugin.singer.catalog import StreamPartition
+
 
 class ELContextProtocol(t.Protocol):
     """Protocol for EL context classes."""
@@ -11,6 +14,7 @@ class ELContextProtocol(t.Protocol):
     full_refresh: bool | None
     state_strategy: StateStrategy
     refresh_catalog: bool | None
+    stream_partition: StreamPartition | None = None
 
     def should_merge_states(self) -> bool:
         """Check whether the EL state is incomplete and should be merged."""
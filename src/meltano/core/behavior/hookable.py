@@ -8,11 +8,20 @@ called before or after given trigger.
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
 import structlog
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# Hooks being triggered by the current task and the tasks it started, by object
+# ID and hook name. This is tracked per task so that objects shared by plugins
+# running concurrently still trigger their hooks for every one of them.
+_triggering_hooks: ContextVar[frozenset[tuple[int, str]]] = ContextVar(
+    "triggering_hooks",
+    default=frozenset(),
+)
+
 
 class hook:  # noqa: N801
     """This decorator marks a function as a `__hook__`.
@@ -82,21 +91,19 @@ class HookObject(metaclass=Hookable):
             async with self.obj.trigger_hooks("cleanup", self):
                 doStuff()
         """
-        try:
-            already_triggering = hook_name in self._triggering_hooks
-        except AttributeError:
-            self._triggering_hooks = set()
-            already_triggering = False
+        key = (id(self), hook_name)
+        triggering = _triggering_hooks.get()
+        if key in triggering:
+            yield
+            return
 
-        if not already_triggering:
-            self._triggering_hooks.add(hook_name)
+        _triggering_hooks.set(triggering | {key})
+        try:
             await self.__class__.trigger(self, f"before_{hook_name}", *args, **kwargs)
-
-        yield
-
-        if not already_triggering:
+            yield
             await self.__class__.trigger(self, f"after_{hook_name}", *args, **kwargs)
-            self._triggering_hooks.remove(hook_name)
+        finally:
+            _triggering_hooks.set(triggering)
 
     @classmethod
     async def trigger(cls, target, hook_name, *args, **kwargs) -> None:  # noqa: ANN001, ANN002, ANN003
@@ -14,8 +14,11 @@ from meltano.core.block.blockset import BlockSet, BlockSetValidationError
 from meltano.core.block.extract_load import ELBContextBuilder, ExtractLoadBlocks
 from meltano.core.block.plugin_command import plugin_command_invoker
 from meltano.core.block.singer import CONSUMERS
+from meltano.core.block.tee import TEE_DELIMITER
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.error import PluginNotFoundError
+from meltano.core.plugin.settings_service import PluginSettingsService
+from meltano.core.plugin.singer.catalog import StreamPartition
 from meltano.core.task_sets_service import TaskSetsService
 
 if t.TYPE_CHECKING:
@@ -70,6 +73,51 @@ def validate_block_sets(
     return True
 
 
+def block_dependencies(
+    blocks: list[InvokerCommand | ExtractLoadBlocks],
+) -> list[set[int]]:
+    """Determine which earlier blocks each block in a list must wait for.
+
+    Command blocks act as barriers: they wait for all preceding blocks, and all
+    following blocks wait for them. `ExtractLoadBlocks` sets in between only
+    wait for earlier sets with the same extractor or state ID, since those
+    share a catalog, run dir or state.
+
+    Args:
+        blocks: A list of blocks, in invocation order.
+
+    Returns:
+        For each block, the indices of the blocks it depends on.
+    """
+    dependencies: list[set[int]] = []
+    barrier: int | None = None
+
+    for idx, blk in enumerate(blocks):
+        if not isinstance(blk, ExtractLoadBlocks):
+            dependencies.append(set(range(idx)))
+            barrier = idx
+            continue
+
+        first = 0 if barrier is None else barrier + 1
+        deps = set() if barrier is None else {barrier}
+        deps.update(
+            other_idx
+            for other_idx in range(first, idx)
+            if _block_sets_conflict(blk, blocks[other_idx])  # type: ignore[arg-type]
+        )
+        dependencies.append(deps)
+
+    return dependencies
+
+
+def _block_sets_conflict(first: ExtractLoadBlocks, second: ExtractLoadBlocks) -> bool:
+    if first.head.string_id == second.head.string_id:
+        return True
+
+    first_job, second_job = first.context.job, second.context.job
+    return bool(first_job and second_job and first_job.job_name == second_job.job_name)
+
+
 class BlockParser:  # noqa: D101
     def __init__(
         self,
@@ -84,6 +132,9 @@ class BlockParser:  # noqa: D101
         state_id_suffix: str | None = None,
         state_strategy: StateStrategy = StateStrategy.auto,
         run_id: uuid.UUID | None = None,
+        isolate_run_dirs: bool = False,
+        spool: bool = False,
+        resume_from_spool: bool = False,
     ):
         """Parse a meltano run command invocation into a list of blocks.
 
@@ -100,6 +151,11 @@ class BlockParser:  # noqa: D101
             state_id_suffix: State ID suffix to use.
             state_strategy: Strategy to use for state evolution.
             run_id: Custom run ID to use.
+            isolate_run_dirs: Whether loaders and mappers get a run dir scoped
+                to the extractor of their set, so sets can run concurrently.
+            spool: Whether to spool the output of extractors to disk.
+            resume_from_spool: Whether to replay extractor output spooled by an
+                earlier run, instead of running the extractors.
 
         Raises:
             ClickException: If a block name is not found.
@@ -115,14 +171,28 @@ class BlockParser:  # noqa: D101
         self._plugins: list[ProjectPlugin] = []
         self._commands: dict[int, str] = {}
         self._mappings_ref: dict[int, str] = {}
+        self._fan_out: dict[int, list[ProjectPlugin]] = {}
         self._state_strategy = state_strategy
         self._run_id = run_id
+        self._isolate_run_dirs = isolate_run_dirs
+        self._spool = spool
+        self._resume_from_spool = resume_from_spool
 
         task_sets_service: TaskSetsService = TaskSetsService(project)
 
         blocks = self._expand_jobs(blocks, task_sets_service)
 
         for idx, name in enumerate(blocks):
+            if TEE_DELIMITER in name:
+                plugin, *fan_out = self._find_tee_loaders(name)
+                self._plugins.append(plugin)
+                self._fan_out[idx] = fan_out
+                self.log.debug(
+                    "found fanned out loaders in cli invocation",
+                    plugin_names=[plugin.name, *(loader.name for loader in fan_out)],
+                )
+                continue
+
             try:
                 parsed_name, command_name = name.split(":")
             except ValueError:
@@ -162,7 +232,37 @@ class BlockParser:  # noqa: D101
         Returns:
             A list of ProjectPlugin.
         """
-        return self._plugins
+        return [
+            *self._plugins,
+            *(loader for loaders in self._fan_out.values() for loader in loaders),
+        ]
+
+    def _find_tee_loaders(self, name: str) -> list[ProjectPlugin]:
+        """Find the loaders an extractor's output is fanned out to.
+
+        Args:
+            name: Loader names separated by commas, e.g. `target-a,target-b`.
+
+        Returns:
+            The loader plugins.
+
+        Raises:
+            ClickException: If a block is not found or is not a loader.
+        """
+        loaders = []
+        for loader_name in name.split(TEE_DELIMITER):
+            try:
+                plugin = self.project.plugins.find_plugin(loader_name)
+            except PluginNotFoundError as e:
+                raise click.ClickException(f"Block {loader_name} not found") from e  # noqa: EM102, TRY003
+
+            if plugin.type != PluginType.LOADERS:
+                raise click.ClickException(  # noqa: TRY003
+                    f"Block {loader_name} in '{name}' is not a loader: only "  # noqa: EM102
+                    "loaders can be combined to fan out output.",
+                )
+            loaders.append(plugin)
+        return loaders
 
     def _expand_jobs(self, blocks: list[str], task_sets: TaskSetsService) -> list[str]:
         """Expand any jobs present in a list of blocks into their raw block names.
@@ -210,7 +310,10 @@ class BlockParser:  # noqa: D101
         cur = offset
         while cur < len(self._plugins):
             plugin = self._plugins[cur]
-            elb, idx = self._find_next_elb_set(cur)
+            if (partitions := self._stream_partitions(plugin)) > 1:
+                elb, idx = self._find_next_partitioned_elb_set(cur, partitions)
+            else:
+                elb, idx = self._find_next_elb_set(cur)
             if elb:
                 self.log.debug("found ExtractLoadBlocks set", offset=cur)
                 yield elb
@@ -233,14 +336,64 @@ class BlockParser:  # noqa: D101
                     f"{cur + 1}, starting block '{plugin.name}'",
                 )
 
+    def _stream_partitions(self, plugin: ProjectPlugin) -> int:
+        """Get the number of partitions to split the streams of an extractor into.
+
+        Args:
+            plugin: The plugin at the head of a block set.
+
+        Returns:
+            The `_stream_partitions` extra of extractors, 1 for other plugins.
+        """
+        if plugin.type != PluginType.EXTRACTORS:
+            return 1
+
+        settings = PluginSettingsService(self.project, plugin)
+        return settings.get("_stream_partitions") or 1
+
+    def _find_next_partitioned_elb_set(
+        self,
+        offset: int,
+        partitions: int,
+    ) -> tuple[ExtractLoadBlocks | None, int]:
+        """Find an EL block set, with one set of blocks per stream partition.
+
+        Args:
+            offset: Starting offset for search.
+            partitions: Number of partitions to split the selected streams into.
+
+        Returns:
+            The `ExtractLoadBlocks` of the first partition, which runs the other
+            partitions alongside, and offset for remaining plugins.
+        """
+        other_partitions: list[ExtractLoadBlocks] = []
+        for index in range(1, partitions):
+            elb, idx = self._find_next_elb_set(
+                offset,
+                StreamPartition(index, partitions),
+            )
+            if elb is None:
+                return elb, idx
+            other_partitions.append(elb)
+
+        return self._find_next_elb_set(
+            offset,
+            StreamPartition(0, partitions),
+            other_partitions,
+        )
+
     def _find_next_elb_set(
         self,
         offset: int = 0,
+        stream_partition: StreamPartition | None = None,
+        partitions: list[ExtractLoadBlocks] | None = None,
     ) -> tuple[ExtractLoadBlocks | None, int]:
         """Search plugins to find an extract EL block set.
 
         Args:
             offset: Optional starting offset for search.
+            stream_partition: Optional slice of the selected streams to extract.
+            partitions: Sets of the other stream partitions, run alongside.
 
         Returns:
             The `ExtractLoadBlocks` object, and offset for remaining plugins.
@@ -259,6 +412,10 @@ class BlockParser:  # noqa: D101
             .with_state_id_suffix(self._state_id_suffix)
             .with_state_strategy(state_strategy=self._state_strategy)
             .with_run_id(self._run_id)
+            .with_isolated_run_dirs(isolate=self._isolate_run_dirs)
+            .with_stream_partition(stream_partition)
+            .with_spool(spool=self._spool)
+            .with_resume_from_spool(resume_from_spool=self._resume_from_spool)
         )
 
         if self._plugins[offset].type != PluginType.EXTRACTORS:
@@ -316,8 +473,11 @@ class BlockParser:  # noqa: D101
 
             elif plugin.type == PluginType.LOADERS:
                 self.log.debug("blocks", offset=offset, idx=next_block)
-                blocks.append(builder.make_block(plugin))
-                elb = ExtractLoadBlocks(builder.context(), blocks)
+                if fan_out := self._fan_out.get(offset + next_block):
+                    blocks.extend(builder.make_fan_out_blocks([plugin, *fan_out]))
+                else:
+                    blocks.append(builder.make_block(plugin))
+                elb = ExtractLoadBlocks(builder.context(), blocks, partitions or ())
                 return elb, idx + 2
             else:
                 self.log.warning(
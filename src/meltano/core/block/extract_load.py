@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 import typing as t
 from contextlib import asynccontextmanager, closing
+from itertools import takewhile
 
 import structlog
 
@@ -14,18 +16,27 @@ from meltano.core._state import StateStrategy
 from meltano.core.constants import STATE_ID_COMPONENT_DELIMITER
 from meltano.core.db import project_engine
 from meltano.core.elt_context import PluginContext
-from meltano.core.job import Job, JobFinder
+from meltano.core.job import Job, JobFinder, Payload
 from meltano.core.job.stale_job_failer import fail_stale_jobs
-from meltano.core.logging import JobLoggingService, OutputLogger
+from meltano.core.logging import (
+    JobLoggingService,
+    OutputLogger,
+    capture_subprocess_output_chunked,
+)
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.settings_service import PluginSettingsService
 from meltano.core.plugin_invoker import invoker_factory
 from meltano.core.runner import RunnerError
-from meltano.core.state_service import StateService
+from meltano.core.state_service import SINGER_STATE_KEY, StateService
+from meltano.core.utils import merge
 
 from .blockset import BlockSet, BlockSetValidationError
 from .future_utils import first_failed_future, handle_producer_line_length_limit_error
-from .singer import SingerBlock
+from .resource_sampler import RESOURCES_KEY, ResourceSampler
+from .singer import ForwardingMode, SingerBlock
+from .spool import Spool, SpoolAcknowledgements, SpoolReplayBlock
+from .stream_metrics import StreamMetrics
+from .tee import TeeBlock
 
 if t.TYPE_CHECKING:
     import uuid
@@ -35,10 +46,12 @@ if t.TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
     from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.plugin.singer.catalog import StreamPartition
     from meltano.core.plugin_invoker import PluginInvoker
     from meltano.core.project import Project
 
     from .ioblock import IOBlock
+    from .spool import SpoolWriter
 
 logger = structlog.getLogger(__name__)
 
@@ -64,6 +77,9 @@ class ELBContext(ELContextProtocol):
         base_output_logger: OutputLogger | None = None,
         state_strategy: StateStrategy = StateStrategy.auto,
         run_id: uuid.UUID | None = None,
+        stream_partition: StreamPartition | None = None,
+        spool: bool = False,
+        resume_from_spool: bool = False,
     ):
         """Use an ELBContext to pass information on to ExtractLoadBlocks.
 
@@ -79,6 +95,11 @@ class ELBContext(ELContextProtocol):
             base_output_logger: The base logger to use.
             state_strategy: Strategy to use for state updates.
             run_id: The run ID to use.
+            stream_partition: The slice of the selected streams to extract, if
+                the extractor's streams are split across partitions.
+            spool: Whether to spool the output of the extractor to disk.
+            resume_from_spool: Whether to replay the output of the extractor
+                spooled by an earlier run, instead of running the extractor.
         """
         self.project = project
         self.session = session
@@ -90,6 +111,9 @@ class ELBContext(ELContextProtocol):
         self.state_id_suffix = state_id_suffix
         self.state_strategy = state_strategy
         self.run_id = run_id
+        self.stream_partition = stream_partition
+        self.spool = spool
+        self.resume_from_spool = resume_from_spool
 
         # not yet used but required to satisfy the interface
         self.dry_run = False
@@ -126,6 +150,10 @@ class ELBContextBuilder:
         self._blocks = []
         self._state_strategy = StateStrategy.auto
         self._run_id: uuid.UUID | None = None
+        self._isolate_run_dirs = False
+        self._stream_partition: StreamPartition | None = None
+        self._spool = False
+        self._resume_from_spool = False
 
         self._base_output_logger = None
 
@@ -229,6 +257,58 @@ class ELBContextBuilder:
         self._run_id = run_id
         return self
 
+    def with_isolated_run_dirs(self, *, isolate: bool):  # noqa: ANN201
+        """Set whether plugins downstream of the extractor get their own run dir.
+
+        This allows the same loader or mapper to be used by block sets that run
+        concurrently, without their config files clashing.
+
+        Args:
+            isolate: whether to isolate the run dirs of downstream plugins.
+
+        Returns:
+            self
+        """
+        self._isolate_run_dirs = isolate
+        return self
+
+    def with_stream_partition(self, stream_partition: StreamPartition | None):  # noqa: ANN201
+        """Set the slice of the selected streams to extract.
+
+        Args:
+            stream_partition: the stream partition, or None to extract all
+                selected streams.
+
+        Returns:
+            self
+        """
+        self._stream_partition = stream_partition
+        return self
+
+    def with_spool(self, *, spool: bool):  # noqa: ANN201
+        """Set whether the output of the extractor is spooled to disk.
+
+        Args:
+            spool: whether to spool the output of the extractor.
+
+        Returns:
+            self
+        """
+        self._spool = spool
+        return self
+
+    def with_resume_from_spool(self, *, resume_from_spool: bool):  # noqa: ANN201
+        """Set whether to replay extractor output spooled by an earlier run.
+
+        Args:
+            resume_from_spool: whether to replay the spooled extractor output.
+
+        Returns:
+            self
+        """
+        self._resume_from_spool = resume_from_spool
+        return self
+
     def make_block(
         self,
         plugin: ProjectPlugin,
@@ -255,6 +335,26 @@ class ELBContextBuilder:
         self._env.update(ctx.env)
         return block
 
+    def make_fan_out_blocks(self, plugins: list[ProjectPlugin]) -> list[SingerBlock]:
+        """Create `SingerBlock` objects for plugins consuming the same output.
+
+        Every plugin gets the environment of the blocks upstream of it, but not
+        that of the other plugins, so settings of one loader can't leak into
+        another through `MELTANO_LOAD_*` variables.
+
+        Args:
+            plugins: The plugins to be executed.
+
+        Returns:
+            The new `SingerBlock` objects.
+        """
+        upstream_env = self._env.copy()
+        blocks = []
+        for plugin in plugins:
+            self._env = upstream_env.copy()
+            blocks.append(self.make_block(plugin))
+        return blocks
+
     def plugin_context(
         self,
         plugin: ProjectPlugin,
@@ -291,11 +391,22 @@ class ELBContextBuilder:
         Returns:
             A new `PluginInvoker` object.
         """
+        run_dir = self.elt_run_dir
+        if run_dir is None:
+            scope = []
+            if self._isolate_run_dirs and self._blocks:
+                # Scope the run dir to the extractor at the head of the set
+                scope.append(self._blocks[0].string_id)
+            if self._stream_partition is not None:
+                scope.append(f"partition-{self._stream_partition.partition}")
+            if scope:
+                run_dir = self.project.dirs.run(plugin_context.plugin.name, *scope)
+
         return invoker_factory(
             self.project,
             plugin_context.plugin,
             context=self.context(),
-            run_dir=self.elt_run_dir,
+            run_dir=run_dir,
             plugin_settings_service=plugin_context.settings_service,
         )
 
@@ -329,6 +440,9 @@ class ELBContextBuilder:
             base_output_logger=self._base_output_logger,
             state_strategy=self._state_strategy,
             run_id=self._run_id,
+            stream_partition=self._stream_partition,
+            spool=self._spool,
+            resume_from_spool=self._resume_from_spool,
         )
 
 
@@ -339,15 +453,20 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         self,
         context: ELBContext,
         blocks: t.Sequence[SingerBlock],
+        partitions: t.Sequence[ExtractLoadBlocks] = (),
     ):
         """Initialize a basic BlockSet suitable for executing ELT tasks.
 
         Args:
             context: the elt context to use for this elt run.
             blocks: the IOBlocks that should be used for this elt run.
+            partitions: sets extracting the other stream partitions of the same
+                extractor, which are run alongside this one.
         """
         self.context = context
         self.blocks = blocks
+        self.partitions = list(partitions)
+        self._pipeline = None
 
         self.output_logger = OutputLogger(None)
 
@@ -370,7 +489,10 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
                 self.context.job.job_name,
                 self.context.job.run_id,
             )
-            self.output_logger = OutputLogger(log_file)
+            self.output_logger = OutputLogger.from_settings(
+                log_file,
+                self.context.project.settings,
+            )
 
         self._process_futures = None
         self._stdout_futures = None
@@ -378,6 +500,12 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         self._errors = []
         self._state_service = None
 
+        self._stream_metrics: list[StreamMetrics] = []
+        self._resource_samplers: list[ResourceSampler] = []
+        self._spool: Spool | None = None
+        self._spool_writer: SpoolWriter | None = None
+        self._replaying = False
+
     def has_state(self) -> bool:
         """Check to see if any block in this BlockSet has 'state' capability.
 
@@ -431,7 +559,7 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         Returns:
             True if all upstream blocks are done, False otherwise.
         """
-        return all(block.process_future.done() for block in self.blocks[:index])
+        return all(block.process_future.done() for block in self.pipeline[:index])
 
     async def upstream_stop(self, index) -> None:  # noqa: ANN001
         """Stop all blocks upstream of a given index.
@@ -439,7 +567,7 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         Args:
             index: The index of the block to stop upstream from.
         """
-        for block in reversed(self.blocks[:index]):
+        for block in reversed(self.pipeline[:index]):
             await block.stop()
 
     async def process_wait(
@@ -489,10 +617,120 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
 
     async def execute(self) -> None:
         """Build the IO chain and execute the actual ELT task."""
-        async with self._start_blocks():
-            await self._link_io()
-            manager = ELBExecutionManager(self)
-            await manager.run()
+        if self.partitions:
+            await self._execute_partitions()
+            return
+
+        await self._execute_blocks()
+
+    async def _execute_blocks(self) -> None:
+        if self.spool:
+            self._prepare_spool()
+
+        try:
+            async with self._start_blocks():
+                await self._link_io()
+                manager = ELBExecutionManager(self)
+                await manager.run()
+        finally:
+            # A no-op if the extractor completed and its output was spooled
+            self.close_spool(complete=False)
+
+        if self.spool:
+            # Nothing left to resume from
+            self.spool.remove()
+
+    @property
+    def spool(self) -> Spool | None:
+        """Obtain the spool of the output of the extractor, if enabled.
+
+        Returns:
+            The spool, or None if spooling is not enabled.
+        """
+        if self._spool is None and (
+            self.context.spool or self.context.resume_from_spool
+        ):
+            spool_id = (
+                self.context.job.job_name
+                if self.context.job
+                else f"{self.blocks[0].string_id}-to-{self.tail.string_id}"
+            )
+            scope = [spool_id]
+            if self.context.stream_partition is not None:
+                scope.append(f"partition-{self.context.stream_partition.partition}")
+            self._spool = Spool(
+                self.context.project.dirs.run("spool", *scope, make_dirs=False),
+            )
+        return self._spool
+
+    def _prepare_spool(self) -> None:
+        """Replay the spooled extractor output, or start spooling it.
+
+        When resuming from a complete spool, the extractor is replaced by a
+        block replaying its spooled output, starting after the last state
+        acknowledged by the loader. Otherwise the extractor runs and its output
+        is spooled.
+        """
+        if self.context.resume_from_spool:
+            if self.spool.complete:
+                self.pipeline[0] = SpoolReplayBlock(
+                    self.spool,
+                    self.blocks[0].string_id,
+                    line_length_limit=(
+                        self.context.project.settings.get("elt.buffer_size") // 2
+                    ),
+                )
+                self._replaying = True
+                return
+
+            logger.warning(
+                "No complete spooled output to resume from, running the extractor",
+                extractor=self.blocks[0].string_id,
+            )
+
+        self._spool_writer = self.spool.writer()
+
+    @property
+    def spooling(self) -> bool:
+        """Whether the output of the extractor is being spooled.
+
+        Returns:
+            True if the extractor output is being spooled, False otherwise.
+        """
+        return self._spool_writer is not None
+
+    async def spool_remaining_output(self) -> None:
+        """Spool the output of the extractor left once downstream blocks stopped.
+
+        Forwarding output stops once the next block's stdin is closed. Output
+        forwarded until then was already spooled, since the spool is linked
+        before the next block. In the `chunked` forwarding mode, the start of a
+        line read but not forwarded yet is spooled before the rest of the output.
+        """
+        stdout_future = self.head.proxy_stdout()
+        await asyncio.wait([stdout_future])
+        partial_line = (
+            stdout_future.result() or b""
+            if not stdout_future.cancelled() and not stdout_future.exception()
+            else b""
+        )
+        await capture_subprocess_output_chunked(
+            self.head.process_handle.stdout,
+            self._spool_writer,
+            line_length_limit=self.context.project.settings.get("elt.buffer_size") // 2,
+            partial_line=partial_line,
+        )
+
+    def close_spool(self, *, complete: bool) -> None:
+        """Stop spooling the output of the extractor.
+
+        Args:
+            complete: Whether the extractor completed successfully, so its
+                spooled output can be replayed.
+        """
+        if self._spool_writer is not None:
+            self._spool_writer.close(complete=complete)
+            self._spool_writer = None
 
     async def run(self) -> None:
         """Run the ELT task."""
@@ -538,10 +776,85 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
             )
             raise RunnerError(msg)
 
+        await self._execute_with_job()
+
+    async def _execute_with_job(self) -> None:
         with closing(self.context.session) as session:
-            async with job.run(session):
+            async with self.context.job.run(session):
                 await self.execute()
 
+    async def _execute_partitions(self) -> None:
+        """Run this set and the sets of the other stream partitions concurrently.
+
+        Every partition tracks its own job under the same state ID, and writes
+        its state as partial state, so partitions don't overwrite each other's
+        bookmarks. Once all partitions succeeded, their states are merged onto
+        the state stored before the run, which keeps the state of streams none
+        of them extracted, and written as the state of the whole set.
+
+        Raises:
+            BaseException: the first error raised by any of the partitions.
+        """
+        logger.info(
+            "Extracting streams in partitions",
+            partitions=len(self.partitions) + 1,
+        )
+        # Read before the partitions write their partial state
+        stored_state = self._stored_singer_state()
+        results = await asyncio.gather(
+            self._execute_blocks(),
+            *(
+                partition._execute_with_job()
+                if partition.context.job
+                else partition.execute()
+                for partition in self.partitions
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        self._merge_partition_states(stored_state)
+
+    def _stored_singer_state(self) -> dict:
+        # A full refresh ignores the stored state, and the merged state is then
+        # written as partial state, so other streams keep theirs anyway
+        if not self.context.job or not self.has_state() or self.context.full_refresh:
+            return {}
+        return self.state_service.get_state(self.context.job.job_name).get(
+            SINGER_STATE_KEY,
+            {},
+        )
+
+    def _merge_partition_states(self, stored_state: dict) -> None:
+        if not self.context.job or not self.has_state():
+            return
+
+        merged_state: dict = {}
+        for partition in (self, *self.partitions):
+            if partition_state := partition.context.job.payload.get(SINGER_STATE_KEY):
+                merge(copy.deepcopy(partition_state), merged_state)
+
+        if not merged_state:
+            return
+        merged_state = merge(merged_state, copy.deepcopy(stored_state))
+
+        payload_flags = (
+            Payload.INCOMPLETE_STATE
+            if self.context.should_merge_states()
+            else Payload.STATE
+        )
+        self.state_service.update_state_store(
+            self.context.job.job_name,
+            {SINGER_STATE_KEY: merged_state},
+            payload_flags,
+        )
+        logger.info(
+            "Merged incremental state of all stream partitions",
+            state_id=self.context.job.job_name,
+        )
+
     async def terminate(self, *, graceful: bool = False) -> None:
         """Terminate an in flight ExtractLoad execution.
 
@@ -554,7 +867,12 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
             graceful=graceful,
             block_count=len(self.blocks),
         )
-        await asyncio.gather(*(block.stop(kill=not graceful) for block in self.blocks))
+        # The extractor is not running if its spooled output is replayed instead
+        blocks = [*self.blocks, self.head] if self._replaying else self.blocks
+        await asyncio.gather(
+            *(block.stop(kill=not graceful) for block in blocks),
+            *(partition.terminate(graceful=graceful) for partition in self.partitions),
+        )
 
     @property
     def process_futures(self) -> list[asyncio.Task]:
@@ -564,7 +882,7 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
             The list of all process futures.
         """
         if self._process_futures is None:
-            self._process_futures = [block.process_future for block in self.blocks]
+            self._process_futures = [block.process_future for block in self.pipeline]
         return self._process_futures
 
     @property
@@ -575,7 +893,7 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
             The list of all stdout futures.
         """
         if self._stdout_futures is None:
-            self._stdout_futures = [block.proxy_stdout() for block in self.blocks]
+            self._stdout_futures = [block.proxy_stdout() for block in self.pipeline]
         return self._stdout_futures
 
     @property
@@ -586,9 +904,33 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
             The list of all stderr futures.
         """
         if self._stderr_futures is None:
-            self._stderr_futures = [block.proxy_stderr() for block in self.blocks]
+            self._stderr_futures = [block.proxy_stderr() for block in self.pipeline]
         return self._stderr_futures
 
+    @property
+    def pipeline(self) -> list[IOBlock]:
+        """Obtain the chain of blocks output flows through.
+
+        Several loaders at the end of the set are combined into a `TeeBlock`,
+        which copies the output of the last producer to each of them.
+
+        Returns:
+            The blocks in the block set, with fanned out loaders combined.
+        """
+        if self._pipeline is None:
+            consumers = list(
+                takewhile(lambda block: not block.producer, reversed(self.blocks)),
+            )
+            if len(consumers) > 1:
+                tee = TeeBlock(
+                    consumers[::-1],
+                    buffer_size=self.context.project.settings.get("elt.buffer_size"),
+                )
+                self._pipeline = [*self.blocks[: -len(consumers)], tee]
+            else:
+                self._pipeline = list(self.blocks)
+        return self._pipeline
+
     @property
     def head(self) -> IOBlock:
         """Obtain the first block in the block set.
@@ -596,16 +938,17 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         Returns:
             The first block in the block set.
         """
-        return self.blocks[0]
+        return self.pipeline[0]
 
     @property
     def tail(self) -> IOBlock:
         """Obtain the last block in the block set.
 
         Returns:
-            The last block in the block set.
+            The last block in the block set, a `TeeBlock` if output is fanned out
+            to several loaders.
         """
-        return self.blocks[-1]
+        return self.pipeline[-1]
 
     @property
     def intermediate(self) -> tuple[IOBlock]:
@@ -614,7 +957,7 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         Returns:
             The intermediate blocks in the block set.
         """  # noqa: E501
-        return self.blocks[1:-1]
+        return self.pipeline[1:-1]
 
     @asynccontextmanager
     async def _start_blocks(self) -> AsyncIterator[None]:
@@ -624,17 +967,85 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
             None
         """
         try:
-            for block in self.blocks:
+            if self.forwarding_mode == ForwardingMode.direct:
+                self._pipe_blocks()
+            for block in self.pipeline:
                 await block.pre(self.context)
                 await block.start()
+            if self.context.project.settings.get("elt.resource_sampling"):
+                self._start_resource_samplers()
             yield
         finally:
             await self._cleanup()
 
-    async def _cleanup(self) -> None:
+    def _start_resource_samplers(self) -> None:
+        """Sample the resources used by the process of every plugin."""
+        interval = self.context.project.settings.get("elt.resource_sampling_interval")
         for block in self.blocks:
+            if self._replaying and block is self.blocks[0]:
+                # The extractor is not invoked, its spooled output is replayed
+                continue
+            sampler = ResourceSampler(
+                block.string_id,
+                block.process_handle.pid,
+                interval=interval,
+            )
+            sampler.start()
+            self._resource_samplers.append(sampler)
+
+    async def _stop_resource_samplers(self) -> None:
+        """Log the resources used by every plugin, and record them in the job."""
+        resources = {}
+        for sampler in self._resource_samplers:
+            resources[sampler.string_id] = summary = await sampler.stop()
+            logger.info("Plugin resource usage", block=sampler.string_id, **summary)
+
+        if resources and self.context.job:
+            self.context.job.payload[RESOURCES_KEY] = resources
+
+    async def _cleanup(self) -> None:
+        await self._stop_resource_samplers()
+        for metrics in self._stream_metrics:
+            metrics.log_summary()
+        for block in self.pipeline:
             await block.post()
 
+    @property
+    def forwarding_mode(self) -> ForwardingMode:
+        """How output is forwarded between the blocks in the set.
+
+        Returns:
+            The forwarding mode configured by the `elt.forwarding_mode` setting.
+        """
+        return ForwardingMode(self.context.project.settings.get("elt.forwarding_mode"))
+
+    def _pipe_blocks(self) -> None:
+        """Connect every producer directly to the stdin of the next block.
+
+        In this mode Singer messages never go through Meltano. State is still
+        captured from the output of the last block (the loader).
+        """
+        for idx, block in enumerate(self.pipeline[:-1]):
+            if self._piped(idx):
+                block.pipe_to(self.pipeline[idx + 1])
+
+    def _piped(self, index: int) -> bool:
+        """Whether the output of a block is piped directly to the next block.
+
+        Args:
+            index: The index of the block in the pipeline.
+
+        Returns:
+            True if the output of the block doesn't go through Meltano.
+        """
+        if self.forwarding_mode != ForwardingMode.direct:
+            return False
+        # Spooled extractor output and output fanned out to several loaders
+        # still go through Meltano
+        if index == 0 and self.spool:
+            return False
+        return isinstance(self.pipeline[index + 1], SingerBlock)
+
     async def _link_io(self) -> None:
         """Link the blocks in the set together.
 
@@ -644,7 +1055,10 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
         Raises:
             BlockSetValidationError: if consumer does not have an upstream producer.
         """
-        for idx, block in enumerate(self.blocks):
+        for block in self.blocks:
+            if self._replaying and block is self.blocks[0]:
+                # The extractor is not invoked, its spooled output is replayed
+                continue
             context = {
                 "consumer": block.consumer,
                 "producer": block.producer,
@@ -669,9 +1083,19 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
                     log_parser=block.invoker.get_log_parser(),
                 ),
             )
-            if block.consumer and block.stdin is not None:
-                if idx != 0 and self.blocks[idx - 1].producer:
-                    self.blocks[idx - 1].stdout_link(
+
+        if self.spool:
+            self._link_spool()
+
+        if self.context.project.settings.get("elt.stream_metrics"):
+            self._link_stream_metrics()
+
+        for idx, block in enumerate(self.pipeline):
+            if isinstance(block, TeeBlock):
+                block.link_upstream(self.pipeline[idx - 1])
+            elif block.consumer and block.stdin is not None:
+                if idx != 0 and self.pipeline[idx - 1].producer:
+                    self.pipeline[idx - 1].stdout_link(
                         block.stdin,
                     )  # link previous blocks stdout with current blocks stdin
                 else:
@@ -679,6 +1103,30 @@ class ExtractLoadBlocks(BlockSet[SingerBlock]):
                         "run step requires input but has no upstream",  # noqa: EM101
                     )
 
+    def _link_stream_metrics(self) -> None:
+        """Count the messages output by every producer, per stream."""
+        interval = self.context.project.settings.get("elt.stream_metrics_interval")
+        for idx, block in enumerate(self.pipeline):
+            if block.producer and not self._piped(idx):
+                metrics = StreamMetrics(block.string_id, interval=interval)
+                block.stdout_link(metrics)
+                self._stream_metrics.append(metrics)
+
+    def _link_spool(self) -> None:
+        """Spool the output of the extractor, and track the state acknowledged."""
+        if self._spool_writer is not None:
+            self.head.stdout_link(self._spool_writer)
+
+        loaders = self.tail.blocks if isinstance(self.tail, TeeBlock) else [self.tail]
+        acknowledgements = SpoolAcknowledgements(
+            self.spool,
+            len(loaders),
+            resume=self._replaying,
+        )
+        self.head.stdout_link(acknowledgements)
+        for index, loader in enumerate(loaders):
+            loader.stdout_link(acknowledgements.consumer(index))
+
 
 class ELBExecutionManager:
     """Execution manager for ExtractLoadBlock sets."""
@@ -719,14 +1167,26 @@ class ELBExecutionManager:
         producer = self.elb.head
         consumer = self.elb.tail
 
-        if self.elb.upstream_complete(len(self.elb.blocks) - 1):
+        if self.elb.upstream_complete(len(self.elb.pipeline) - 1):
             self._producer_code = producer.process_future.result()
+            await self._close_spool()
+        elif self.elb.spooling:
+            # Let the extractor complete so the rest of its output is spooled,
+            # and can be replayed into a new loader without extracting it again.
+            logger.warning(
+                "Loader failed, spooling the remaining output of the extractor",
+            )
+            for block in reversed(self.elb.intermediate):
+                await block.stop()
+            await self.elb.spool_remaining_output()
+            self._producer_code = await producer.process_future
+            await self._close_spool()
         else:
             # If the last consumer (target) completes before the upstream
             # producers, it failed before processing all output. So we should
             # kill the upstream producers and cancel output processing since
             # there's no final destination to forward output to.
-            await self.elb.upstream_stop(len(self.elb.blocks) - 1)
+            await self.elb.upstream_stop(len(self.elb.pipeline) - 1)
             # Pretend the producer (tap) finished successfully since it didn't
             # itself fail
             self._producer_code = 0
@@ -749,8 +1209,8 @@ class ELBExecutionManager:
             RunnerError: if any intermediate blocks failed.
             exception: if any of the output futures encountered an exception.
         """
-        start_idx = self.elb.blocks.index(current_head)
-        remaining_blocks = self.elb.blocks[start_idx:]
+        start_idx = self.elb.pipeline.index(current_head)
+        remaining_blocks = self.elb.pipeline[start_idx:]
 
         if remaining_blocks is None or current_head == self.elb.tail:
             return
@@ -817,7 +1277,7 @@ class ELBExecutionManager:
         current_head: IOBlock,
         start_idx: int,
     ) -> None:
-        next_head: IOBlock = self.elb.blocks[start_idx + 1]
+        next_head: IOBlock = self.elb.pipeline[start_idx + 1]
 
         if current_head is self.elb.head:
             self._producer_code = current_head.process_future.result()
@@ -827,6 +1287,8 @@ class ELBExecutionManager:
             )
 
         await asyncio.wait([current_head.proxy_stdout(), current_head.proxy_stderr()])
+        if current_head is self.elb.head:
+            await self._close_spool()
         # Close next inline stdin so downstream can cascade and complete naturally
         await next_head.close_stdin()
 
@@ -842,13 +1304,23 @@ class ELBExecutionManager:
 
         await self._wait_for_process_completion(next_head)
 
+    async def _close_spool(self) -> None:
+        """Close the spool once all of the extractor's output was spooled."""
+        producer = self.elb.head
+        await asyncio.wait([producer.proxy_stdout()])
+        self.elb.close_spool(
+            complete=not self._producer_code
+            and not producer.proxy_stdout().cancelled()
+            and not producer.proxy_stdout().exception(),
+        )
+
     async def _stop_all_blocks(self, idx: int = 0) -> None:
         """Close stdin and stop all blocks inclusive of index.
 
         Args:
             idx: starting index of the block's to stop.
         """
-        for block in self.elb.blocks[idx:]:
+        for block in self.elb.pipeline[idx:]:
             await block.close_stdin()
             await block.stop()
 
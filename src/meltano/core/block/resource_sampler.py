@@ -0,0 +1,147 @@
+"""Sample the resources used by the processes of a block."""
+
+from __future__ import annotations
+
+import asyncio
+import typing as t
+from contextlib import suppress
+
+import psutil
+
+# Key of the resource usage of the blocks in the payload of a job
+RESOURCES_KEY = "resources"
+
+
+class ResourceSampler:
+    """Periodically sample the CPU, memory and IO of a process and its children.
+
+    Every sample covers the whole process tree, since plugins are often invoked
+    through wrappers spawning the actual plugin process. CPU usage and resident
+    memory are summed over the tree, while bytes read and written are totals
+    over every process seen, including ones that exited since.
+    """
+
+    def __init__(self, string_id: str, pid: int, *, interval: float):
+        """Initialize a `ResourceSampler`.
+
+        Args:
+            string_id: The string identifier of the block the process belongs to.
+            pid: The ID of the root process of the block.
+            interval: Number of seconds between samples.
+        """
+        self.string_id = string_id
+        self.pid = pid
+        self.interval = interval
+
+        self.samples = 0
+        self.cpu_percent_peak = 0.0
+        self.rss_bytes_peak = 0
+
+        self._cpu_percent_total = 0.0
+        self._rss_bytes_total = 0
+        self._processes: dict[int, psutil.Process] = {}
+        # Latest IO counters of every process seen, by PID
+        self._io: dict[int, tuple[int, int]] = {}
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling in the background, until the process exits."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> dict[str, t.Any]:
+        """Stop sampling.
+
+        Returns:
+            The summary of the resources used by the process tree.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        return self.summary()
+
+    async def _run(self) -> None:
+        while True:
+            if not await asyncio.to_thread(self.sample):
+                return
+            await asyncio.sleep(self.interval)
+
+    def _process_tree(self) -> list[psutil.Process]:
+        root = self._processes.get(self.pid)
+        if root is None:
+            root = self._processes[self.pid] = psutil.Process(self.pid)
+
+        tree = [root]
+        with suppress(psutil.Error):
+            # Reuse the process objects, CPU usage is measured between calls
+            tree.extend(
+                self._processes.get(child.pid, child)
+                for child in root.children(recursive=True)
+            )
+        self._processes = {process.pid: process for process in tree}
+        return tree
+
+    def sample(self) -> bool:
+        """Sample the resources currently used by the process tree.
+
+        Returns:
+            False once the process exited, True otherwise.
+        """
+        try:
+            tree = self._process_tree()
+        except psutil.Error:
+            return False
+
+        usage = [self._sample_process(process) for process in tree]
+        if tree[0].pid not in self._processes:
+            return False
+
+        cpu_percent = sum(cpu for cpu, _ in usage)
+        rss_bytes = sum(rss for _, rss in usage)
+
+        self.samples += 1
+        self._cpu_percent_total += cpu_percent
+        self._rss_bytes_total += rss_bytes
+        self.cpu_percent_peak = max(self.cpu_percent_peak, cpu_percent)
+        self.rss_bytes_peak = max(self.rss_bytes_peak, rss_bytes)
+        return True
+
+    def _sample_process(self, process: psutil.Process) -> tuple[float, int]:
+        try:
+            with process.oneshot():
+                cpu_percent = process.cpu_percent()
+                rss_bytes = process.memory_info().rss
+                self._sample_io(process)
+        except psutil.NoSuchProcess:
+            # Exited since the tree was listed, its last IO counters are kept
+            self._processes.pop(process.pid, None)
+        except psutil.Error:
+            pass
+        else:
+            return cpu_percent, rss_bytes
+        return 0.0, 0
+
+    def _sample_io(self, process: psutil.Process) -> None:
+        # IO counters are not available on every platform, e.g. macOS
+        with suppress(AttributeError, psutil.AccessDenied):
+            io = process.io_counters()
+            self._io[process.pid] = (io.read_bytes, io.write_bytes)
+
+    def summary(self) -> dict[str, t.Any]:
+        """Summarize the resources used by the process tree.
+
+        Returns:
+            The peak and average CPU usage and resident memory, and the bytes
+            read and written by the process tree.
+        """
+        samples = max(self.samples, 1)
+        return {
+            "samples": self.samples,
+            "cpu_percent_peak": round(self.cpu_percent_peak, 1),
+            "cpu_percent_avg": round(self._cpu_percent_total / samples, 1),
+            "rss_bytes_peak": self.rss_bytes_peak,
+            "rss_bytes_avg": self._rss_bytes_total // samples,
+            "read_bytes": sum(read for read, _ in self._io.values()),
+            "write_bytes": sum(write for _, write in self._io.values()),
+        }
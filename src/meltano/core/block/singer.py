@@ -4,14 +4,25 @@ from __future__ import annotations
 
 import asyncio
 import asyncio.subprocess
+import enum
+import os
+import sys
 import typing as t
 from contextlib import suppress
 
 from meltano.core.block.ioblock import IOBlock
-from meltano.core.logging import capture_subprocess_output
+from meltano.core.logging import (
+    capture_subprocess_output,
+    capture_subprocess_output_chunked,
+)
 from meltano.core.plugin import PluginType
 from meltano.core.runner import RunnerError
 
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    from backports.strenum import StrEnum
+
 if t.TYPE_CHECKING:
     from asyncio.subprocess import Process
     from collections.abc import Sequence
@@ -25,6 +36,14 @@ PRODUCERS = (PluginType.EXTRACTORS, PluginType.MAPPERS)
 CONSUMERS = (PluginType.LOADERS, PluginType.MAPPERS)
 
 
+class ForwardingMode(StrEnum):
+    """How producer output is forwarded to downstream blocks."""
+
+    line = enum.auto()
+    chunked = enum.auto()
+    direct = enum.auto()
+
+
 class IOLinkError(Exception):
     """Raised when an IO link is not possible."""
 
@@ -290,6 +309,10 @@ class SingerBlock(InvokerBase, IOBlock):
         )
         self.plugin_args = plugin_args
 
+        # Pipe ends to hand over to the underlying process in `direct` mode
+        self._stdin_fd: int | None = None
+        self._stdout_fd: int | None = None
+
     @property
     def producer(self) -> bool:
         """Whether this plugin is a producer.
@@ -321,6 +344,71 @@ class SingerBlock(InvokerBase, IOBlock):
         """
         return "state" in self.invoker.capabilities
 
+    @property
+    def forwarding_mode(self) -> ForwardingMode:
+        """How stdout of this block is forwarded to the linked destinations.
+
+        Returns:
+            The forwarding mode configured by the `elt.forwarding_mode` setting.
+        """
+        return ForwardingMode(self.project.settings.get("elt.forwarding_mode"))
+
+    def proxy_stdout(self) -> asyncio.Task:
+        """Start proxying stdout to the linked stdout destinations.
+
+        Producers forward their output in chunks of complete lines when the
+        `chunked` forwarding mode is enabled.
+
+        Returns:
+            The stdout proxy future.
+        """
+        if (
+            self._stdout_future is None
+            and self.producer
+            and self.forwarding_mode == ForwardingMode.chunked
+        ):
+            outputs = self._merge_outputs(self.invoker.StdioSource.STDOUT, self.outputs)
+            line_length_limit = self.project.settings.get("elt.buffer_size") // 2
+            self._stdout_future = asyncio.ensure_future(
+                capture_subprocess_output_chunked(
+                    self.process_handle.stdout,
+                    *outputs,
+                    line_length_limit=line_length_limit,
+                ),
+            )
+        return super().proxy_stdout()
+
+    def pipe_to(self, consumer: SingerBlock) -> None:
+        """Connect stdout of this block directly to stdin of a consumer block.
+
+        The link is an OS-level pipe between both processes, so the output of
+        this block never goes through Meltano. Must be called before either
+        block is started.
+
+        Args:
+            consumer: The block that should consume the output of this block.
+
+        Raises:
+            IOLinkError: If the blocks can not be linked.
+        """
+        if not self.producer or not consumer.consumer:
+            raise IOLinkError(  # noqa: TRY003
+                f"Cannot pipe {self.string_id} to {consumer.string_id}",  # noqa: EM102
+            )
+        if self._process_handle is not None or consumer._process_handle is not None:
+            raise IOLinkError("Blocks must be piped before they are started")  # noqa: EM101, TRY003
+
+        read_fd, write_fd = os.pipe()
+        self._stdout_fd = write_fd
+        consumer._stdin_fd = read_fd
+
+    def _close_pipe_fds(self) -> None:
+        """Close our copies of the pipe ends handed over to the process."""
+        for fd in (self._stdin_fd, self._stdout_fd):
+            if fd is not None:
+                os.close(fd)
+        self._stdin_fd = self._stdout_fd = None
+
     async def start(self) -> None:
         """Start the SingerBlock by invoking the underlying plugin.
 
@@ -331,15 +419,23 @@ class SingerBlock(InvokerBase, IOBlock):
         line_length_limit = stream_buffer_size // 2
 
         stdin = asyncio.subprocess.PIPE if self.consumer else None
+        if self._stdin_fd is not None:
+            stdin = self._stdin_fd
+        stdout = (
+            self._stdout_fd if self._stdout_fd is not None else asyncio.subprocess.PIPE
+        )
         try:
             self._process_handle = await self.invoker.invoke_async(
                 limit=line_length_limit,
                 stdin=stdin,  # Singer messages
-                stdout=asyncio.subprocess.PIPE,  # Singer state
+                stdout=stdout,  # Singer state
                 stderr=asyncio.subprocess.PIPE,  # Log
             )
         except Exception as err:
             raise RunnerError(f"Cannot start plugin {self.string_id}: {err}") from err  # noqa: EM102, TRY003
+        finally:
+            # The process holds its own copies of the pipe ends
+            self._close_pipe_fds()
 
     async def stop(self, *, kill: bool = True) -> None:
         """Stop (kill) the underlying process and cancel output proxying.
@@ -365,3 +461,9 @@ class SingerBlock(InvokerBase, IOBlock):
         with suppress(FileNotFoundError):
             # the invoker prepared context manager was able to clean up the configs
             await self.invoker.cleanup()
+
+    async def post(self) -> None:
+        """Post triggers resetting the underlying plugin config."""
+        # Release pipe ends of a block that was never started
+        self._close_pipe_fds()
+        await super().post()
@@ -0,0 +1,446 @@
+"""Spool the output of an extractor to disk, so it can be replayed into a loader."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import shutil
+import typing as t
+from contextlib import suppress
+
+import structlog
+
+from meltano.core.block.ioblock import IOBlock
+from meltano.core.block.tee import StateAcknowledgements
+from meltano.core.logging import capture_subprocess_output_chunked
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from meltano.core.logging.utils import SubprocessOutputWriter
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# Amount of uncompressed output written to a single spool segment
+SPOOL_SEGMENT_SIZE = 64 * 1024 * 1024  # 64 MiB
+
+# Favor throughput over size, spooling must keep up with the extractor
+SPOOL_COMPRESS_LEVEL = 1
+
+# Messages that are not replayed from output the loader already acknowledged
+_ACKNOWLEDGED_MESSAGE_TYPES = frozenset(("RECORD", "BATCH", "STATE"))
+
+
+def _message_type(line: bytes) -> str | None:
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return None
+    return message.get("type") if isinstance(message, dict) else None
+
+
+class Spool:
+    """A directory of compressed segments holding the output of an extractor.
+
+    Besides the output itself, the spool records whether the extractor completed
+    and the position of the last state acknowledged by the loader, i.e. the
+    number of state messages up to and including it.
+    """
+
+    def __init__(self, directory: Path, *, segment_size: int = SPOOL_SEGMENT_SIZE):
+        """Initialize a `Spool`.
+
+        Args:
+            directory: The directory to hold the spool.
+            segment_size: Amount of uncompressed output written to one segment.
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+
+    @property
+    def segments(self) -> list[Path]:
+        """The segment files of the spool, in order.
+
+        Returns:
+            The paths of the segment files.
+        """
+        return sorted(self.directory.glob("segment-*.jsonl.gz"))
+
+    @property
+    def complete(self) -> bool:
+        """Whether the spool holds the complete output of a successful extractor.
+
+        Returns:
+            True if the spool is complete, False otherwise.
+        """
+        return self.directory.joinpath("complete").exists()
+
+    @property
+    def acknowledged(self) -> int:
+        """The position of the last state acknowledged by the loader.
+
+        Returns:
+            The number of state messages up to the acknowledged state, or 0.
+        """
+        try:
+            acknowledged = json.loads(
+                self.directory.joinpath("acknowledged.json").read_text(),
+            )
+        except (FileNotFoundError, ValueError):
+            return 0
+        return acknowledged["sequence"]
+
+    def acknowledge(self, sequence: int) -> None:
+        """Record the position of the last state acknowledged by the loader.
+
+        Args:
+            sequence: The number of state messages up to the acknowledged state.
+        """
+        path = self.directory.joinpath("acknowledged.json")
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"sequence": sequence}))
+        tmp_path.replace(path)
+
+    def writer(self) -> SpoolWriter:
+        """Start a new spool, replacing the output spooled by an earlier run.
+
+        Returns:
+            A writer to spool output to.
+        """
+        self.remove()
+        self.directory.mkdir(parents=True)
+        return SpoolWriter(self)
+
+    def reader(self) -> SpoolReader:
+        """Read the output of the spool the loader didn't acknowledge yet.
+
+        Returns:
+            A reader of the spooled output.
+        """
+        return SpoolReader(self)
+
+    def remove(self) -> None:
+        """Remove the spool."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class SpoolWriter:
+    """Write output lines to the compressed segments of a spool."""
+
+    def __init__(self, spool: Spool):
+        """Initialize a `SpoolWriter`.
+
+        Args:
+            spool: The spool to write to.
+        """
+        self.spool = spool
+
+        self._segment: gzip.GzipFile | None = None
+        self._segment_count = 0
+        self._segment_written = 0
+
+    def writeline(self, line: str) -> None:
+        """Write a line to the current segment, starting a new one once it's full.
+
+        Args:
+            line: The output line to spool.
+        """
+        if (segment := self._segment) is None:
+            path = self.spool.directory.joinpath(
+                f"segment-{self._segment_count:06d}.jsonl.gz",
+            )
+            segment = self._segment = gzip.open(  # noqa: SIM115
+                path,
+                "wb",
+                compresslevel=SPOOL_COMPRESS_LEVEL,
+            )
+            self._segment_count += 1
+            self._segment_written = 0
+
+        data = line.encode()
+        segment.write(data)
+        self._segment_written += len(data)
+        if self._segment_written >= self.spool.segment_size and data.endswith(b"\n"):
+            self._close_segment()
+
+    def _close_segment(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def close(self, *, complete: bool) -> None:
+        """Close the spool.
+
+        Args:
+            complete: Whether the extractor completed successfully, so the spool
+                holds all of its output and can be replayed.
+        """
+        self._close_segment()
+        if complete:
+            self.spool.directory.joinpath("complete").touch()
+
+
+class SpoolReader:
+    """Read the output of a spool, resuming after the acknowledged state.
+
+    Record, batch and state messages up to the acknowledged state are skipped,
+    while other messages like schemas are still read, since the loader needs
+    them to process the remaining records. Implements the subset of the
+    `asyncio.StreamReader` interface used by `capture_subprocess_output_chunked`.
+    """
+
+    def __init__(self, spool: Spool):
+        """Initialize a `SpoolReader`.
+
+        Args:
+            spool: The spool to read.
+        """
+        self._segments = spool.segments
+        self._states_to_skip = spool.acknowledged
+        self._segment: gzip.GzipFile | None = None
+        self._eof = False
+
+    def at_eof(self) -> bool:
+        """Whether all of the spool was read.
+
+        Returns:
+            True if all of the spool was read, False otherwise.
+        """
+        return self._eof
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read up to `n` bytes of spooled output.
+
+        Args:
+            n: Maximum number of bytes to read, or -1 to read a whole segment.
+
+        Returns:
+            The output read, or an empty bytes object once all of it was read.
+        """
+        return await asyncio.to_thread(self._read, n)
+
+    def _read(self, n: int) -> bytes:
+        while not self._eof:
+            if (segment := self._segment) is None:
+                if not self._segments:
+                    self._eof = True
+                    break
+                segment = self._segment = gzip.open(self._segments.pop(0), "rb")  # noqa: SIM115
+
+            if self._states_to_skip:
+                if data := self._read_acknowledged(segment, n):
+                    return data
+                if self._states_to_skip:
+                    # The whole segment was acknowledged
+                    self._close_segment()
+                # Otherwise the rest of the segment is read as is
+                continue
+
+            if data := segment.read(n):
+                return data
+            self._close_segment()
+        return b""
+
+    def _close_segment(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def _read_acknowledged(self, segment: gzip.GzipFile, n: int) -> bytes:
+        lines: list[bytes] = []
+        size = 0
+        while self._states_to_skip and (n < 0 or size < n):
+            line = segment.readline()
+            if not line:
+                break
+
+            message_type = _message_type(line)
+            if message_type == "STATE":
+                self._states_to_skip -= 1
+            elif message_type not in _ACKNOWLEDGED_MESSAGE_TYPES:
+                lines.append(line)
+                size += len(line)
+        return b"".join(lines)
+
+
+class SpoolAcknowledgements(StateAcknowledgements):
+    """Record the position in a spool of the state acknowledged by the loaders."""
+
+    def __init__(self, spool: Spool, consumers: int, *, resume: bool = False):
+        """Initialize the `SpoolAcknowledgements`.
+
+        Args:
+            spool: The spool the output is written to or replayed from.
+            consumers: The number of loaders that must acknowledge state.
+            resume: Whether the output is replayed from the spool, starting
+                after the state acknowledged before.
+        """
+        super().__init__(None, consumers, start=spool.acknowledged if resume else 0)
+        self.spool = spool
+
+    def _commit(self, sequence: int) -> None:
+        super()._commit(sequence)
+        self.spool.acknowledge(sequence)
+
+
+class SpoolReplayBlock(IOBlock):
+    """An `IOBlock` producing the output of an extractor replayed from a spool."""
+
+    def __init__(self, spool: Spool, string_id: str, *, line_length_limit: int):
+        """Initialize a `SpoolReplayBlock`.
+
+        Args:
+            spool: The spool to replay.
+            string_id: The string identifier of the extractor that was spooled.
+            line_length_limit: Maximum length of a single spooled message.
+        """
+        self.spool = spool
+        self.line_length_limit = line_length_limit
+        self._string_id = string_id
+
+        self.outputs: list[SubprocessOutputWriter] = []
+
+        self._process_future: asyncio.Task | None = None
+        self._stdout_future: asyncio.Task | None = None
+        self._stderr_future: asyncio.Task | None = None
+
+    @property
+    def stdin(self) -> None:
+        """A replayed extractor has no input."""
+        return
+
+    @property
+    def consumer(self) -> bool:
+        """A replayed extractor is not a consumer.
+
+        Returns:
+            False
+        """
+        return False
+
+    @property
+    def producer(self) -> bool:
+        """A replayed extractor is a producer.
+
+        Returns:
+            True
+        """
+        return True
+
+    @property
+    def string_id(self) -> str:
+        """Return a string identifier for this block.
+
+        Returns:
+            The string identifier of the spooled extractor.
+        """
+        return self._string_id
+
+    @property
+    def has_state(self) -> bool:
+        """A replayed extractor has no state of its own.
+
+        Returns:
+            False
+        """
+        return False
+
+    def stdout_link(self, dst: SubprocessOutputWriter) -> None:
+        """Link the replayed output to dst.
+
+        Args:
+            dst: The destination replayed output should be written to.
+        """
+        self.outputs.append(dst)
+
+    def stderr_link(self, dst: SubprocessOutputWriter) -> None:
+        """A replayed extractor doesn't log, so stderr is not linked.
+
+        Args:
+            dst: Unused.
+        """
+
+    async def start(self) -> None:
+        """Start replaying the spool."""
+        logger.info(
+            "Replaying spooled extractor output",
+            extractor=self.string_id,
+            acknowledged_states=self.spool.acknowledged,
+        )
+
+    async def stop(self, *, kill: bool = True) -> None:  # noqa: ARG002
+        """Stop replaying the spool.
+
+        Args:
+            kill: Unused.
+        """
+        if self._stdout_future is not None:
+            self._stdout_future.cancel()
+        if self._process_future is not None:
+            with suppress(asyncio.CancelledError):
+                await self._process_future
+
+    def proxy_stdout(self) -> asyncio.Task:
+        """Start replaying the spool to the linked stdout destinations.
+
+        Returns:
+            The replay future.
+        """
+        if self._stdout_future is None:
+            self._stdout_future = asyncio.ensure_future(
+                capture_subprocess_output_chunked(
+                    self.spool.reader(),  # type: ignore[arg-type]
+                    *self.outputs,
+                    line_length_limit=self.line_length_limit,
+                ),
+            )
+        return self._stdout_future
+
+    def proxy_stderr(self) -> asyncio.Task:
+        """Return a completed future, since there's no stderr to proxy.
+
+        Returns:
+            A future that is already done.
+        """
+        if self._stderr_future is None:
+            self._stderr_future = asyncio.ensure_future(asyncio.sleep(0))
+        return self._stderr_future
+
+    def proxy_io(self) -> tuple[asyncio.Task, asyncio.Task]:
+        """Start replaying the spool.
+
+        Returns:
+            proxy_stdout asyncio.Task and proxy_stderr asyncio.Task
+        """
+        return self.proxy_stdout(), self.proxy_stderr()
+
+    @property
+    def process_future(self) -> asyncio.Task:
+        """Return a future for the completion of the replay.
+
+        Returns:
+            A future resolving to 0 once the spool was replayed, or 1 if the
+            replay failed.
+        """
+        if self._process_future is None:
+            self._process_future = asyncio.ensure_future(self._wait_replay())
+        return self._process_future
+
+    async def _wait_replay(self) -> int:
+        stdout_future = self.proxy_stdout()
+        await asyncio.wait([stdout_future])
+        return 1 if stdout_future.cancelled() or stdout_future.exception() else 0
+
+    async def pre(self, context: object) -> None:
+        """Nothing to prepare for a replay.
+
+        Args:
+            context: Unused.
+        """
+
+    async def post(self) -> None:
+        """Nothing to clean up after a replay."""
+
+    async def close_stdin(self) -> None:
+        """A replayed extractor has no input."""
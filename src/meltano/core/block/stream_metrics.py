@@ -0,0 +1,133 @@
+"""Throughput metrics of the Singer messages output by a block, per stream."""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass
+
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# Singer message types are upper case, unlike JSON schema types like "object",
+# so the first match is the type of the message itself
+_TYPE_PATTERN = re.compile(r'"type"\s*:\s*"([A-Z_]+)"')
+_STREAM_PATTERN = re.compile(r'"stream"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+@dataclass
+class StreamCounts:
+    """Counts of the messages of a single stream."""
+
+    records: int = 0
+    schemas: int = 0
+    batches: int = 0
+    bytes: int = 0
+
+
+class StreamMetrics:
+    """Count the Singer messages output by a block, per stream.
+
+    Messages are classified by scanning for their type and stream rather than
+    decoding them, so counting stays cheap compared to forwarding. The rates of
+    every stream are logged periodically, and totals once the block completed.
+    """
+
+    def __init__(self, string_id: str, *, interval: float):
+        """Initialize `StreamMetrics`.
+
+        Args:
+            string_id: The string identifier of the block producing the output.
+            interval: Number of seconds between reports of the stream rates.
+        """
+        self.string_id = string_id
+        self.interval = interval
+
+        self.streams: dict[str, StreamCounts] = {}
+        self.state_messages = 0
+        self.other_messages = 0
+
+        self._started = time.monotonic()
+        self._last_report = self._started
+        self._last_counts: dict[str, StreamCounts] = {}
+
+    def writeline(self, line: str) -> None:
+        """Count a message output by the block.
+
+        Args:
+            line: The message line.
+        """
+        match = _TYPE_PATTERN.search(line)
+        message_type = match[1] if match else None
+
+        if message_type == "STATE":
+            self.state_messages += 1
+        elif message_type in {"RECORD", "SCHEMA", "BATCH"} and (
+            stream_match := _STREAM_PATTERN.search(line)
+        ):
+            counts = self.streams.get(stream_match[1])
+            if counts is None:
+                counts = self.streams[stream_match[1]] = StreamCounts()
+
+            if message_type == "RECORD":
+                counts.records += 1
+            elif message_type == "SCHEMA":
+                counts.schemas += 1
+            else:
+                counts.batches += 1
+            counts.bytes += len(line)
+        else:
+            self.other_messages += 1
+
+        if (now := time.monotonic()) - self._last_report >= self.interval:
+            self._report(now)
+
+    def _report(self, now: float) -> None:
+        elapsed = now - self._last_report
+        for stream, counts in self.streams.items():
+            last = self._last_counts.get(stream, StreamCounts())
+            if counts.records == last.records and counts.bytes == last.bytes:
+                continue
+            logger.info(
+                "Stream throughput",
+                block=self.string_id,
+                stream=stream,
+                records=counts.records,
+                records_per_second=round((counts.records - last.records) / elapsed),
+                bytes_per_second=round((counts.bytes - last.bytes) / elapsed),
+            )
+            self._last_counts[stream] = StreamCounts(
+                records=counts.records,
+                bytes=counts.bytes,
+            )
+        self._last_report = now
+
+    def log_summary(self) -> None:
+        """Log the totals of every stream, and of the block."""
+        duration = max(time.monotonic() - self._started, 1e-9)
+        for stream, counts in sorted(
+            self.streams.items(),
+            key=lambda item: item[1].bytes,
+            reverse=True,
+        ):
+            logger.info(
+                "Stream metrics summary",
+                block=self.string_id,
+                stream=stream,
+                records=counts.records,
+                schema_messages=counts.schemas,
+                batch_messages=counts.batches,
+                bytes=counts.bytes,
+                records_per_second=round(counts.records / duration),
+            )
+        logger.info(
+            "Block stream metrics summary",
+            block=self.string_id,
+            streams=len(self.streams),
+            records=sum(counts.records for counts in self.streams.values()),
+            bytes=sum(counts.bytes for counts in self.streams.values()),
+            state_messages=self.state_messages,
+            other_messages=self.other_messages,
+            duration_seconds=round(duration, 3),
+        )
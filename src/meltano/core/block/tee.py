@@ -0,0 +1,393 @@
+"""`TeeBlock` copies the output of a producer to several consumers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import typing as t
+
+import structlog
+
+from meltano.core.block.ioblock import IOBlock
+from meltano.core.plugin.singer.target import BookmarkWriter, CoalescingBookmarkWriter
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from meltano.core.block.singer import SingerBlock
+    from meltano.core.logging.utils import SubprocessOutputWriter
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# Separator of the loaders of a tee in `meltano run` invocations
+TEE_DELIMITER = ","
+
+
+def _state_key(state: t.Any) -> str:  # noqa: ANN401
+    return json.dumps(state, sort_keys=True, separators=(",", ":"))
+
+
+class StateAcknowledgements:
+    """Commit state only once every consumer of a tee has emitted it.
+
+    Loaders emit the state messages they receive once the preceding records are
+    stored, but may skip some of them. State emitted by a loader therefore
+    acknowledges that state and every state sent before it. State is committed
+    to the bookmark writer once it has been acknowledged by all loaders.
+    """
+
+    def __init__(
+        self,
+        bookmark_writer: SubprocessOutputWriter | None,
+        consumers: int,
+        *,
+        start: int = 0,
+    ):
+        """Initialize the `StateAcknowledgements`.
+
+        Args:
+            bookmark_writer: The writer to commit acknowledged state to, if any.
+            consumers: The number of consumers that must acknowledge state.
+            start: The sequence number of the last state committed before, when
+                resuming the output of an earlier run.
+        """
+        self.bookmark_writer = bookmark_writer
+
+        self._sent = start
+        self._committed = start
+        self._acknowledged = [start] * consumers
+        # Sequence numbers of the state messages sent, by state
+        self._sequences: dict[str, list[int]] = {}
+        # State lines sent and not committed yet, by sequence number
+        self._states: dict[int, str] = {}
+
+    def writeline(self, line: str) -> None:
+        """Record a state message sent to the consumers.
+
+        Args:
+            line: A Singer message line output by the upstream producer.
+        """
+        # Cheap check to skip decoding most records
+        if '"STATE"' not in line:
+            return
+
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return
+
+        if not isinstance(message, dict) or message.get("type") != "STATE":
+            return
+
+        self._sent += 1
+        state_key = _state_key(message.get("value"))
+        self._sequences.setdefault(state_key, []).append(self._sent)
+        self._states[self._sent] = state_key
+
+    def consumer(self, index: int) -> SubprocessOutputWriter:
+        """Get the writer to link to the state output of a consumer.
+
+        Args:
+            index: The index of the consumer in the tee.
+
+        Returns:
+            A writer acknowledging the state emitted by the consumer.
+        """
+        return _ConsumerAcknowledgements(self, index)
+
+    def acknowledge(self, index: int, line: str) -> None:
+        """Acknowledge state emitted by a consumer, and commit it if possible.
+
+        Args:
+            index: The index of the consumer in the tee.
+            line: The state line emitted by the consumer.
+        """
+        try:
+            state_key = _state_key(json.loads(line))
+        except ValueError:
+            logger.warning("Received state is invalid, ignoring it")
+            return
+
+        acknowledged = self._acknowledged[index]
+        sequence = next(
+            (seq for seq in self._sequences.get(state_key, ()) if seq > acknowledged),
+            None,
+        )
+        if sequence is None:
+            logger.debug("Ignoring state that was not sent to the loader")
+            return
+
+        self._acknowledged[index] = sequence
+        if (committed := min(self._acknowledged)) > self._committed:
+            self._commit(committed)
+
+    def _commit(self, sequence: int) -> None:
+        state_line = self._states[sequence]
+        for seq in range(self._committed + 1, sequence + 1):
+            state_key = self._states.pop(seq)
+            sequences = self._sequences[state_key]
+            sequences.remove(seq)
+            if not sequences:
+                del self._sequences[state_key]
+        self._committed = sequence
+
+        if self.bookmark_writer is not None:
+            self.bookmark_writer.writeline(state_line)
+
+
+class _ConsumerAcknowledgements:
+    def __init__(self, acknowledgements: StateAcknowledgements, index: int):
+        self.acknowledgements = acknowledgements
+        self.index = index
+
+    def writeline(self, line: str) -> None:
+        self.acknowledgements.acknowledge(self.index, line)
+
+
+class TeeBlock(IOBlock):
+    """An `IOBlock` that copies its input to several consumer blocks.
+
+    Every consumer has its own write buffer, so a consumer that is briefly slower
+    than the others doesn't hold them back until its buffer is full. When the
+    consumers track state, it is only committed once all of them acknowledged it.
+    """
+
+    def __init__(self, blocks: Sequence[SingerBlock], *, buffer_size: int):
+        """Initialize a `TeeBlock`.
+
+        Args:
+            blocks: The consumer blocks to copy input to.
+            buffer_size: Size of the write buffer of every consumer, in bytes.
+        """
+        self.blocks = blocks
+        self.buffer_size = buffer_size
+
+        self.state_acknowledgements: StateAcknowledgements | None = None
+
+        self._process_future: asyncio.Task | None = None
+        self._stdout_future: asyncio.Task | None = None
+        self._stderr_future: asyncio.Task | None = None
+
+    @property
+    def stdin(self) -> None:
+        """Input is written to the stdin of every consumer, see `link_upstream`."""
+        return
+
+    @property
+    def consumer(self) -> bool:
+        """A tee is a consumer.
+
+        Returns:
+            True
+        """
+        return True
+
+    @property
+    def producer(self) -> bool:
+        """A tee is not a producer.
+
+        Returns:
+            False
+        """
+        return False
+
+    @property
+    def string_id(self) -> str:
+        """Return a string identifier for this block.
+
+        Returns:
+            The string identifiers of the consumers, separated by commas.
+        """
+        return TEE_DELIMITER.join(block.string_id for block in self.blocks)
+
+    @property
+    def has_state(self) -> bool:
+        """Whether any of the consumers has state.
+
+        Returns:
+            bool indicating whether any consumer has state.
+        """
+        return any(block.has_state for block in self.blocks)
+
+    def link_upstream(self, producer: IOBlock) -> None:
+        """Copy the stdout of a producer to the stdin of every consumer.
+
+        Args:
+            producer: The block whose output should be copied.
+        """
+        if self.state_acknowledgements:
+            # Record state before it can reach the consumers
+            producer.stdout_link(self.state_acknowledgements)
+
+        for block in self.blocks:
+            if (stdin := block.stdin) is None:
+                continue
+            stdin.transport.set_write_buffer_limits(high=self.buffer_size)
+            # Output captures write to `StreamWriter` destinations directly
+            producer.stdout_link(t.cast("SubprocessOutputWriter", stdin))
+
+    def stdout_link(self, dst: SubprocessOutputWriter) -> None:
+        """Link stdout of every consumer to dst.
+
+        Args:
+            dst: The destination stdout output should be written to.
+        """
+        for block in self.blocks:
+            block.stdout_link(dst)
+
+    def stderr_link(self, dst: SubprocessOutputWriter) -> None:
+        """Link stderr of every consumer to dst.
+
+        Args:
+            dst: The destination stderr output should be written to.
+        """
+        for block in self.blocks:
+            block.stderr_link(dst)
+
+    async def start(self) -> None:
+        """Start every consumer, and set up state acknowledgements."""
+        for block in self.blocks:
+            await block.start()
+        self._acknowledge_state()
+
+    def _acknowledge_state(self) -> None:
+        """Route the bookmark writers of the consumers through acknowledgements.
+
+        The bookmark writer of the first consumer tracking state commits the
+        state acknowledged by all consumers. Bookmark writers of the other
+        consumers are discarded.
+        """
+        consumer_handlers = [
+            (block.invoker.output_handlers or {}).get(
+                block.invoker.StdioSource.STDOUT,
+                [],
+            )
+            for block in self.blocks
+        ]
+        bookmark_writer = next(
+            (
+                handler
+                for handlers in consumer_handlers
+                for handler in handlers
+                if isinstance(handler, BookmarkWriter)
+            ),
+            None,
+        )
+        if bookmark_writer is None:
+            return
+
+        self.state_acknowledgements = StateAcknowledgements(
+            bookmark_writer,
+            len(self.blocks),
+        )
+        for index, handlers in enumerate(consumer_handlers):
+            handlers[:] = [
+                handler
+                for handler in handlers
+                if not isinstance(handler, BookmarkWriter)
+            ]
+            handlers.append(self.state_acknowledgements.consumer(index))
+
+    async def stop(self, *, kill: bool = True) -> None:
+        """Stop every consumer.
+
+        Args:
+            kill: whether to send a SIGKILL. If false, a SIGTERM is sent.
+        """
+        await asyncio.gather(*(block.stop(kill=kill) for block in self.blocks))
+
+    def proxy_stdout(self) -> asyncio.Task:
+        """Start proxying stdout of every consumer.
+
+        Returns:
+            A future completing once all consumer stdout proxies completed.
+        """
+        if self._stdout_future is None:
+            self._stdout_future = asyncio.ensure_future(
+                _gather_output(block.proxy_stdout() for block in self.blocks),
+            )
+        return self._stdout_future
+
+    def proxy_stderr(self) -> asyncio.Task:
+        """Start proxying stderr of every consumer.
+
+        Returns:
+            A future completing once all consumer stderr proxies completed.
+        """
+        if self._stderr_future is None:
+            self._stderr_future = asyncio.ensure_future(
+                _gather_output(block.proxy_stderr() for block in self.blocks),
+            )
+        return self._stderr_future
+
+    def proxy_io(self) -> tuple[asyncio.Task, asyncio.Task]:
+        """Start proxying stdout AND stderr of every consumer.
+
+        Returns:
+            proxy_stdout asyncio.Task and proxy_stderr asyncio.Task
+        """
+        return self.proxy_stdout(), self.proxy_stderr()
+
+    @property
+    def process_future(self) -> asyncio.Task:
+        """Return a future for the completion of all consumer processes.
+
+        Returns:
+            A future resolving to the exit code of the first consumer that
+            failed, or 0 if all of them succeeded.
+        """
+        if self._process_future is None:
+            self._process_future = asyncio.ensure_future(self._wait_processes())
+        return self._process_future
+
+    async def _wait_processes(self) -> int:
+        pending = {block.process_future for block in self.blocks}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if failed := next((future for future in done if future.result()), None):
+                # Without all consumers there's nothing left to copy input to
+                for block in self.blocks:
+                    if not block.process_future.done():
+                        await block.stop()
+                return failed.result()
+        return 0
+
+    async def pre(self, context: object) -> None:
+        """Prepare every consumer.
+
+        Args:
+            context: The context with which to update the invokers.
+        """
+        for block in self.blocks:
+            await block.pre(context)
+
+    async def post(self) -> None:
+        """Persist state held back by the bookmark writer, and clean up consumers."""
+        if self.state_acknowledgements and isinstance(
+            bookmark_writer := self.state_acknowledgements.bookmark_writer,
+            CoalescingBookmarkWriter,
+        ):
+            await bookmark_writer.close()
+
+        for block in self.blocks:
+            await block.post()
+
+    async def close_stdin(self) -> None:
+        """Close the stdin of every consumer."""
+        for block in self.blocks:
+            await block.close_stdin()
+
+
+async def _gather_output(futures: t.Iterable[asyncio.Future]) -> None:
+    # Proxies of consumers stopped after another consumer failed get cancelled,
+    # which shouldn't be reported as an output error
+    results = await asyncio.gather(*futures, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(
+            result,
+            asyncio.CancelledError,
+        ):
+            raise result
@@ -0,0 +1,161 @@
+"""Discover the catalogs of many extractors concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+import typing as t
+from dataclasses import dataclass
+from functools import cached_property
+from multiprocessing import cpu_count
+
+import structlog
+
+from meltano.core.plugin_install_service import with_semaphore
+from meltano.core.plugin_invoker import invoker_factory
+from meltano.core.utils import noop
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from sqlalchemy.orm import Session
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.project import Project
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class CatalogDiscoveryResult:
+    """The outcome of discovering the catalog of an extractor.
+
+    plugin: The extractor.
+    duration: Number of seconds it took to get the catalog.
+    error: Why the catalog could not be discovered, if it couldn't.
+    """
+
+    plugin: ProjectPlugin
+    duration: float
+    error: str | None = None
+
+    @property
+    def successful(self) -> bool:
+        """Whether the catalog was discovered.
+
+        Returns:
+            `True` if the catalog was discovered.
+        """
+        return self.error is None
+
+
+class CatalogDiscoveryService:
+    """Discover the catalogs of extractors, to warm up their catalog caches.
+
+    Every catalog ends up in the usual location of the extractor, with the
+    catalog rules applied, just like it would be before the extractor is run.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        session: Session,
+        status_cb: Callable[[CatalogDiscoveryResult], t.Any] = noop,
+        *,
+        parallelism: int | None = None,
+        refresh: bool = False,
+    ):
+        """Initialize a `CatalogDiscoveryService`.
+
+        Args:
+            project: Meltano Project.
+            session: Database session.
+            status_cb: Called with the result of every discovery once it's done.
+            parallelism: Number of extractors to run in discovery mode at once.
+            refresh: Whether to discover the catalog even if a cached one is valid.
+        """
+        self.project = project
+        self.session = session
+        self.status_cb = status_cb
+        self._parallelism = parallelism
+        self.refresh = refresh
+
+    @cached_property
+    def parallelism(self) -> int:
+        """Return the number of extractors to run in discovery mode at once.
+
+        Returns:
+            The number of extractors to run in discovery mode at once.
+        """
+        if self._parallelism is None:
+            return cpu_count()
+        if self._parallelism < 1:
+            return sys.maxsize
+        return self._parallelism
+
+    @cached_property
+    def semaphore(self) -> asyncio.Semaphore:
+        """An asyncio semaphore with a counter starting at `self.parallelism`.
+
+        Returns:
+            An asyncio semaphore with a counter starting at `self.parallelism`.
+        """
+        return asyncio.Semaphore(self.parallelism)
+
+    async def discover_catalogs(
+        self,
+        plugins: Iterable[ProjectPlugin],
+    ) -> list[CatalogDiscoveryResult]:
+        """Discover the catalogs of the provided extractors.
+
+        Args:
+            plugins: The extractors to discover the catalogs of.
+
+        Returns:
+            The result of discovering each catalog, in the order of the plugins.
+        """
+        # Extractors of the same name share their catalog file
+        unique_plugins = {plugin.name: plugin for plugin in plugins}
+        return await asyncio.gather(
+            *(self.discover_catalog(plugin) for plugin in unique_plugins.values()),
+        )
+
+    @with_semaphore
+    async def discover_catalog(self, plugin: ProjectPlugin) -> CatalogDiscoveryResult:
+        """Discover the catalog of an extractor.
+
+        Args:
+            plugin: The extractor.
+
+        Returns:
+            The result of discovering the catalog.
+        """
+        start_time = time.perf_counter()
+        error = None
+        if "discover" not in (plugin.capabilities or []):
+            error = (
+                "the extractor does not support catalog discovery "
+                "(the `discover` capability is not advertised)"
+            )
+        else:
+            invoker = invoker_factory(self.project, plugin)
+            if self.refresh:
+                invoker.settings_service.config_override["_use_cached_catalog"] = False
+
+            logger.debug("Discovering catalog", plugin_name=plugin.name)
+            try:
+                async with invoker.prepared(self.session):
+                    # Getting the catalog discovers it and applies the catalog
+                    # rules, unless a valid one is cached
+                    await invoker.dump("catalog")
+            except Exception as err:  # noqa: BLE001
+                error = str(err) or type(err).__name__
+
+        result = CatalogDiscoveryResult(
+            plugin=plugin,
+            duration=time.perf_counter() - start_time,
+            error=error,
+        )
+        self.status_cb(result)
+        return result
@@ -19,6 +19,7 @@ from .utils import (
     LEVELS,
     LogFormat,
     capture_subprocess_output,
+    capture_subprocess_output_chunked,
     setup_logging,
 )
 
@@ -32,6 +33,7 @@ __all__ = [
     "OutputLogger",
     "SizeThresholdJobLogException",
     "capture_subprocess_output",
+    "capture_subprocess_output_chunked",
     "console_log_formatter",
     "json_formatter",
     "key_value_formatter",
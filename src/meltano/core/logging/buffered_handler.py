@@ -0,0 +1,190 @@
+"""A log handler writing to a file from a dedicated thread."""
+
+from __future__ import annotations
+
+import enum
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+import typing as t
+from contextlib import suppress
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    from backports.strenum import StrEnum
+
+if t.TYPE_CHECKING:
+    StrPath: t.TypeAlias = str | os.PathLike[str]
+
+
+class _Marker(enum.Enum):
+    """Markers queued to the writer thread besides log lines."""
+
+    FLUSH = enum.auto()
+    STOP = enum.auto()
+
+
+class OverflowPolicy(StrEnum):
+    """What happens to log lines emitted while the queue of the writer is full."""
+
+    block = enum.auto()
+    drop = enum.auto()
+
+
+class BufferedFileHandler(logging.Handler):
+    """A `logging.Handler` that appends log lines to a file without blocking.
+
+    Records are formatted by the thread emitting them and queued, and a writer
+    thread started with the first record appends them to the file. The file is
+    flushed every `flush_interval` seconds, on `flush` and on `close`. Once
+    `queue_size` lines are queued, emitting a record either waits for the writer
+    to catch up, or drops the line and counts it, depending on `overflow`.
+    """
+
+    def __init__(
+        self,
+        filename: StrPath,
+        *,
+        queue_size: int,
+        flush_interval: float,
+        overflow: OverflowPolicy = OverflowPolicy.block,
+    ):
+        """Initialize a `BufferedFileHandler`.
+
+        Args:
+            filename: The file to append log lines to.
+            queue_size: Maximum number of lines waiting to be written.
+            flush_interval: Maximum number of seconds between file flushes.
+            overflow: What happens to lines emitted while the queue is full.
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)  # noqa: PTH100
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+
+        self.dropped = 0
+
+        self._queue: queue.Queue[str | _Marker] = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+        self._failed = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a formatted record to be written to the file.
+
+        Args:
+            record: The record to write.
+        """
+        try:
+            line = f"{self.format(record)}\n"
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+            return
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._write,
+                name=f"{type(self).__name__}-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+        if self.overflow == OverflowPolicy.block:
+            self._queue.put(line)
+            return
+
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Wait until all queued lines are written and flushed to the file."""
+        if self._thread is not None:
+            self._queue.put(_Marker.FLUSH)
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write and flush all queued lines, and stop the writer thread."""
+        self.acquire()
+        try:
+            if self._thread is not None:
+                if self.dropped:
+                    self._queue.put(
+                        f"{self.dropped} log lines were dropped because they "
+                        "were emitted faster than they could be written\n",
+                    )
+                self._queue.put(_Marker.STOP)
+                self._thread.join()
+                self._thread = None
+        finally:
+            self.release()
+        super().close()
+
+    def _write(self) -> None:
+        try:
+            file = open(self.baseFilename, "a", encoding="utf-8")  # noqa: PTH123, SIM115
+        except OSError:
+            self._report_failure()
+            file = None
+
+        try:
+            self._consume(file)
+        finally:
+            if file is not None:
+                with suppress(OSError):
+                    file.close()
+
+    def _consume(self, file: t.TextIO | None) -> None:
+        last_flush = time.monotonic()
+        # Without a flush interval, the file is flushed after every line
+        timeout = self.flush_interval or None
+        while True:
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # Nothing was emitted for a while, write out what's buffered
+                self._flush_file(file)
+                last_flush = time.monotonic()
+                continue
+
+            try:
+                if item is _Marker.STOP:
+                    return
+                if item is _Marker.FLUSH:
+                    self._flush_file(file)
+                    last_flush = time.monotonic()
+                else:
+                    self._write_line(file, item)
+                    if time.monotonic() - last_flush >= self.flush_interval:
+                        self._flush_file(file)
+                        last_flush = time.monotonic()
+            finally:
+                self._queue.task_done()
+
+    def _write_line(self, file: t.TextIO | None, line: str) -> None:
+        # Lines are still consumed after a write failed, so emitting never hangs
+        if file is None or self._failed:
+            return
+        try:
+            file.write(line)
+        except OSError:
+            self._report_failure()
+
+    def _flush_file(self, file: t.TextIO | None) -> None:
+        if file is None or self._failed:
+            return
+        try:
+            file.flush()
+        except OSError:
+            self._report_failure()
+
+    def _report_failure(self) -> None:
+        self._failed = True
+        if logging.raiseExceptions and sys.stderr:
+            sys.stderr.write(f"--- Logging error writing to {self.baseFilename} ---\n")
+            traceback.print_exc(file=sys.stderr)
@@ -19,29 +19,70 @@ import structlog
 
 from meltano.core.runner import RunnerError
 
+from .buffered_handler import BufferedFileHandler, OverflowPolicy
 from .formatters import get_default_foreign_pre_chain
 from .parsers import get_parser_factory
 from .renderers import MeltanoConsoleRenderer
 from .utils import capture_subprocess_output
 
+if t.TYPE_CHECKING:
+    from meltano.core.project_settings_service import ProjectSettingsService
+
 StrPath: t.TypeAlias = str | os.PathLike[str]
 
 
 class OutputLogger:
     """Output Logger."""
 
-    def __init__(self, file: StrPath) -> None:
+    def __init__(
+        self,
+        file: StrPath,
+        *,
+        queue_size: int = 0,
+        flush_interval: float = 1,
+        overflow: OverflowPolicy = OverflowPolicy.block,
+    ) -> None:
         """Instantiate an Output Logger.
 
         Args:
             file: A file to output to.
+            queue_size: Maximum number of log lines waiting to be written to the
+                file by a dedicated thread. If 0, lines are written right away.
+            flush_interval: Maximum number of seconds between flushes of the
+                file, when lines are written by a dedicated thread.
+            overflow: What happens to log lines emitted while the queue is full.
         """
         self.file = file
+        self.queue_size = queue_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
         self.stdout = sys.stdout
         self.stderr = sys.stderr
 
         self.outs: dict[str, Out] = {}
 
+    @classmethod
+    def from_settings(
+        cls,
+        file: StrPath,
+        settings: ProjectSettingsService,
+    ) -> OutputLogger:
+        """Instantiate an Output Logger writing to a file as configured.
+
+        Args:
+            file: A file to output to.
+            settings: The project settings configuring how the file is written.
+
+        Returns:
+            An Output Logger configured by the `elt.log_*` settings.
+        """
+        return cls(
+            file,
+            queue_size=settings.get("elt.log_queue_size"),
+            flush_interval=settings.get("elt.log_flush_interval"),
+            overflow=OverflowPolicy(settings.get("elt.log_overflow")),
+        )
+
     def out(
         self,
         name: str,
@@ -185,7 +226,8 @@ class Out:
         """Configure a logging.Handler suitable for redirecting logs too.
 
         Returns:
-            logging.FileHandler using an uncolorized console formatter
+            logging.FileHandler using an uncolorized console formatter, or a
+            BufferedFileHandler if the OutputLogger has a write queue
         """
         formatter = structlog.stdlib.ProcessorFormatter(
             processor=MeltanoConsoleRenderer(
@@ -194,7 +236,16 @@ class Out:
             ),
             foreign_pre_chain=get_default_foreign_pre_chain(),
         )
-        handler = logging.FileHandler(self.file, delay=True)
+        handler: logging.Handler
+        if self.output_logger.queue_size:
+            handler = BufferedFileHandler(
+                self.file,
+                queue_size=self.output_logger.queue_size,
+                flush_interval=self.output_logger.flush_interval,
+                overflow=self.output_logger.overflow,
+            )
+        else:
+            handler = logging.FileHandler(self.file, delay=True)
         handler.setFormatter(formatter)
         return handler
 
@@ -218,7 +269,8 @@ class Out:
             With the side-effect of redirecting logging.
         """
         logger = logging.getLogger()  # noqa: TID251
-        logger.addHandler(self.redirect_log_handler)
+        handler = self.redirect_log_handler
+        logger.addHandler(handler)
         ignored_errors = (
             KeyboardInterrupt,
             asyncio.CancelledError,
@@ -235,7 +287,9 @@ class Out:
             logger.error(str(err), exc_info=True)  # noqa: G201
             raise
         finally:
-            logger.removeHandler(self.redirect_log_handler)
+            logger.removeHandler(handler)
+            # Write out the lines still queued, if any
+            handler.close()
 
     @asynccontextmanager
     async def writer(self):  # noqa: ANN201
@@ -351,3 +351,148 @@ async def capture_subprocess_output(
             if not await _write_line_writer(writer, line):
                 # If the destination stream is closed, we can stop capturing output.
                 return
+
+
+# Read size used by `capture_subprocess_output_chunked`.
+CHUNKED_READ_SIZE = 1024 * 1024  # 1 MiB
+
+# Amount of data buffered in a `StreamWriter` transport before we wait for it to
+# drain in `capture_subprocess_output_chunked`.
+CHUNKED_DRAIN_HIGH_WATER = 4 * 1024 * 1024  # 4 MiB
+
+
+def _raise_line_length_limit_error(
+    consumed: int,
+    *,
+    separator_found: bool = False,
+) -> t.NoReturn:
+    # Mirror `StreamReader.readline`, which raises a `ValueError` whose context
+    # is a `LimitOverrunError`, so the same error handling applies to both modes.
+    message = (
+        "Separator is found, but chunk is longer than limit"
+        if separator_found
+        else "Separator is not found, and chunk exceed the limit"
+    )
+    try:
+        raise asyncio.LimitOverrunError(message, consumed)  # noqa: TRY301
+    except asyncio.LimitOverrunError as err:
+        raise ValueError(err.args[0])  # noqa: B904
+
+
+def _check_line_lengths(
+    data: bytes,
+    end: int,
+    pending_length: int,
+    line_length_limit: int,
+) -> None:
+    # Measure every line completed in `data[:end]`, the first one continuing
+    # the `pending_length` bytes of a partial line from previous reads
+    start = 0
+    length = pending_length
+    while start < end:
+        newline = data.index(b"\n", start)
+        length += newline - start
+        if length > line_length_limit:
+            _raise_line_length_limit_error(length, separator_found=True)
+        start = newline + 1
+        length = 0
+
+
+async def _write_chunk_writer(
+    writer: SubprocessOutputWriter,
+    chunk: bytes,
+    *,
+    high_water: int,
+) -> bool:
+    # StreamWriters like a subprocess's stdin receive the whole chunk at once
+    # and are only drained once enough data has been buffered
+    if isinstance(writer, asyncio.StreamWriter):
+        try:
+            writer.write(chunk)
+            if (
+                writer.is_closing()
+                or writer.transport.get_write_buffer_size() >= high_water
+            ):
+                await writer.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            await writer.wait_closed()
+            return False
+    else:
+        # A newline byte can't be part of a multibyte UTF-8 sequence, so
+        # decoding the whole chunk is equivalent to decoding line by line
+        *lines, rest = chunk.decode(errors="replace").split("\n")
+        for line in lines:
+            writer.writeline(f"{line}\n")
+        if rest:
+            writer.writeline(rest)
+
+    return True
+
+
+async def capture_subprocess_output_chunked(
+    reader: asyncio.StreamReader | None,
+    *line_writers: SubprocessOutputWriter,
+    read_size: int = CHUNKED_READ_SIZE,
+    high_water: int = CHUNKED_DRAIN_HIGH_WATER,
+    line_length_limit: int | None = None,
+    partial_line: bytes = b"",
+) -> bytes:
+    """Capture the output stream of a subprocess in chunks of complete lines.
+
+    This is a higher throughput alternative to `capture_subprocess_output`,
+    suited for forwarding a producer's stdout to a consumer's stdin. Large
+    buffers are read from `reader`, and every run of complete lines is written
+    to `asyncio.StreamWriter` destinations in a single call, only waiting for
+    them to drain once `high_water` bytes are buffered. Other writers still
+    receive one `writeline` call per line.
+
+    Args:
+        reader: `asyncio.StreamReader` object that is the output stream of the
+            subprocess.
+        line_writers: A `StreamWriter`, or object has a compatible writelines method.
+        read_size: Maximum number of bytes to read from `reader` at once.
+        high_water: Number of bytes buffered in a `StreamWriter` after which it
+            is drained.
+        line_length_limit: Maximum length of a single line. If exceeded, a
+            `ValueError` is raised, like `asyncio.StreamReader.readline` does.
+        partial_line: Start of a line read from `reader` before, to be completed
+            by the output read next.
+
+    Returns:
+        The start of a line read after the last complete one, if capturing
+        stopped because a destination stream was closed. It wasn't forwarded,
+        and can be passed as `partial_line` to resume capturing the output.
+    """
+    pending = partial_line
+    while reader and not reader.at_eof():
+        data = await reader.read(read_size)
+        if not data:
+            continue
+
+        end = data.rfind(b"\n") + 1
+        if not end:
+            pending += data
+            if line_length_limit and len(pending) > line_length_limit:
+                _raise_line_length_limit_error(len(pending))
+            continue
+
+        # Lines are only measured one by one if one of them can be too long
+        if line_length_limit and len(pending) + end > line_length_limit:
+            _check_line_lengths(data, end, len(pending), line_length_limit)
+
+        chunk = pending + data[:end] if pending or end < len(data) else data
+        pending = data[end:]
+        if line_length_limit and len(pending) > line_length_limit:
+            _raise_line_length_limit_error(len(pending))
+
+        for writer in line_writers:
+            if not await _write_chunk_writer(writer, chunk, high_water=high_water):
+                # If the destination stream is closed, we can stop capturing output.
+                return pending
+
+    for writer in line_writers:
+        # Forward any trailing output not terminated by a newline, and make sure
+        # everything buffered in a `StreamWriter` is flushed
+        if not await _write_chunk_writer(writer, pending, high_water=0):
+            break
+    return b""
@@ -6,4 +6,4 @@ from .base import BasePlugin, SingerPlugin
 from .catalog import ListExecutor, SelectExecutor
 from .mapper import SingerMapper
 from .tap import SingerTap
-from .target import BookmarkWriter, SingerTarget
+from .target import BookmarkWriter, CoalescingBookmarkWriter, SingerTarget
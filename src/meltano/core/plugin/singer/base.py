@@ -115,9 +115,13 @@ class SingerPlugin(BasePlugin):
 
         logger.debug("Created configuration at %s", config_path)
 
-    @hook("before_cleanup")
-    async def before_cleanup(self, invoker: PluginInvoker) -> None:
-        """Delete configuration file."""
+    @hook("after_cleanup")
+    async def after_cleanup(self, invoker: PluginInvoker) -> None:
+        """Delete configuration file.
+
+        This happens after the cleanup hooks of subclasses, which may still run
+        the plugin, e.g. to finish a discovery started in the background.
+        """
         config_path = invoker.files["config"]
         config_path.unlink()
         logger.debug("Deleted configuration at %s", config_path)
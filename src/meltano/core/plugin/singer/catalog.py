@@ -11,11 +11,12 @@ from __future__ import annotations
 
 import dataclasses
 import fnmatch
+import os
 import re
 import sys
 import typing as t
 from enum import Enum, auto
-from functools import partial, singledispatch
+from functools import partial
 
 import structlog
 
@@ -39,16 +40,22 @@ if t.TYPE_CHECKING:
 logger = structlog.stdlib.get_logger(__name__)
 
 Node: t.TypeAlias = dict[str, t.Any]
+Breadcrumb: t.TypeAlias = tuple[str, ...]
 
 
 UNESCAPED_DOT = re.compile(r"(?<!\\)\.")
 PROP_DELIMITER = "."
 PROPERTIES_KEY = "properties"
 SCHEMA_KEY = "schema"
+METADATA_KEY = "metadata"
+BREADCRUMB_KEY = "breadcrumb"
 INCLUSION_KEY = "inclusion"
 SELECTED_KEY = "selected"
 SELECTED_BY_DEFAULT_KEY = "selected-by-default"
 
+# Characters with a special meaning in shell-style wildcard patterns
+GLOB_CHARS = re.compile(r"[*?\[]")
+
 
 class CatalogDict(t.TypedDict):
     """A catalog dictionary."""
@@ -153,6 +160,120 @@ class SchemaRule(_CatalogRuleProtocol):
     negated: bool = False
 
 
+RuleT = t.TypeVar("RuleT", bound=_CatalogRuleProtocol)
+
+
+def _compile_globs(patterns: Iterable[str]) -> re.Pattern[str]:
+    # `fnmatch.fnmatch` normalizes the case of names and patterns, e.g. on Windows
+    regexes = [fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns]
+    # Without any pattern, nothing matches
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes) or "(?!)")
+
+
+class _StreamRules(t.NamedTuple):
+    """The rules matching a single stream, indexed by breadcrumb."""
+
+    indices: list[int]
+    literal_breadcrumbs: dict[str, list[int]]
+    glob_breadcrumbs: list[tuple[int, re.Pattern[str]]]
+
+
+class RuleIndex(t.Generic[RuleT]):
+    """Rules compiled once to look up the ones matching catalog nodes.
+
+    Lookups return the same rules, in the same order, as
+    `_CatalogRuleProtocol.matching`. Rules for literal stream IDs are kept in
+    hash buckets, and the wildcard patterns of every other rule are combined
+    into a single regular expression. The rules matching a stream are resolved
+    once per stream, then looked up by breadcrumb: literal breadcrumbs in a
+    hash map, and wildcard breadcrumbs with their compiled pattern.
+    """
+
+    def __init__(self, rules: Iterable[RuleT]):
+        """Compile an index of rules.
+
+        Args:
+            rules: The rules to index, in order of precedence.
+        """
+        self.rules = list(rules)
+
+        self._literal_streams: dict[str, list[int]] = {}
+        self._glob_streams: list[tuple[int, re.Pattern[str], bool]] = []
+        self._streams: dict[str, _StreamRules] = {}
+
+        for idx, rule in enumerate(self.rules):
+            patterns = (
+                rule.tap_stream_id
+                if isinstance(rule.tap_stream_id, list)
+                else [rule.tap_stream_id]
+            )
+            if rule.negated or any(GLOB_CHARS.search(p) for p in patterns):
+                self._glob_streams.append(
+                    (idx, _compile_globs(patterns), rule.negated),
+                )
+                continue
+
+            for pattern in dict.fromkeys(os.path.normcase(p) for p in patterns):
+                self._literal_streams.setdefault(pattern, []).append(idx)
+
+    def _stream_rules(self, tap_stream_id: str) -> _StreamRules:
+        if (stream_rules := self._streams.get(tap_stream_id)) is not None:
+            return stream_rules
+
+        name = os.path.normcase(tap_stream_id)
+        indices = list(self._literal_streams.get(name, ()))
+        for idx, regex, negated in self._glob_streams:
+            if (regex.match(name) is not None) is not negated:
+                indices.append(idx)
+        indices.sort()
+
+        literal_breadcrumbs: dict[str, list[int]] = {}
+        glob_breadcrumbs: list[tuple[int, re.Pattern[str]]] = []
+        for idx in indices:
+            pattern = PROP_DELIMITER.join(self.rules[idx].breadcrumb)
+            if GLOB_CHARS.search(pattern):
+                glob_breadcrumbs.append((idx, _compile_globs([pattern])))
+            else:
+                literal_breadcrumbs.setdefault(os.path.normcase(pattern), []).append(
+                    idx,
+                )
+
+        stream_rules = self._streams[tap_stream_id] = _StreamRules(
+            indices,
+            literal_breadcrumbs,
+            glob_breadcrumbs,
+        )
+        return stream_rules
+
+    def matching(
+        self,
+        tap_stream_id: str,
+        breadcrumb: Sequence[str] | None = None,
+    ) -> list[RuleT]:
+        """Get the rules matching a stream, and breadcrumb if provided.
+
+        Args:
+            tap_stream_id: Singer stream identifier.
+            breadcrumb: JSON property breadcrumb.
+
+        Returns:
+            The matching rules, in order.
+        """
+        stream_rules = self._stream_rules(tap_stream_id)
+        if breadcrumb is None:
+            return [self.rules[idx] for idx in stream_rules.indices]
+
+        name = os.path.normcase(PROP_DELIMITER.join(breadcrumb))
+        indices = stream_rules.literal_breadcrumbs.get(name, [])
+        if globs := [
+            idx
+            for idx, regex in stream_rules.glob_breadcrumbs
+            if regex.match(name) is not None
+        ]:
+            indices = sorted(indices + globs)
+        return [self.rules[idx] for idx in indices]
+
+
 class SelectPattern(t.NamedTuple):
     """A pattern for selecting streams and properties."""
 
@@ -281,8 +402,8 @@ def select_filter_metadata_rules(patterns: Iterable[str]) -> list[MetadataRule]:
 def path_property(path: str) -> str:
     """Extract the property name from a materialized path.
 
-    As we traverse the catalog tree, we build a materialized path
-    to keep track of the parent nodes.
+    A materialized path is the dotted path of a node in the catalog tree,
+    including its parent nodes.
 
     Args:
         path: String representing a property path in the JSON schema.
@@ -382,45 +503,60 @@ class SelectionType(StrEnum):
         return SelectionType.SELECTED
 
 
-@singledispatch
-def visit(
-    node: t.Any,  # noqa: ANN401, ARG001
-    executor: CatalogExecutor,  # noqa: ARG001
-    path: str = "",
-) -> None:
-    """Visit a node in the catalog."""
-    logger.debug("Skipping node at '%s'", path)
-
-
-@visit.register(dict)
-def _(node: dict, executor, path: str = "") -> None:  # noqa: ANN001
-    node_type = None
-
-    if re.search(r"streams\[\d+\]$", path):
-        node_type = CatalogNode.STREAM
-
-    if re.search(r"schema(\.properties\.\w*)+$", path):
-        node_type = CatalogNode.PROPERTY
-
-    if re.search(r"metadata\[\d+\]$", path) and "breadcrumb" in node:
-        node_type = CatalogNode.METADATA
+def visit(node: t.Any, executor: CatalogExecutor) -> None:  # noqa: ANN401
+    """Visit the streams, properties and metadata of a catalog.
 
-    if node_type:
-        logger.debug("Visiting %s at '%s'.", node_type, path)
-        executor(node_type, node, path)
-
-    for child_path, child_node in node.items():
-        if node_type is CatalogNode.PROPERTY and child_path in {"anyOf", "type"}:
-            continue
-
-        # TODO mbergeron: refactor this to use a dynamic visitor per CatalogNode
-        executor.visit(child_node, path=f"{path}.{child_path}")
+    The catalog is walked along the Singer catalog structure: every stream, then
+    the properties of its schema, recursively, and its metadata entries. Schema
+    and metadata are visited in the order they appear in the stream.
 
+    Args:
+        node: The catalog to visit.
+        executor: The executor to dispatch the catalog nodes to.
+    """
+    if not isinstance(node, dict):
+        logger.debug("Skipping catalog that is not an object")
+        return
+
+    streams = node.get("streams")
+    if not isinstance(streams, list):
+        return
+
+    for stream in streams:
+        if isinstance(stream, dict):
+            _visit_stream(stream, executor)
+
+
+def _visit_stream(stream: Node, executor: CatalogExecutor) -> None:
+    executor.stream_node(stream, ())
+
+    # Hooks may add the schema or metadata to the stream, so look them up after
+    for key in [key for key in stream if key in {SCHEMA_KEY, METADATA_KEY}]:
+        value = stream[key]
+        if key == SCHEMA_KEY:
+            if isinstance(value, dict):
+                _visit_properties(value, executor, ())
+        elif isinstance(value, list):
+            for entry in value:
+                if isinstance(entry, dict) and BREADCRUMB_KEY in entry:
+                    executor.metadata_node(entry, tuple(entry[BREADCRUMB_KEY]))
+
+
+def _visit_properties(
+    node: Node,
+    executor: CatalogExecutor,
+    breadcrumb: Breadcrumb,
+) -> None:
+    properties = node.get(PROPERTIES_KEY)
+    if not isinstance(properties, dict):
+        return
 
-@visit.register(list)
-def _(node: list, executor, path: str = "") -> None:  # noqa: ANN001
-    for index, child_node in enumerate(node):
-        executor.visit(child_node, path=f"{path}[{index}]")
+    for name, prop in properties.items():
+        if isinstance(prop, dict):
+            prop_breadcrumb = (*breadcrumb, PROPERTIES_KEY, name)
+            executor.property_node(prop, prop_breadcrumb)
+            # Hooks may replace the property, so its sub-properties are read after
+            _visit_properties(prop, executor, prop_breadcrumb)
 
 
 @visit_with(visit)
@@ -432,7 +568,8 @@ class CatalogExecutor:
     as the foundation for more specialized executors that manipulate catalog
     metadata, schema properties, and selection rules.
 
-    The executor processes three types of catalog nodes:
+    The executor processes three types of catalog nodes, each along with its
+    breadcrumb, e.g. `("properties", "address", "properties", "city")`:
     - Stream nodes: Top-level catalog entries representing data streams
     - Property nodes: Schema property definitions within streams
     - Metadata nodes: Selection and inclusion metadata for streams and properties
@@ -441,41 +578,49 @@ class CatalogExecutor:
     their custom catalog manipulation logic.
     """
 
-    def execute(self, node_type: CatalogNode, node: Node, path: str) -> None:
+    def execute(
+        self,
+        node_type: CatalogNode,
+        node: Node,
+        breadcrumb: Breadcrumb,
+    ) -> None:
         """Dispatch all node methods."""
-        dispatch = {
-            CatalogNode.STREAM: self.stream_node,
-            CatalogNode.PROPERTY: self.property_node,
-            CatalogNode.METADATA: self.metadata_node,
-        }
-
-        try:
-            dispatch[node_type](node, path)
-        except KeyError:  # pragma: no cover
-            logger.debug("Unknown node type '%s'.", node_type)
+        if node_type is CatalogNode.STREAM:
+            self.stream_node(node, breadcrumb)
+        elif node_type is CatalogNode.PROPERTY:
+            self.property_node(node, breadcrumb)
+        elif node_type is CatalogNode.METADATA:
+            self.metadata_node(node, breadcrumb)
+        else:
+            t.assert_never(node_type)
 
-    def stream_node(self, node: Node, path: str) -> None:
+    def stream_node(self, node: Node, breadcrumb: Breadcrumb) -> None:
         """Process stream node."""
 
-    def property_node(self, node: Node, path: str) -> None:
+    def property_node(self, node: Node, breadcrumb: Breadcrumb) -> None:
         """Process property node."""
 
-    def metadata_node(self, node: Node, path: str) -> None:
+    def metadata_node(self, node: Node, breadcrumb: Breadcrumb) -> None:
         """Process metadata node."""
-        if len(node["breadcrumb"]) == 0:
-            self.stream_metadata_node(node, path)
+        if len(breadcrumb) == 0:
+            self.stream_metadata_node(node, breadcrumb)
         else:
-            self.property_metadata_node(node, path)
+            self.property_metadata_node(node, breadcrumb)
 
-    def stream_metadata_node(self, node: Node, path: str) -> None:
+    def stream_metadata_node(self, node: Node, breadcrumb: Breadcrumb) -> None:
         """Process stream metadata node."""
 
-    def property_metadata_node(self, node: Node, path: str) -> None:
+    def property_metadata_node(self, node: Node, breadcrumb: Breadcrumb) -> None:
         """Process property metadata node."""
 
-    def __call__(self, node_type: CatalogNode, node: Node, path: str) -> None:
+    def __call__(
+        self,
+        node_type: CatalogNode,
+        node: Node,
+        breadcrumb: Breadcrumb,
+    ) -> None:
         """Call this instance as a function."""
-        return self.execute(node_type, node, path)
+        return self.execute(node_type, node, breadcrumb)
 
 
 class MetadataExecutor(CatalogExecutor):
@@ -494,22 +639,22 @@ class MetadataExecutor(CatalogExecutor):
     def __init__(self, rules: list[MetadataRule]):
         """Initialize the MetadataExecutor with a list of metadata rules."""
         self._stream: Node | None = None
-        self._rules = rules
+        # Metadata entries of the current stream, by breadcrumb
+        self._metadata: dict[Breadcrumb, Node] = {}
+        self._rules = RuleIndex(rules)
+
+    def _index_metadata(self, metadata_list: list[dict]) -> None:
+        self._metadata = {}
+        for entry in metadata_list:
+            # Like a linear search, the first entry for a breadcrumb wins
+            self._metadata.setdefault(tuple(entry[BREADCRUMB_KEY]), entry)
 
     def ensure_metadata(self, breadcrumb: list[str]) -> None:
         """Handle missing metadata entries."""
-        metadata_list: list[dict] = self._stream["metadata"]  # type: ignore[index]
-        match = next(
-            (
-                metadata
-                for metadata in metadata_list
-                if metadata["breadcrumb"] == breadcrumb
-            ),
-            None,
-        )
+        metadata_list: list[dict] = self._stream[METADATA_KEY]  # type: ignore[index]
 
         # Missing inclusion metadata for property
-        if match is None:
+        if tuple(breadcrumb) not in self._metadata:
             # Streams and top-level properties.
             if len(breadcrumb) <= 2:
                 entry = {
@@ -524,39 +669,42 @@ class MetadataExecutor(CatalogExecutor):
                 }
 
             metadata_list.append(entry)
+            self._metadata[tuple(breadcrumb)] = entry
 
     @override
-    def stream_node(self, node: Node, path: str) -> None:
+    def stream_node(self, node: Node, breadcrumb: Breadcrumb) -> None:
         """Process stream metadata node."""
         self._stream = node
         tap_stream_id = self._stream["tap_stream_id"]
 
-        if "metadata" not in node:
-            node["metadata"] = []
+        if METADATA_KEY not in node:
+            node[METADATA_KEY] = []
 
+        self._index_metadata(node[METADATA_KEY])
         self.ensure_metadata([])
 
-        for rule in MetadataRule.matching(self._rules, tap_stream_id, []):
+        for rule in self._rules.matching(tap_stream_id, ()):
             # Legacy catalogs have underscorized keys on the streams themselves
-            self.set_metadata(node, path, rule.key.replace("-", "_"), rule.value)
+            self.set_metadata(
+                node,
+                tap_stream_id,
+                rule.key.replace("-", "_"),
+                rule.value,
+            )
 
     @override
     def property_node(
         self,
         node: Node,
-        path: str,
+        breadcrumb: Breadcrumb,
     ) -> None:
         """Process property metadata node."""
-        breadcrumb_idx = path.index(PROPERTIES_KEY)
-        breadcrumb = path[breadcrumb_idx:].split(PROP_DELIMITER)
-
-        self.ensure_metadata(breadcrumb)
+        self.ensure_metadata(list(breadcrumb))
 
     @override
-    def metadata_node(self, node: Node, path: str) -> None:
+    def metadata_node(self, node: Node, breadcrumb: Breadcrumb) -> None:
         """Process metadata node."""
         tap_stream_id = self._stream["tap_stream_id"]  # type: ignore[index]
-        breadcrumb = node["breadcrumb"]
 
         logger.debug(
             "Visiting metadata node for tap_stream_id '%s', breadcrumb '%s'",
@@ -564,16 +712,23 @@ class MetadataExecutor(CatalogExecutor):
             breadcrumb,
         )
 
-        for rule in MetadataRule.matching(self._rules, tap_stream_id, breadcrumb):
+        for rule in self._rules.matching(tap_stream_id, node[BREADCRUMB_KEY]):
             self.set_metadata(
-                node["metadata"],
-                f"{path}.metadata",
+                node[METADATA_KEY],
+                PROP_DELIMITER.join((tap_stream_id, *breadcrumb, METADATA_KEY)),
                 rule.key,
                 rule.value,
             )
 
     def set_metadata(self, node: Node, path: str, key: str, value: t.Any) -> None:  # noqa: ANN401
-        """Set selection and inclusion keys in a metadata node."""
+        """Set selection and inclusion keys in a metadata node.
+
+        Args:
+            node: The metadata node to update.
+            path: The location of the node in the catalog, for logging.
+            key: The metadata key to set.
+            value: The value to set.
+        """
         # Unsupported fields cannot be selected
         if (
             key == SELECTED_KEY
@@ -630,7 +785,7 @@ class SchemaExecutor(CatalogExecutor):
             rules: List of schema rules to apply to the catalog.
         """
         self._stream: Node | None = None
-        self._rules = rules
+        self._rules = RuleIndex(rules)
 
     def ensure_property(self, breadcrumb: list[str]) -> None:
         """Create nodes for the breadcrumb and schema extra that matches."""
@@ -659,29 +814,36 @@ class SchemaExecutor(CatalogExecutor):
     def stream_node(
         self,
         node: Node,
-        path: str,
+        breadcrumb: Breadcrumb,
     ) -> None:
         """Process stream schema node."""
         self._stream = node
         tap_stream_id: str = self._stream["tap_stream_id"]
         node.setdefault(SCHEMA_KEY, {"type": "object"})
 
-        for rule in SchemaRule.matching(self._rules, tap_stream_id):
+        for rule in self._rules.matching(tap_stream_id):
             self.ensure_property(rule.breadcrumb)
 
     @override
-    def property_node(self, node: Node, path: str) -> None:
+    def property_node(self, node: Node, breadcrumb: Breadcrumb) -> None:
         """Process property schema node."""
         tap_stream_id = self._stream["tap_stream_id"]  # type: ignore[index]
 
-        breadcrumb_idx = path.index(PROPERTIES_KEY)
-        breadcrumb = path[breadcrumb_idx:].split(PROP_DELIMITER)
-
-        for rule in SchemaRule.matching(self._rules, tap_stream_id, breadcrumb):
-            self.set_payload(node, path, rule.payload)
+        for rule in self._rules.matching(tap_stream_id, breadcrumb):
+            self.set_payload(
+                node,
+                PROP_DELIMITER.join((tap_stream_id, *breadcrumb)),
+                rule.payload,
+            )
 
     def set_payload(self, node: Node, path: str, payload: dict) -> None:
-        """Set node payload from a clean mapping."""
+        """Set node payload from a clean mapping.
+
+        Args:
+            node: The property node to update.
+            path: The location of the node in the catalog, for logging.
+            payload: The schema to set.
+        """
         node.clear()
         node.update(payload)
         logger.debug("Setting '%s' to %r", path, payload)
@@ -709,24 +871,22 @@ class ListExecutor(CatalogExecutor):
     def stream_node(
         self,
         node: Node,
-        path: str,
+        breadcrumb: Breadcrumb,
     ) -> None:
         """Initialize empty property set stream."""
-        stream = node["tap_stream_id"]
-        if stream not in self.properties:
-            self.properties[stream] = set()
+        self._stream: str = node["tap_stream_id"]
+        if self._stream not in self.properties:
+            self.properties[self._stream] = set()
 
     @override
     def property_node(
         self,
         node: Node,
-        path: str,
+        breadcrumb: Breadcrumb,
     ) -> None:
         """Add property to stream collection."""
-        prop = path_property(path)
-        # current stream
-        stream = next(reversed(self.properties))
-        self.properties[stream].add(prop)
+        # Every other breadcrumb component is a property name
+        self.properties[self._stream].add(PROP_DELIMITER.join(breadcrumb[1::2]))
 
 
 class SelectedNode(t.NamedTuple):
@@ -802,7 +962,7 @@ class ListSelectedExecutor(CatalogExecutor):
     def stream_node(
         self,
         node: Node,
-        path: str,
+        breadcrumb: Breadcrumb,
     ) -> None:
         """Initialize empty set for selected nodes in stream."""
         self._stream: str = node["tap_stream_id"]
@@ -812,7 +972,7 @@ class ListSelectedExecutor(CatalogExecutor):
     def stream_metadata_node(
         self,
         node: Node,
-        path: str,
+        breadcrumb: Breadcrumb,
     ) -> None:
         """Add stream selection to tap's collection."""
         selection = SelectedNode(self._stream, self.node_selection(node))
@@ -822,11 +982,36 @@ class ListSelectedExecutor(CatalogExecutor):
     def property_metadata_node(
         self,
         node: Node,
-        path: str,
+        breadcrumb: Breadcrumb,
     ) -> None:
         """Add property selection to stream's collection."""
-        property_path = PROP_DELIMITER.join(node["breadcrumb"])
-        prop = path_property(property_path)
+        # Every other breadcrumb component is a property name
+        prop = PROP_DELIMITER.join(breadcrumb[1::2])
         selection = SelectedNode(prop, self.node_selection(node))
 
         self.properties[self._stream].add(selection)
+
+
+class StreamPartition(t.NamedTuple):
+    """One of `partitions` disjoint slices of the selected streams of a catalog."""
+
+    partition: int
+    partitions: int
+
+    def streams(self, stream_ids: Iterable[str]) -> set[str]:
+        """Get the streams that belong to this partition.
+
+        Streams are sorted and dealt round-robin over the partitions, so every
+        partition of the same catalog gets a stable and disjoint set of streams.
+
+        Args:
+            stream_ids: The IDs of all the selected streams.
+
+        Returns:
+            The IDs of the streams in this partition.
+        """
+        return {
+            stream_id
+            for idx, stream_id in enumerate(sorted(stream_ids))
+            if idx % self.partitions == self.partition
+        }
@@ -0,0 +1,192 @@
+"""A catalog cache shared by the projects and environments of a machine."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+import typing as t
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path
+
+import structlog
+
+from meltano.core.setting_definition import json_dumps
+
+if t.TYPE_CHECKING:
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.project import Project
+
+logger = structlog.stdlib.get_logger(__name__)
+
+CATALOG_SUFFIX = ".catalog.json"
+DISCOVERED_SUFFIX = ".discovered"
+
+
+class SharedCatalogCache:
+    """A directory of discovered catalogs, addressed by the inputs of discovery.
+
+    Entries are named after a hash of the plugin package and the catalog cache
+    key of the extractor, and written atomically, so the same directory can be
+    used by several projects and processes at once. Every entry records when its
+    catalog was discovered in a file of its own, since reading an entry marks it
+    as recently used by updating its modification time. Once the entries exceed
+    `max_size` bytes the least recently used ones are evicted.
+    """
+
+    def __init__(self, directory: Path, *, max_size: int):
+        """Initialize a `SharedCatalogCache`.
+
+        Args:
+            directory: The directory holding the cached catalogs.
+            max_size: Maximum total size in bytes of the cached catalogs, or 0
+                for no limit.
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+    @classmethod
+    def from_project(cls, project: Project) -> SharedCatalogCache | None:
+        """Create the shared catalog cache configured for a project.
+
+        Args:
+            project: The Meltano project.
+
+        Returns:
+            The shared catalog cache, or None if `catalog_cache.dir` is not set.
+        """
+        if not (directory := project.settings.get("catalog_cache.dir")):
+            return None
+        return cls(
+            project.root / Path(directory).expanduser(),
+            max_size=project.settings.get("catalog_cache.max_size"),
+        )
+
+    @staticmethod
+    def key(plugin: ProjectPlugin, catalog_cache_key: str) -> str:
+        """Get the key of the catalog of an extractor.
+
+        Args:
+            plugin: The extractor.
+            catalog_cache_key: The catalog cache key of the extractor.
+
+        Returns:
+            The key of the catalog in the shared cache.
+        """
+        key_json = json_dumps(
+            {
+                "pip_url": plugin.pip_url,
+                "variant": plugin.variant,
+                "executable": plugin.executable,
+                "catalog_cache_key": catalog_cache_key,
+            },
+        )
+        return sha256(key_json.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{CATALOG_SUFFIX}"
+
+    def _discovered_path(self, key: str) -> Path:
+        return self.directory / f"{key}{DISCOVERED_SUFFIX}"
+
+    def get(self, key: str, catalog_path: Path) -> float | None:
+        """Copy a cached catalog to the catalog file of an extractor.
+
+        Args:
+            key: The key of the catalog.
+            catalog_path: Where to copy the catalog to.
+
+        Returns:
+            The time the catalog was discovered, as seconds since the epoch, or
+            None if the catalog is not cached.
+        """
+        path = self._path(key)
+        try:
+            discovered_at = float(self._discovered_path(key).read_text())
+            shutil.copyfile(path, catalog_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.warning("Could not read shared catalog cache: %s", err)
+            return None
+
+        # Mark the entry as recently used
+        with suppress(OSError):
+            os.utime(path)
+        logger.debug("Using catalog from shared catalog cache", path=str(path))
+        return discovered_at
+
+    def put(
+        self,
+        key: str,
+        catalog_path: Path,
+        *,
+        discovered_at: float | None = None,
+    ) -> None:
+        """Store the catalog file of an extractor.
+
+        Args:
+            key: The key of the catalog.
+            catalog_path: The catalog file to store.
+            discovered_at: The time the catalog was discovered, as seconds since
+                the epoch. Defaults to now.
+        """
+        if discovered_at is None:
+            discovered_at = time.time()
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with catalog_path.open("rb") as src:
+                self._write(self._path(key), lambda dst: shutil.copyfileobj(src, dst))
+            # Written last, so a catalog is never considered newer than it is
+            self._write(
+                self._discovered_path(key),
+                lambda dst: dst.write(repr(discovered_at).encode()),
+            )
+        except OSError as err:
+            logger.warning("Could not write shared catalog cache: %s", err)
+            return
+
+        self.evict()
+
+    def _write(self, path: Path, write: t.Callable[[t.IO[bytes]], object]) -> None:
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory,
+                suffix=".tmp",
+                delete=False,
+            ) as dst:
+                tmp_name = dst.name
+                write(dst)
+            Path(tmp_name).replace(path)
+        except OSError:
+            if tmp_name:
+                with suppress(OSError):
+                    Path(tmp_name).unlink()
+            raise
+
+    def evict(self) -> None:
+        """Remove the least recently used catalogs exceeding the size limit."""
+        if not self.max_size:
+            return
+
+        entries = []
+        for path in self.directory.glob(f"*{CATALOG_SUFFIX}"):
+            # Entries may be evicted concurrently
+            with suppress(FileNotFoundError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            key = path.name.removesuffix(CATALOG_SUFFIX)
+            with suppress(FileNotFoundError):
+                path.unlink()
+            with suppress(FileNotFoundError):
+                self._discovered_path(key).unlink()
+            total_size -= size
@@ -0,0 +1,244 @@
+"""Detect schema changes between discoveries of a Singer catalog.
+
+Comparing two catalogs means loading and diffing documents that can be hundreds
+of megabytes. Instead, `fingerprint_catalog` reduces a catalog to an index of
+fingerprints, one per stream and one per property, which is small enough to be
+kept next to the cached catalog and compared to the index of the next discovery
+in time proportional to the number of streams.
+"""
+
+from __future__ import annotations
+
+import json
+import typing as t
+from dataclasses import dataclass, field
+from hashlib import sha256
+
+from meltano.core.setting_definition import json_dumps
+
+from .catalog import SELECTED_KEY
+from .catalog_streaming import process_catalog
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+# Bumped whenever fingerprints are computed differently, so an index written by
+# another version of Meltano is not compared to a new one
+FINGERPRINT_VERSION = 1
+
+# Stream keys, other than the schema and metadata, describing how it's extracted
+STREAM_KEYS = ("key_properties", "replication_key", "replication_method")
+
+
+class StreamFingerprint(t.TypedDict):
+    """The fingerprints of a stream and of its top-level properties."""
+
+    fingerprint: str
+    properties: dict[str, str]
+
+
+CatalogFingerprints = dict[str, StreamFingerprint]
+
+
+def _fingerprint(value: t.Any) -> str:  # noqa: ANN401
+    return sha256(json_dumps(value, sort_keys=True).encode()).hexdigest()
+
+
+def _metadata(stream: dict[str, t.Any]) -> list[dict[str, t.Any]]:
+    """Get the metadata of a stream, without the selection made by users."""
+    metadata = []
+    for entry in stream.get("metadata") or []:
+        if not isinstance(entry, dict):
+            continue
+        entry_metadata = entry.get("metadata")
+        if isinstance(entry_metadata, dict):
+            entry_metadata = {
+                key: value
+                for key, value in entry_metadata.items()
+                if key != SELECTED_KEY
+            }
+        metadata.append(
+            {"breadcrumb": entry.get("breadcrumb"), "metadata": entry_metadata},
+        )
+    return metadata
+
+
+def fingerprint_stream(stream: dict[str, t.Any]) -> StreamFingerprint:
+    """Fingerprint the schema and key metadata of a stream and of its properties.
+
+    Selection metadata is left out, since it is set by catalog rules rather than
+    by the extractor.
+
+    Args:
+        stream: The stream object of a catalog.
+
+    Returns:
+        The fingerprints of the stream and of each of its top-level properties.
+    """
+    schema = stream.get("schema")
+    metadata = _metadata(stream)
+
+    property_schemas = schema.get("properties") if isinstance(schema, dict) else None
+    if not isinstance(property_schemas, dict):
+        property_schemas = {}
+
+    property_metadata: dict[str, list[dict[str, t.Any]]] = {}
+    for entry in metadata:
+        breadcrumb = entry["breadcrumb"]
+        if (
+            isinstance(breadcrumb, list)
+            and len(breadcrumb) >= 2
+            and breadcrumb[0] == "properties"
+            and isinstance(breadcrumb[1], str)
+        ):
+            property_metadata.setdefault(breadcrumb[1], []).append(entry)
+
+    return {
+        "fingerprint": _fingerprint(
+            {
+                "schema": schema,
+                "metadata": metadata,
+                **{key: stream[key] for key in STREAM_KEYS if key in stream},
+            },
+        ),
+        "properties": {
+            name: _fingerprint(
+                {
+                    "schema": property_schemas.get(name),
+                    "metadata": property_metadata.get(name, []),
+                },
+            )
+            for name in property_schemas.keys() | property_metadata.keys()
+        },
+    }
+
+
+def fingerprint_catalog(catalog_file: t.TextIO) -> CatalogFingerprints:
+    """Fingerprint the streams of a catalog, reading it one stream at a time.
+
+    Args:
+        catalog_file: The catalog file to read.
+
+    Returns:
+        The fingerprints of the streams of the catalog, by stream ID.
+
+    Raises:
+        JSONDecodeError: if the catalog is not a valid JSON object.
+    """
+    fingerprints: CatalogFingerprints = {}
+
+    def visit_stream(stream: dict[str, t.Any]) -> None:
+        if isinstance(stream_id := stream.get("tap_stream_id"), str):
+            fingerprints[stream_id] = fingerprint_stream(stream)
+
+    process_catalog(catalog_file, visit_stream=visit_stream)
+    return fingerprints
+
+
+def read_fingerprints(path: Path) -> CatalogFingerprints | None:
+    """Read an index of catalog fingerprints.
+
+    Args:
+        path: The index file.
+
+    Returns:
+        The fingerprints of the streams of the catalog, or None if the index is
+        missing, invalid or written by another version of Meltano.
+    """
+    try:
+        with path.open() as index_file:
+            index = json.load(index_file)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != FINGERPRINT_VERSION:
+        return None
+    streams = index.get("streams")
+    return streams if isinstance(streams, dict) else None
+
+
+def write_fingerprints(path: Path, fingerprints: CatalogFingerprints) -> None:
+    """Write an index of catalog fingerprints.
+
+    Args:
+        path: The index file.
+        fingerprints: The fingerprints of the streams of the catalog.
+    """
+    path.write_text(
+        json_dumps(
+            {"version": FINGERPRINT_VERSION, "streams": fingerprints},
+            separators=(",", ":"),
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class StreamChanges:
+    """The properties of a stream that changed between two discoveries.
+
+    added_properties: Top-level properties that were not discovered before.
+    removed_properties: Top-level properties that are no longer discovered.
+    changed_properties: Top-level properties whose schema or metadata changed.
+    """
+
+    added_properties: list[str] = field(default_factory=list)
+    removed_properties: list[str] = field(default_factory=list)
+    changed_properties: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CatalogChanges:
+    """The streams that changed between two discoveries of a catalog.
+
+    added_streams: Streams that were not discovered before.
+    removed_streams: Streams that are no longer discovered.
+    changed_streams: Changes to streams whose schema or key metadata changed.
+    """
+
+    added_streams: list[str] = field(default_factory=list)
+    removed_streams: list[str] = field(default_factory=list)
+    changed_streams: dict[str, StreamChanges] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """Whether anything changed.
+
+        Returns:
+            `True` if any stream was added, removed or changed.
+        """
+        return bool(self.added_streams or self.removed_streams or self.changed_streams)
+
+
+def diff_fingerprints(
+    old: CatalogFingerprints,
+    new: CatalogFingerprints,
+) -> CatalogChanges:
+    """Compare the fingerprints of two discoveries of a catalog.
+
+    Args:
+        old: The fingerprints of the previously discovered catalog.
+        new: The fingerprints of the newly discovered catalog.
+
+    Returns:
+        The streams, and the properties of streams, that changed.
+    """
+    changed_streams = {}
+    for stream_id in sorted(old.keys() & new.keys()):
+        if old[stream_id]["fingerprint"] == new[stream_id]["fingerprint"]:
+            continue
+
+        old_properties = old[stream_id]["properties"]
+        new_properties = new[stream_id]["properties"]
+        changed_streams[stream_id] = StreamChanges(
+            added_properties=sorted(new_properties.keys() - old_properties.keys()),
+            removed_properties=sorted(old_properties.keys() - new_properties.keys()),
+            changed_properties=sorted(
+                name
+                for name in old_properties.keys() & new_properties.keys()
+                if old_properties[name] != new_properties[name]
+            ),
+        )
+
+    return CatalogChanges(
+        added_streams=sorted(new.keys() - old.keys()),
+        removed_streams=sorted(old.keys() - new.keys()),
+        changed_streams=changed_streams,
+    )
@@ -0,0 +1,224 @@
+"""Process Singer catalogs one stream at a time.
+
+Discovery output of some extractors is hundreds of megabytes, most of it in the
+`streams` array. Rather than loading a whole catalog, `process_catalog` decodes
+the streams one by one, hands each of them to a callback, and writes it out
+before decoding the next one, so memory is bounded by the largest stream.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+import typing as t
+
+from meltano.core.setting_definition import json_dumps
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+STREAMS_KEY = "streams"
+
+# Amount of the catalog file read at once, grown while a single value doesn't fit
+CATALOG_READ_SIZE = 1024 * 1024  # 1 MiB
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _CatalogScanner:
+    """Decode the JSON values of a catalog file, reading it in chunks."""
+
+    def __init__(self, file: t.TextIO, *, read_size: int):
+        self._file = file
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, size: int) -> bool:
+        if self._eof:
+            return False
+        if not (chunk := self._file.read(size)):
+            self._eof = True
+            return False
+        # Drop what was decoded already
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def error(self, msg: str) -> json.JSONDecodeError:
+        """Create an error for the current position in the catalog."""
+        return json.JSONDecodeError(msg, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read(self._read_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of `chars`."""
+        char = self.peek()
+        if not char or char not in chars:
+            expected = " or ".join(repr(char) for char in chars)
+            msg = f"Expecting {expected}"
+            raise self.error(msg)
+        self._pos += 1
+        return char
+
+    def value(self) -> t.Any:  # noqa: ANN401
+        """Decode the next JSON value."""
+        self.peek()
+        size = self._read_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value may just not be read completely yet
+                if not self._read(size):
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the next read
+                if end < len(self._buffer) or not self._read(size):
+                    self._pos = end
+                    return value
+            # Double the read size so large values are decoded in linear time
+            size *= 2
+
+    def end(self) -> None:
+        """Check nothing but whitespace follows the catalog."""
+        if self.peek():
+            msg = "Extra data"
+            raise self.error(msg)
+
+
+class _CatalogWriter:
+    """Write the parts of a catalog, formatted like `json_dumps` would."""
+
+    def __init__(self, dst: t.TextIO | None, *, indent: int | None):
+        self._dst = dst
+        self._indent = indent
+
+    def write(self, data: str) -> None:
+        if self._dst is not None:
+            self._dst.write(data)
+
+    def newline(self, depth: int) -> str:
+        """Get what precedes a member of an object or array at this depth."""
+        if self._indent is None:
+            return ""
+        return "\n" + " " * (self._indent * depth)
+
+    @property
+    def key_separator(self) -> str:
+        return ":" if self._indent is None else ": "
+
+    def dumps(self, value: t.Any, depth: int) -> str:  # noqa: ANN401
+        """Format a value nested at this depth."""
+        if self._indent is None:
+            return json_dumps(value, separators=(",", ":"))
+        return json_dumps(value, indent=self._indent).replace(
+            "\n",
+            self.newline(depth),
+        )
+
+
+def process_catalog(
+    src: t.TextIO,
+    dst: t.TextIO | None = None,
+    *,
+    visit_stream: Callable[[dict[str, t.Any]], None] | None = None,
+    read_size: int = CATALOG_READ_SIZE,
+    indent: int | None = None,
+) -> None:
+    """Validate a catalog, and optionally process and write it one stream at a time.
+
+    The output is formatted like `json_dumps(catalog, indent=indent)`, or
+    compactly like `json_dumps(catalog, separators=(",", ":"))` without indent.
+
+    Args:
+        src: The catalog file to read.
+        dst: The file to write the processed catalog to, if any.
+        visit_stream: Called with every stream object, which it may update in place
+            before it is written.
+        read_size: Amount of the catalog file to read at once.
+        indent: Indentation of the output, for humans to read it.
+
+    Raises:
+        JSONDecodeError: if the catalog is not a valid JSON object.
+    """
+    scanner = _CatalogScanner(src, read_size=read_size)
+    writer = _CatalogWriter(dst, indent=indent)
+
+    scanner.expect("{")
+    writer.write("{")
+    if scanner.peek() == "}":
+        scanner.expect("}")
+        writer.write("}")
+    else:
+        separator = writer.newline(1)
+        while True:
+            key = scanner.value()
+            if not isinstance(key, str):
+                msg = "Expecting property name enclosed in double quotes"
+                raise scanner.error(msg)
+            scanner.expect(":")
+            writer.write(f"{separator}{json_dumps(key)}{writer.key_separator}")
+            separator = f",{writer.newline(1)}"
+
+            if key == STREAMS_KEY and scanner.peek() == "[":
+                _process_streams(scanner, writer, visit_stream)
+            else:
+                writer.write(writer.dumps(scanner.value(), depth=1))
+
+            if scanner.expect(",}") == "}":
+                break
+        writer.write(f"{writer.newline(0)}}}")
+    scanner.end()
+
+
+def _process_streams(
+    scanner: _CatalogScanner,
+    writer: _CatalogWriter,
+    visit_stream: Callable[[dict[str, t.Any]], None] | None,
+) -> None:
+    scanner.expect("[")
+    if scanner.peek() == "]":
+        scanner.expect("]")
+        writer.write("[]")
+        return
+
+    writer.write("[")
+    separator = writer.newline(2)
+    while True:
+        stream = scanner.value()
+        if visit_stream is not None and isinstance(stream, dict):
+            visit_stream(stream)
+        writer.write(f"{separator}{writer.dumps(stream, depth=2)}")
+        separator = f",{writer.newline(2)}"
+        if scanner.expect(",]") == "]":
+            break
+    writer.write(f"{writer.newline(1)}]")
+
+
+def format_catalog(catalog: str, *, indent: int = 2) -> str:
+    """Pretty-print a catalog for humans to read.
+
+    Args:
+        catalog: The catalog document, as stored by Meltano.
+        indent: Indentation of the output.
+
+    Returns:
+        The indented catalog, or the document as is if it's not a valid catalog.
+    """
+    output = io.StringIO()
+    try:
+        process_catalog(io.StringIO(catalog), output, indent=indent)
+    except json.JSONDecodeError:
+        return catalog
+    return output.getvalue()
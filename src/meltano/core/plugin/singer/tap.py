@@ -5,12 +5,17 @@ from __future__ import annotations
 import asyncio
 import asyncio.subprocess
 import json
+import math
+import os
 import shutil
 import sys
+import time
 import typing as t
-from contextlib import suppress
+import weakref
+from contextlib import contextmanager, suppress
+from dataclasses import asdict
 from functools import lru_cache, reduce
-from hashlib import sha1
+from hashlib import sha1, sha256
 from io import StringIO
 from itertools import takewhile
 
@@ -26,6 +31,8 @@ from meltano.core.utils import file_has_data, flatten
 
 from . import PluginType, SingerPlugin
 from .catalog import (
+    SELECTED_KEY,
+    ListSelectedExecutor,
     MetadataExecutor,
     MetadataRule,
     SchemaExecutor,
@@ -34,8 +41,17 @@ from .catalog import (
     select_filter_metadata_rules,
     select_metadata_rules,
 )
+from .catalog_cache import SharedCatalogCache
+from .catalog_fingerprint import (
+    diff_fingerprints,
+    fingerprint_catalog,
+    read_fingerprints,
+    write_fingerprints,
+)
+from .catalog_streaming import CATALOG_READ_SIZE, process_catalog
 
 if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from sqlalchemy.orm import Session
@@ -43,10 +59,18 @@ if t.TYPE_CHECKING:
     from meltano.core.plugin_invoker import PluginInvoker
     from meltano.core.project import Project
 
-    from .catalog import CatalogDict
+    from .catalog import CatalogDict, StreamPartition
+    from .catalog_fingerprint import CatalogChanges
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# Catalogs being rediscovered in the background, by invoker, along with the shared
+# catalog cache to update once they're swapped in
+_catalog_refreshes: weakref.WeakKeyDictionary[
+    PluginInvoker,
+    tuple[asyncio.Task[bool], tuple[SharedCatalogCache, str] | None],
+] = weakref.WeakKeyDictionary()
+
 
 async def _stream_redirect(
     stream: asyncio.StreamReader | None,
@@ -67,6 +91,36 @@ async def _stream_redirect(
             file_like_obj.write(data.decode(encoding) if write_str else data)
 
 
+def _file_digest(path: Path) -> str:
+    digest = sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(CATALOG_READ_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def _open_catalog_for_writing(catalog_path: Path) -> Iterator[t.TextIO]:
+    # Write to a temporary file that replaces the catalog once complete, so an
+    # interrupted write never leaves a truncated catalog behind
+    tmp_path = catalog_path.with_suffix(".json.tmp")
+    try:
+        with tmp_path.open("w") as catalog_file:
+            yield catalog_file
+    except BaseException:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+        raise
+    tmp_path.replace(catalog_path)
+
+
+def _write_catalog(catalog_path: Path, catalog: CatalogDict) -> None:
+    # Catalogs are only read by extractors and Meltano, so they're stored
+    # compactly and pretty-printed when dumped for humans
+    with _open_catalog_for_writing(catalog_path) as catalog_file:
+        catalog_file.write(json_dumps(catalog, separators=(",", ":")))
+
+
 class _TextIOWriter:
     """Adapter to use a text IO stream as a SubprocessOutputWriter."""
 
@@ -159,6 +213,26 @@ class SingerTap(SingerPlugin):
             kind=SettingKind.BOOLEAN,
             value=True,
         ),
+        SettingDefinition(
+            name="_catalog_max_age",
+            kind=SettingKind.INTEGER,
+            value=0,
+        ),
+        SettingDefinition(
+            name="_catalog_refresh_age",
+            kind=SettingKind.INTEGER,
+            value=0,
+        ),
+        SettingDefinition(
+            name="_catalog_streaming",
+            kind=SettingKind.BOOLEAN,
+            value=False,
+        ),
+        SettingDefinition(
+            name="_stream_partitions",
+            kind=SettingKind.INTEGER,
+            value=1,
+        ),
     ]
 
     def exec_args(self, plugin_invoker):  # noqa: ANN001, ANN201
@@ -204,6 +278,10 @@ class SingerTap(SingerPlugin):
             "config": f"tap.{self.instance_uuid}.config.json",
             "catalog": "tap.properties.json",
             "catalog_cache_key": "tap.properties.cache_key",
+            "catalog_rules_cache_key": "tap.properties.rules_cache_key",
+            "catalog_discovered": "tap.properties.discovered",
+            "catalog_refresh": "tap.properties.refresh.json",
+            "catalog_fingerprints": "tap.properties.fingerprints.json",
             "state": "state.json",
             "singer_sdk_logging": "tap.singer_sdk_logging.json",
             "pipelinewise_singer_logging": "tap.pipelinewise_logging.conf",
@@ -349,14 +427,14 @@ class SingerTap(SingerPlugin):
         with suppress(PluginLacksCapabilityError):
             await self.discover_catalog(plugin_invoker)
 
-    async def _get_catalog(self, plugin_invoker: PluginInvoker) -> Path:
+    async def _get_catalog(self, plugin_invoker: PluginInvoker) -> tuple[Path, bool]:
         """Get the user-provided or discovered catalog file.
 
         Args:
             plugin_invoker: The invocation handler of the plugin instance.
 
         Returns:
-            Path to the catalog file.
+            Path to the catalog file, and whether discovery was run to get it.
 
         Raises:
             PluginExecutionError: if discovery could not be performed
@@ -366,6 +444,7 @@ class SingerTap(SingerPlugin):
         elt_context = plugin_invoker.context
 
         if custom_catalog_filename := plugin_invoker.plugin_config_extras["_catalog"]:
+            self._invalidate_catalog_rules_cache(plugin_invoker)
             custom_catalog_path = plugin_invoker.project.root / custom_catalog_filename
             try:
                 shutil.copy(custom_catalog_path, catalog_path)
@@ -374,12 +453,14 @@ class SingerTap(SingerPlugin):
                 raise PluginExecutionError(msg) from err
 
             logger.info("Using custom catalog in %s", custom_catalog_path)
-            return catalog_path
+            return catalog_path, False
 
         use_cached_catalog = (
             not (elt_context and elt_context.should_refresh_catalog())
             and plugin_invoker.plugin_config_extras["_use_cached_catalog"]
         )
+        max_age = plugin_invoker.plugin_config_extras["_catalog_max_age"]
+        expired = False
 
         if catalog_path.exists() and use_cached_catalog:
             with suppress(FileNotFoundError):
@@ -387,16 +468,59 @@ class SingerTap(SingerPlugin):
                 new_cache_key = self.catalog_cache_key(plugin_invoker)
 
                 if cached_key == new_cache_key:
-                    logger.debug("Using cached catalog file")
-                    return catalog_path
-            logger.debug("Cached catalog is outdated, running discovery...")
+                    age = self._catalog_age(plugin_invoker)
+                    if not max_age or age < max_age:
+                        refresh_age = plugin_invoker.plugin_config_extras[
+                            "_catalog_refresh_age"
+                        ]
+                        if refresh_age and age >= refresh_age:
+                            self._start_catalog_refresh(plugin_invoker)
+                        logger.debug("Using cached catalog file")
+                        return catalog_path, False
+
+                    logger.info(
+                        "Cached catalog is older than %s seconds, running discovery...",
+                        max_age,
+                    )
+                    expired = True
+            if not expired:
+                logger.debug("Cached catalog is outdated, running discovery...")
 
-        # We're gonna generate a new catalog, so delete the cache key.
+        # We're gonna generate a new catalog, so delete the cache keys.
         with suppress(FileNotFoundError):
             catalog_cache_key_path.unlink()
+        self._invalidate_catalog_rules_cache(plugin_invoker)
+
+        if (
+            use_cached_catalog
+            and not expired
+            and (shared := self._shared_catalog_cache(plugin_invoker))
+        ):
+            shared_cache, shared_key = shared
+            discovered_at = shared_cache.get(shared_key, catalog_path)
+            if discovered_at is not None:
+                age = time.time() - discovered_at
+                if not max_age or age < max_age:
+                    self._mark_catalog_discovered(
+                        plugin_invoker,
+                        discovered_at=discovered_at,
+                    )
+                    refresh_age = plugin_invoker.plugin_config_extras[
+                        "_catalog_refresh_age"
+                    ]
+                    if refresh_age and age >= refresh_age:
+                        self._start_catalog_refresh(plugin_invoker)
+                    return catalog_path, False
+
+                logger.info(
+                    "Shared cached catalog is older than %s seconds, "
+                    "running discovery...",
+                    max_age,
+                )
 
         await self.run_discovery(plugin_invoker, catalog_path)
-        return catalog_path
+        self._mark_catalog_discovered(plugin_invoker)
+        return catalog_path, True
 
     async def discover_catalog(self, plugin_invoker: PluginInvoker) -> None:
         """Perform catalog discovery.
@@ -407,12 +531,15 @@ class SingerTap(SingerPlugin):
         Returns:
             None
         """
-        catalog_path = await self._get_catalog(plugin_invoker)
+        catalog_path, discovered = await self._get_catalog(plugin_invoker)
 
         # test for the result to be a valid catalog
         try:
             with catalog_path.open() as catalog_file:
-                json.load(catalog_file)
+                if plugin_invoker.plugin_config_extras["_catalog_streaming"]:
+                    process_catalog(catalog_file)
+                else:
+                    json.load(catalog_file)
         except Exception as err:
             catalog_path.unlink()
             msg = f"Catalog discovery failed: {err}"
@@ -425,6 +552,183 @@ class SingerTap(SingerPlugin):
 
             raise PluginExecutionError(msg) from err
 
+        # Only share catalogs once they're known to be valid
+        if discovered and (shared := self._shared_catalog_cache(plugin_invoker)):
+            shared_cache, shared_key = shared
+            shared_cache.put(shared_key, catalog_path)
+
+    def _shared_catalog_cache(
+        self,
+        plugin_invoker: PluginInvoker,
+    ) -> tuple[SharedCatalogCache, str] | None:
+        """Get the shared catalog cache, and the key of the catalog of this extractor.
+
+        Args:
+            plugin_invoker: The invocation handler of the plugin instance.
+
+        Returns:
+            The shared catalog cache and key, or None if no shared catalog cache is
+            configured or the catalog of this extractor can't be cached.
+        """
+        if not plugin_invoker.plugin_config_extras["_use_cached_catalog"]:
+            return None
+        if not (
+            shared_cache := SharedCatalogCache.from_project(plugin_invoker.project)
+        ):
+            return None
+        if not (cache_key := self.catalog_cache_key(plugin_invoker)):
+            return None
+        return shared_cache, shared_cache.key(plugin_invoker.plugin, cache_key)
+
+    def _mark_catalog_discovered(
+        self,
+        plugin_invoker: PluginInvoker,
+        *,
+        discovered_at: float | None = None,
+    ) -> None:
+        # Holds the digest of the discovered catalog, and is modified when it was
+        # discovered, since the catalog file itself is rewritten by catalog rules
+        discovered_path = plugin_invoker.files["catalog_discovered"]
+        discovered_path.write_text(_file_digest(plugin_invoker.files["catalog"]))
+        if discovered_at is not None:
+            # Catalogs from the shared catalog cache may have been discovered long ago
+            os.utime(discovered_path, (discovered_at, discovered_at))
+        self._detect_catalog_changes(plugin_invoker)
+
+    @staticmethod
+    def _detect_catalog_changes(plugin_invoker: PluginInvoker) -> CatalogChanges | None:
+        """Compare the discovered catalog to the previous discovery, and log changes.
+
+        Only the fingerprints of the previously discovered streams are kept, so
+        the previous catalog doesn't need to be read.
+
+        Args:
+            plugin_invoker: The invocation handler of the plugin instance.
+
+        Returns:
+            The changes since the previous discovery, or None if there is nothing
+            to compare the catalog to.
+        """
+        fingerprints_path = plugin_invoker.files["catalog_fingerprints"]
+        try:
+            with plugin_invoker.files["catalog"].open() as catalog_file:
+                fingerprints = fingerprint_catalog(catalog_file)
+        except (OSError, json.JSONDecodeError):
+            # Invalid catalogs are reported once validated, and the next valid one
+            # is compared to the last valid one
+            return None
+
+        previous = read_fingerprints(fingerprints_path)
+        write_fingerprints(fingerprints_path, fingerprints)
+        if previous is None:
+            return None
+
+        changes = diff_fingerprints(previous, fingerprints)
+        if changes:
+            logger.info(
+                "Catalog schema changed since the previous discovery",
+                added_streams=changes.added_streams,
+                removed_streams=changes.removed_streams,
+                changed_streams={
+                    stream_id: asdict(stream_changes)
+                    for stream_id, stream_changes in changes.changed_streams.items()
+                },
+            )
+        else:
+            logger.debug("Catalog schema is unchanged since the previous discovery")
+        return changes
+
+    @staticmethod
+    def _catalog_age(plugin_invoker: PluginInvoker) -> float:
+        try:
+            discovered = plugin_invoker.files["catalog_discovered"].stat().st_mtime
+        except FileNotFoundError:
+            return math.inf
+        return time.time() - discovered
+
+    def _start_catalog_refresh(self, plugin_invoker: PluginInvoker) -> None:
+        """Rediscover the catalog in the background, while the cached one is used.
+
+        The refreshed catalog is swapped in for the next run when the invoker is
+        cleaned up, see `swap_refreshed_catalog_hook`.
+
+        Args:
+            plugin_invoker: The invocation handler of the plugin instance.
+        """
+        if plugin_invoker in _catalog_refreshes:
+            return
+
+        logger.info("Cached catalog is stale, running discovery in the background")
+        _catalog_refreshes[plugin_invoker] = (
+            asyncio.ensure_future(self._refresh_catalog(plugin_invoker)),
+            # Extras are no longer available once the invoker is cleaned up
+            self._shared_catalog_cache(plugin_invoker),
+        )
+
+    async def _refresh_catalog(self, plugin_invoker: PluginInvoker) -> bool:
+        """Discover the catalog to the refresh file.
+
+        Args:
+            plugin_invoker: The invocation handler of the plugin instance.
+
+        Returns:
+            True if a valid catalog was discovered, False otherwise.
+        """
+        refresh_path = plugin_invoker.files["catalog_refresh"]
+        try:
+            await self.run_discovery(plugin_invoker, refresh_path)
+            with refresh_path.open() as refresh_file:
+                process_catalog(refresh_file)
+        except Exception as err:  # noqa: BLE001
+            # The cached catalog is still good to use
+            logger.warning("Background catalog discovery failed: %s", err)
+            with suppress(FileNotFoundError):
+                refresh_path.unlink()
+            return False
+        return True
+
+    @hook("before_cleanup")
+    async def swap_refreshed_catalog_hook(self, plugin_invoker: PluginInvoker) -> None:
+        """Replace the cached catalog with the one rediscovered in the background.
+
+        Args:
+            plugin_invoker: The invocation handler of the plugin instance.
+        """
+        if not (refresh := _catalog_refreshes.pop(plugin_invoker, None)):
+            return
+
+        task, shared = refresh
+        if not await task:
+            return
+
+        catalog_path = plugin_invoker.files["catalog"]
+        refresh_path = plugin_invoker.files["catalog_refresh"]
+        discovered_path = plugin_invoker.files["catalog_discovered"]
+
+        try:
+            cached_digest = discovered_path.read_text()
+        except FileNotFoundError:
+            cached_digest = None
+
+        if _file_digest(refresh_path) == cached_digest:
+            logger.info("Refreshed catalog is unchanged")
+            if shared:
+                shared_cache, shared_key = shared
+                shared_cache.put(shared_key, refresh_path)
+            refresh_path.unlink()
+            discovered_path.touch()
+            return
+
+        logger.info(
+            "Refreshed catalog differs from the cached one, using it from now on"
+        )
+        refresh_path.replace(catalog_path)
+        self._invalidate_catalog_rules_cache(plugin_invoker)
+        self._mark_catalog_discovered(plugin_invoker)
+        if shared:
+            shared_cache, shared_key = shared
+            shared_cache.put(shared_key, catalog_path)
+
     async def run_discovery(
         self,
         plugin_invoker: PluginInvoker,
@@ -568,26 +872,49 @@ class SingerTap(SingerPlugin):
 
         catalog_path = plugin_invoker.files["catalog"]
         catalog_cache_key_path = plugin_invoker.files["catalog_cache_key"]
+        catalog_rules_cache_key_path = plugin_invoker.files["catalog_rules_cache_key"]
+
+        rules_cache_key = self.catalog_rules_cache_key(plugin_invoker)
+        if rules_cache_key:
+            with suppress(FileNotFoundError):
+                if catalog_rules_cache_key_path.read_text() == (
+                    self._catalog_rules_cache_value(rules_cache_key, catalog_path)
+                ):
+                    logger.debug("Using cached catalog with rules applied")
+                    return
 
         try:
-            with catalog_path.open() as catalog_file:
-                catalog = json.load(catalog_file)
+            if config["_catalog_streaming"]:
+                self._apply_catalog_rules_streaming(
+                    catalog_path,
+                    schema_rules,
+                    metadata_rules,
+                )
+            else:
+                with catalog_path.open() as catalog_file:
+                    catalog = json.load(catalog_file)
 
-            if schema_rules:
-                SchemaExecutor(schema_rules).visit(catalog)  # type: ignore[attr-defined]
+                if schema_rules:
+                    SchemaExecutor(schema_rules).visit(catalog)  # type: ignore[attr-defined]
 
-            if metadata_rules:
-                self.warn_property_not_found(metadata_rules, catalog)
-                MetadataExecutor(metadata_rules).visit(catalog)  # type: ignore[attr-defined]
+                if metadata_rules:
+                    self.warn_property_not_found(metadata_rules, catalog)
+                    MetadataExecutor(metadata_rules).visit(catalog)  # type: ignore[attr-defined]
 
-            with catalog_path.open("w") as catalog_f:
-                catalog_f.write(json_dumps(catalog, indent=2))
+                _write_catalog(catalog_path, catalog)
 
             if cache_key := self.catalog_cache_key(plugin_invoker):
                 catalog_cache_key_path.write_text(cache_key)
             else:
                 with suppress(FileNotFoundError):
                     catalog_cache_key_path.unlink()
+
+            if rules_cache_key:
+                catalog_rules_cache_key_path.write_text(
+                    self._catalog_rules_cache_value(rules_cache_key, catalog_path),
+                )
+            else:
+                self._invalidate_catalog_rules_cache(plugin_invoker)
         except FileNotFoundError as err:
             msg = "Applying catalog rules failed: catalog file is missing."
             raise PluginExecutionError(msg) from err
@@ -596,6 +923,189 @@ class SingerTap(SingerPlugin):
             msg = f"Applying catalog rules failed: catalog file is invalid: {err}"
             raise PluginExecutionError(msg) from err
 
+    def _apply_catalog_rules_streaming(
+        self,
+        catalog_path: Path,
+        schema_rules: list[SchemaRule],
+        metadata_rules: list[MetadataRule],
+    ) -> None:
+        """Apply catalog rules to the catalog one stream at a time.
+
+        Args:
+            catalog_path: The catalog file to apply the rules to.
+            schema_rules: The schema rules to apply.
+            metadata_rules: The metadata rules to apply.
+        """
+        schema_executor = SchemaExecutor(schema_rules)
+        metadata_executor = MetadataExecutor(metadata_rules)
+
+        # Rules for a single stream, to warn about streams and properties not found
+        stream_rules: dict[str, list[MetadataRule]] = {}
+        for rule in metadata_rules:
+            if (stream_id := self._rule_stream_id(rule)) is not None:
+                stream_rules.setdefault(stream_id, []).append(rule)
+        found_streams: set[str] = set()
+
+        def visit_stream(stream: dict[str, t.Any]) -> None:
+            catalog = {"streams": [stream]}
+            if schema_rules:
+                schema_executor.visit(catalog)  # type: ignore[attr-defined]
+
+            if metadata_rules:
+                stream_id = stream.get("tap_stream_id")
+                if stream_id in stream_rules:
+                    found_streams.add(stream_id)
+                    for rule in stream_rules[stream_id]:
+                        self._warn_rule_property_not_found(rule, stream)
+                metadata_executor.visit(catalog)  # type: ignore[attr-defined]
+
+        self._rewrite_catalog(catalog_path, visit_stream)
+
+        for stream_id in stream_rules.keys() - found_streams:
+            self._warn_missing_stream(stream_id)
+
+    @staticmethod
+    def _rewrite_catalog(
+        catalog_path: Path,
+        visit_stream: Callable[[dict[str, t.Any]], None],
+    ) -> None:
+        """Process the catalog one stream at a time, and replace it with the result.
+
+        Args:
+            catalog_path: The catalog file to process.
+            visit_stream: Called with every stream of the catalog, to update it.
+        """
+        # The catalog is only replaced once it's closed, which Windows requires
+        with (
+            _open_catalog_for_writing(catalog_path) as dst,
+            catalog_path.open() as src,
+        ):
+            process_catalog(src, dst, visit_stream=visit_stream)
+
+    @hook("before_invoke")
+    async def apply_stream_partition_hook(
+        self,
+        plugin_invoker: PluginInvoker,
+        exec_args: tuple[str, ...] = (),
+    ) -> None:
+        """Restrict the catalog and state to a stream partition if in sync mode.
+
+        Args:
+            plugin_invoker: the plugin invoker running
+            exec_args: the arguments to pass to the tap
+        """
+        # Apply only in sync mode (i.e. no args)
+        if exec_args:
+            return
+
+        elt_context = plugin_invoker.context
+        if not elt_context or elt_context.stream_partition is None:
+            return
+
+        await self.apply_stream_partition(
+            plugin_invoker,
+            elt_context.stream_partition,
+        )
+
+    async def apply_stream_partition(
+        self,
+        plugin_invoker: PluginInvoker,
+        stream_partition: StreamPartition,
+    ) -> None:
+        """Deselect the streams of other partitions, and drop their state.
+
+        Args:
+            plugin_invoker: the plugin invoker running
+            stream_partition: the partition of the selected streams to extract
+
+        Raises:
+            PluginExecutionError: if the plugin does not support entity selection,
+                or the catalog is missing or invalid
+        """
+        if (
+            "catalog" not in plugin_invoker.capabilities
+            and "properties" not in plugin_invoker.capabilities
+        ):
+            msg = (
+                f"Extractor '{self.name}' does not support entity selection, "
+                "so its streams can't be partitioned"
+            )
+            raise PluginExecutionError(msg)
+
+        catalog_path = plugin_invoker.files["catalog"]
+        streaming = plugin_invoker.plugin_config_extras["_catalog_streaming"]
+
+        selected = ListSelectedExecutor()
+        try:
+            with catalog_path.open() as catalog_file:
+                if streaming:
+                    process_catalog(
+                        catalog_file,
+                        visit_stream=lambda stream: selected.visit(  # type: ignore[attr-defined]
+                            {"streams": [stream]},
+                        ),
+                    )
+                else:
+                    catalog = json.load(catalog_file)
+                    selected.visit(catalog)  # type: ignore[attr-defined]
+        except (FileNotFoundError, json.JSONDecodeError) as err:
+            msg = f"Partitioning streams failed: catalog file is invalid: {err}"
+            raise PluginExecutionError(msg) from err
+
+        selected_streams = {
+            stream for stream, selection in selected.streams if selection
+        }
+        partition_streams = stream_partition.streams(selected_streams)
+
+        deselect = MetadataExecutor(
+            [
+                MetadataRule(
+                    tap_stream_id=stream,
+                    breadcrumb=[],
+                    key=SELECTED_KEY,
+                    value=False,
+                )
+                for stream in selected_streams - partition_streams
+            ],
+        )
+        if streaming:
+            self._rewrite_catalog(
+                catalog_path,
+                lambda stream: deselect.visit({"streams": [stream]}),  # type: ignore[attr-defined]
+            )
+        else:
+            deselect.visit(catalog)  # type: ignore[attr-defined]
+            _write_catalog(catalog_path, catalog)
+
+        # The catalog no longer holds just the result of the catalog rules
+        self._invalidate_catalog_rules_cache(plugin_invoker)
+
+        logger.info(
+            "Extracting stream partition",
+            partition=stream_partition.partition,
+            partitions=stream_partition.partitions,
+            streams=sorted(partition_streams),
+        )
+
+        state_path = plugin_invoker.files["state"]
+        if not file_has_data(state_path):
+            return
+
+        with state_path.open() as state_file:
+            state = json.load(state_file)
+
+        if isinstance(bookmarks := state.get("bookmarks"), dict):
+            state["bookmarks"] = {
+                stream: bookmark
+                for stream, bookmark in bookmarks.items()
+                if stream in partition_streams
+            }
+        if state.get("currently_syncing") not in partition_streams:
+            state.pop("currently_syncing", None)
+
+        with state_path.open("w") as state_file:
+            json.dump(state, state_file, indent=2)
+
     def catalog_cache_key(self, plugin_invoker):  # noqa: ANN001, ANN201
         """Get a cache key for the catalog.
 
@@ -635,6 +1145,44 @@ class SingerTap(SingerPlugin):
 
         return sha1(key_json.encode()).hexdigest()  # noqa: S324
 
+    def catalog_rules_cache_key(self, plugin_invoker):  # noqa: ANN001, ANN201
+        """Get a cache key for the catalog with catalog rules applied.
+
+        Args:
+            plugin_invoker: the plugin invoker running
+
+        Returns:
+            the cache key for the catalog with catalog rules applied, if plugin
+            catalog can be cached
+        """
+        if not (cache_key := self.catalog_cache_key(plugin_invoker)):
+            return None
+
+        # Schema and metadata rules are covered by the catalog cache key, but
+        # selection rules and selection filter rules are applied on top of it.
+        extras = plugin_invoker.plugin_config_extras
+        key_dict = {
+            "catalog_cache_key": cache_key,
+            "_select": extras["_select"],
+            "_select_filter": extras["_select_filter"],
+        }
+
+        key_json = json_dumps(key_dict)
+
+        return sha1(key_json.encode()).hexdigest()  # noqa: S324
+
+    @staticmethod
+    def _catalog_rules_cache_value(rules_cache_key: str, catalog_path: Path) -> str:
+        # The catalog file is rewritten by discovery, stream partitioning and
+        # users, so the cached key only holds for the file the rules were applied to
+        stat = catalog_path.stat()
+        return f"{rules_cache_key}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def _invalidate_catalog_rules_cache(plugin_invoker: PluginInvoker) -> None:
+        with suppress(FileNotFoundError):
+            plugin_invoker.files["catalog_rules_cache_key"].unlink()
+
     @staticmethod
     @lru_cache
     def _warn_missing_stream(stream_id: str) -> None:
@@ -678,20 +1226,39 @@ class SingerTap(SingerPlugin):
             if isinstance(stream, dict)  # type: ignore[redundant-expr]
         }
 
+        for rule in rules:
+            if (stream_id := self._rule_stream_id(rule)) is None:
+                continue
+            if not (s := stream_dict.get(stream_id)):
+                self._warn_missing_stream(stream_id)
+                continue
+            self._warn_rule_property_not_found(rule, s)
+
+    @staticmethod
+    def _rule_stream_id(rule: MetadataRule) -> str | None:
+        """Get the ID of the single stream a rule applies to, if any."""
+        if isinstance(rule.tap_stream_id, list) or "*" in rule.tap_stream_id:
+            return None
+        return rule.tap_stream_id
+
+    def _warn_rule_property_not_found(
+        self,
+        rule: MetadataRule,
+        stream: dict[str, t.Any],
+    ) -> None:
+        """Warn if the property of a rule is not found in the stream it applies to."""
+
         def is_not_star(x):  # noqa: ANN001, ANN202
             return "*" not in x
 
         def dict_get(dictionary, key):  # noqa: ANN001, ANN202
             return dictionary.get(key, {})
 
-        for rule in rules:
-            if isinstance(rule.tap_stream_id, list) or "*" in rule.tap_stream_id:
-                continue
-            if not (s := stream_dict.get(rule.tap_stream_id)):
-                self._warn_missing_stream(rule.tap_stream_id)
-                continue
-            path = tuple(takewhile(is_not_star, rule.breadcrumb))
-            if len(path) <= 1:
-                continue
-            if not reduce(dict_get, path, s.get("schema", {})):
-                self._warn_missing_property(rule.tap_stream_id, tuple(rule.breadcrumb))
+        path = tuple(takewhile(is_not_star, rule.breadcrumb))
+        if len(path) <= 1:
+            return
+        if not reduce(dict_get, path, stream.get("schema", {})):
+            self._warn_missing_property(
+                rule.tap_stream_id,  # type: ignore[arg-type]
+                tuple(rule.breadcrumb),
+            )
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from structlog.stdlib import get_logger
@@ -12,6 +15,7 @@ from meltano.core.behavior.hookable import hook
 from meltano.core.job import Payload
 from meltano.core.setting_definition import SettingDefinition
 from meltano.core.state_service import SINGER_STATE_KEY, StateService
+from meltano.core.state_store import DBStateStoreManager
 
 from . import PluginType, SingerPlugin
 
@@ -59,25 +63,13 @@ class BookmarkWriter:
         Args:
             line: raw json state line to decode/store
         """
-        if self.job is None:
-            logger.info(
-                "Running outside a Job context: "
-                "incremental state could not be updated.",
-            )
+        if (job := self._get_job()) is None:
             return
 
-        new_state = {}
-        try:
-            new_state = json.loads(line)
-        except Exception:  # noqa: BLE001
-            logger.warning(
-                "Received state is invalid, incremental state has not been updated",
-            )
+        if (new_state := self._parse_state(line)) is None:
             return
 
-        job = self.job
-        job.payload[SINGER_STATE_KEY] = new_state
-        job.payload_flags = Payload(max(self.payload_flag, job.payload_flags))
+        self._set_job_state(job, new_state)
 
         try:
             job.save(self.session)
@@ -102,6 +94,211 @@ class BookmarkWriter:
             )
             logger.debug(f"Incremental state: {new_state}")  # noqa: G004
 
+    def _get_job(self) -> Job | None:
+        if self.job is None:
+            logger.info(
+                "Running outside a Job context: "
+                "incremental state could not be updated.",
+            )
+        return self.job
+
+    def _parse_state(self, line: str) -> dict | None:
+        try:
+            return json.loads(line)
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "Received state is invalid, incremental state has not been updated",
+            )
+            return None
+
+    def _set_job_state(self, job: Job, new_state: dict) -> None:
+        job.payload[SINGER_STATE_KEY] = new_state
+        job.payload_flags = Payload(max(self.payload_flag, job.payload_flags))
+
+
+class CoalescingBookmarkWriter(BookmarkWriter):
+    """A bookmark writer that only persists the latest of many state messages.
+
+    Received state is applied to the job right away, but it is only written to
+    the state backend once `flush_interval` seconds have passed or `flush_count`
+    state messages were received since the last write, and when the writer is
+    closed. A write that is due while another one is still in progress happens
+    as soon as that one finished, and a timer makes sure the latest state is
+    written once `flush_interval` has passed even if no further state message
+    is received. Writes to remote state backends happen in a worker thread, so they
+    don't block the event loop proxying the pipeline IO. The job itself is
+    persisted by its heartbeat, and when the writer is closed.
+    """
+
+    def __init__(
+        self,
+        job: Job | None,
+        session: Session,
+        payload_flag: Payload = Payload.STATE,
+        state_service: StateService | None = None,
+        *,
+        flush_interval: float = 0,
+        flush_count: int = 0,
+    ):
+        """Initialize the `CoalescingBookmarkWriter`.
+
+        Args:
+            job: meltano el or meltano elt job associated with this invocation and whose
+                state will be updated.
+            session: SQLAlchemy session/engine object to be used to update state.
+            payload_flag: A payload flag.
+            state_service: `StateService` to use for bookmarking state.
+            flush_interval: Minimum number of seconds between state writes, or 0
+                to not write based on elapsed time.
+            flush_count: Number of received state messages after which state
+                is written, or 0 to not write based on the number of messages.
+        """
+        super().__init__(job, session, payload_flag, state_service)
+        self.flush_interval = flush_interval
+        self.flush_count = flush_count
+
+        self.states_received = 0
+        self.states_persisted = 0
+
+        self._pending: tuple[str, dict, Payload] | None = None
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._executor: ThreadPoolExecutor | None = None
+        self._future: Future | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    def writeline(self, line: str) -> None:
+        """Apply a state entry, and persist it if a flush is due.
+
+        Args:
+            line: raw json state line to decode/store
+        """
+        if (job := self._get_job()) is None:
+            return
+
+        if (new_state := self._parse_state(line)) is None:
+            return
+
+        self.states_received += 1
+        self._set_job_state(job, new_state)
+        self._pending = (job.job_name, dict(job.payload), job.payload_flags)
+        self._pending_count += 1
+
+        # A write in progress triggers the next one once it's done
+        if not self._writing():
+            self._flush_or_schedule()
+
+    async def close(self) -> None:
+        """Persist the latest received state and wait for all writes to finish."""
+        self._cancel_timer()
+        if self._pending is not None:
+            self._flush()
+
+        if self._future is not None:
+            await asyncio.wrap_future(self._future)
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        if self.job is not None and self.states_received:
+            try:
+                self.job.save(self.session)
+            except Exception as e:  # pragma: no cover  # noqa: BLE001
+                logger.warning("Failed to persist job to the system database: %s", e)
+
+            logger.info(
+                "Incremental state updates summary",
+                states_received=self.states_received,
+                states_persisted=self.states_persisted,
+            )
+
+    def _flush_due(self) -> bool:
+        if self.flush_count and self._pending_count >= self.flush_count:
+            return True
+
+        return bool(self.flush_interval) and (
+            time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def _writing(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def _flush_or_schedule(self) -> None:
+        if self._pending is None:
+            return
+
+        if self._flush_due():
+            self._flush()
+        elif self.flush_interval and self._timer is None:
+            delay = self._last_flush + self.flush_interval - time.monotonic()
+            self._timer = asyncio.get_running_loop().call_later(
+                max(delay, 0),
+                self._on_timer,
+            )
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        if not self._writing():
+            self._flush_or_schedule()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _flush(self) -> None:
+        if self._pending is None:
+            return
+
+        job_name, payload, payload_flags = self._pending
+        self._pending = None
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._cancel_timer()
+
+        # The system database state backend shares the session used by the
+        # event loop, so its writes can't be moved to another thread
+        if isinstance(self.state_service.state_store_manager, DBStateStoreManager):
+            self._persist(job_name, payload, payload_flags)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="meltano-state",
+            )
+        self._future = self._executor.submit(
+            self._persist,
+            job_name,
+            payload,
+            payload_flags,
+        )
+        # Done callbacks run in the worker thread, hand back to the event loop
+        loop = asyncio.get_running_loop()
+        self._future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(self._flush_or_schedule),
+        )
+
+    def _persist(self, job_name: str, payload: dict, payload_flags: Payload) -> None:
+        try:
+            self.state_service.update_state_store(
+                job_name,
+                payload,
+                payload_flags,
+            )
+        except Exception:
+            logger.warning(
+                "Unable to persist state, incremental state has not been updated",
+                exc_info=True,
+            )
+        else:
+            self.states_persisted += 1
+            logger.info(
+                f"Incremental state has been updated at {datetime.now(tz=timezone.utc)}.",  # noqa: E501, G004
+            )
+            logger.debug(f"Incremental state: {payload[SINGER_STATE_KEY]}")  # noqa: G004
+
 
 class SingerTarget(SingerPlugin):
     """A plugin for singer targets."""
@@ -184,13 +381,51 @@ class SingerTarget(SingerPlugin):
         if not elt_context or not elt_context.job or not elt_context.session:
             return
 
+        # Stream partitions only write part of the state, which is merged
+        # with the state of the other partitions once they all completed
         payload_flag = (
             Payload.INCOMPLETE_STATE
             if elt_context.should_merge_states()
+            or elt_context.stream_partition is not None
             else Payload.STATE
         )
 
+        settings = plugin_invoker.project.settings
+        flush_interval = settings.get("elt.state_flush_interval")
+        flush_count = settings.get("elt.state_flush_count")
+
+        bookmark_writer: BookmarkWriter
+        if flush_interval or flush_count:
+            bookmark_writer = CoalescingBookmarkWriter(
+                elt_context.job,
+                elt_context.session,
+                payload_flag,
+                flush_interval=flush_interval,
+                flush_count=flush_count,
+            )
+        else:
+            bookmark_writer = BookmarkWriter(
+                elt_context.job,
+                elt_context.session,
+                payload_flag,
+            )
+
         plugin_invoker.add_output_handler(
             plugin_invoker.StdioSource.STDOUT,
-            BookmarkWriter(elt_context.job, elt_context.session, payload_flag),
+            bookmark_writer,
+        )
+
+    @hook("before_cleanup")
+    async def close_bookmark_writer_hook(self, plugin_invoker: PluginInvoker) -> None:
+        """Before cleanup hook to persist any state held back by the bookmark writer.
+
+        Args:
+            plugin_invoker: The invocation handler of the plugin instance.
+        """
+        handlers = (plugin_invoker.output_handlers or {}).get(
+            plugin_invoker.StdioSource.STDOUT,
+            [],
         )
+        for handler in handlers:
+            if isinstance(handler, CoalescingBookmarkWriter):
+                await handler.close()
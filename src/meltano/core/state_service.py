@@ -26,6 +26,7 @@ from meltano.core.state_store import (
     MeltanoState,
     state_store_manager_from_project_settings,
 )
+from meltano.core.utils import merge
 
 if t.TYPE_CHECKING:
     from types import TracebackType
@@ -89,9 +90,14 @@ class StateService:
         Returns:
             A dict with state_ids as keys and state payloads as values.
         """
+        state_ids = list(self.state_store_manager.get_state_ids(state_id_pattern))
+        states = self.state_store_manager.get_many(state_ids)
         return {
-            state_id: self.get_state(state_id)
-            for state_id in self.state_store_manager.get_state_ids(state_id_pattern)
+            # Like `get_state`, without a JSON round trip for the state just read
+            state_id: merge(state.partial_state, state.completed_state)
+            if (state := states.get(state_id))
+            else {}
+            for state_id in state_ids
         }
 
     def _get_or_create_job(self, job: Job | str) -> Job:
@@ -174,12 +180,31 @@ class StateService:
             state_to_add_to.job_name,
             new_state_dict,
         )
-        partial_state = (
-            new_state_dict if payload_flags == Payload.INCOMPLETE_STATE else {}
+        self.update_state_store(
+            state_to_add_to.job_name,
+            new_state_dict,
+            payload_flags,
         )
-        completed_state = new_state_dict if payload_flags == Payload.STATE else {}
+
+    def update_state_store(
+        self,
+        state_id: str,
+        new_state: dict,
+        payload_flags: Payload = Payload.STATE,
+    ) -> None:
+        """Write state for the given state_id to the state backend.
+
+        Unlike `add_state`, this does not touch the system database `Job`.
+
+        Args:
+            state_id: the state_id to write state for.
+            new_state: the state to write.
+            payload_flags: whether the state is complete or partial.
+        """
+        partial_state = new_state if payload_flags == Payload.INCOMPLETE_STATE else {}
+        completed_state = new_state if payload_flags == Payload.STATE else {}
         job_state = MeltanoState(
-            state_id=state_to_add_to.job_name,
+            state_id=state_id,
             partial_state=partial_state,
             completed_state=completed_state,
         )
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import sys
 import typing as t
+from hashlib import sha256
+from pathlib import Path
 from urllib.parse import urlparse
 
 from structlog.stdlib import get_logger
@@ -12,6 +14,10 @@ from meltano.core.behavior.addon import MeltanoAddon
 from meltano.core.db import project_engine
 from meltano.core.error import MeltanoError
 from meltano.core.state_store.base import MeltanoState, StateStoreManager
+from meltano.core.state_store.cache import (
+    CachedStateStoreManager,
+    supports_state_versions,
+)
 from meltano.core.state_store.db import DBStateStoreManager
 
 if sys.version_info >= (3, 11):
@@ -30,6 +36,7 @@ else:
     from importlib_metadata import EntryPoints, entry_points
 
 __all__ = [
+    "CachedStateStoreManager",
     "DBStateStoreManager",
     "MeltanoState",
     "StateBackend",
@@ -122,13 +129,30 @@ def state_store_manager_from_project_settings(
 
     scheme = urlparse(state_backend_uri).scheme
     manager_factory = StateBackend.get_manager_factory(scheme=scheme)
-    return manager_factory(
+    manager = manager_factory(
         **_settings_to_manager_kwargs(
             settings=settings_service,
             namespace=SCHEME_TO_NAMESPACE.get(scheme, scheme),
         )
     )
 
+    if not (cache_dir := settings_service.get("state_cache.dir")):
+        return manager
+    if not supports_state_versions(manager):
+        logger.warning(
+            "State backend does not support state versions, not caching state",
+            state_backend=manager.label,
+        )
+        return manager
+
+    # Backends are kept apart, without writing their URI and credentials to disk
+    backend_key = sha256(state_backend_uri.encode()).hexdigest()
+    logger.debug("Caching state locally", state_cache_dir=cache_dir)
+    return CachedStateStoreManager(
+        manager,
+        settings_service.project.root / Path(cache_dir).expanduser() / backend_key,
+    )
+
 
 def _settings_to_manager_kwargs(
     *,
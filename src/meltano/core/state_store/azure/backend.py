@@ -5,18 +5,24 @@ from __future__ import annotations
 import typing as t
 from functools import cached_property
 
-from azure.storage.blob import BlobServiceClient
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceModifiedError
+from azure.storage.blob import BlobPrefix, BlobServiceClient, ContentSettings
 
 from meltano.core.error import MeltanoError
 from meltano.core.state_store.filesystem import (
     CloudStateStoreManager,
 )
 
+if t.TYPE_CHECKING:
+    from meltano.core.state_store.base import MeltanoState
+
 
 class AZStorageStateStoreManager(CloudStateStoreManager):
     """State backend for Azure Blob Storage."""
 
     label: str = "Azure Blob Storage"
+    supports_conditional_writes = True
 
     def __init__(
         self,
@@ -94,6 +100,95 @@ class AZStorageStateStoreManager(CloudStateStoreManager):
             "Read https://learn.microsoft.com/en-us/azure/storage/common/storage-configure-connection-string for more information.",  # noqa: E501
         )
 
+    def get_with_version(
+        self,
+        state_id: str,
+    ) -> tuple[MeltanoState | None, str | None]:
+        """Get the job state for the given state_id, along with its ETag.
+
+        Args:
+            state_id: the name of the job to get state for.
+
+        Returns:
+            The current state and its ETag, or None and None if there is no state.
+
+        Raises:
+            Exception: if error not indicating file is not found is thrown
+        """
+        blob_client = self.client.get_blob_client(
+            container=self.container_name,
+            blob=self.get_state_path(state_id),
+        )
+        try:
+            downloader = blob_client.download_blob()
+        except Exception as e:
+            if self.is_file_not_found_error(e):
+                return None, None
+            raise e  # noqa: TRY201
+        state = self.decode_state(state_id, downloader.readall())
+        return state, downloader.properties.etag
+
+    def get_version(self, state_id: str) -> str | None:
+        """Get the ETag of the job state for the given state_id, without reading it.
+
+        Args:
+            state_id: the name of the job to get the state version for.
+
+        Returns:
+            The ETag of the current state, or None if there is no state.
+
+        Raises:
+            Exception: if error not indicating file is not found is thrown
+        """
+        blob_client = self.client.get_blob_client(
+            container=self.container_name,
+            blob=self.get_state_path(state_id),
+        )
+        try:
+            properties = blob_client.get_blob_properties()
+        except Exception as e:
+            if self.is_file_not_found_error(e):
+                return None
+            raise e  # noqa: TRY201
+        return properties.etag
+
+    def set_if_version(self, state: MeltanoState, version: str | None) -> bool:
+        """Set the job state for the given state_id, unless its ETag changed.
+
+        Args:
+            state: the state to set.
+            version: the ETag of the state the new state is based on, or None if
+                there was no state.
+
+        Returns:
+            True if the state was set, False if it changed in the meantime.
+        """
+        blob_client = self.client.get_blob_client(
+            container=self.container_name,
+            blob=self.get_state_path(state.state_id),
+        )
+        # Without an ETag, the upload fails if the blob exists
+        condition: dict[str, t.Any] = (
+            {
+                "overwrite": True,
+                "etag": version,
+                "match_condition": MatchConditions.IfNotModified,
+            }
+            if version
+            else {"overwrite": False}
+        )
+        try:
+            blob_client.upload_blob(
+                self.encode_state(state),
+                content_settings=ContentSettings(
+                    content_type=self.compression.content_type,
+                ),
+                **condition,
+            )
+        except (ResourceExistsError, ResourceModifiedError):
+            return False
+        return True
+
     def delete_file(self, file_path: str) -> None:
         """Delete the file/blob at the given path.
 
@@ -132,6 +227,25 @@ class AZStorageStateStoreManager(CloudStateStoreManager):
         ):
             yield blob.name
 
+    def iter_state_ids(self, state_id_prefix: str = "") -> t.Iterator[str]:
+        """Iterate over the state_ids with a given prefix, one listing page at a time.
+
+        Args:
+            state_id_prefix: the prefix of the state_ids to list
+
+        Yields:
+            The next state_id.
+        """
+        state_dirs_prefix = self.get_state_dirs_prefix()
+        container_client = self.client.get_container_client(self.container_name)
+        for item in container_client.walk_blobs(
+            name_starts_with=self.get_state_dirs_prefix(state_id_prefix),
+            delimiter=self.delimiter,
+        ):
+            # Blobs right under the prefix are listed too
+            if isinstance(item, BlobPrefix):
+                yield item.name.removeprefix(state_dirs_prefix).rstrip(self.delimiter)
+
     def copy_file(self, src: str, dst: str) -> None:
         """Copy a file from one location to another.
 
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import dataclasses
 import json
+import random
 import sys
 import typing as t
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from time import sleep
+
+import structlog
 
 if sys.version_info >= (3, 11):
     from typing import Self  # noqa: ICN003
@@ -20,6 +24,13 @@ if t.TYPE_CHECKING:
     from collections.abc import Generator, Iterable
     from types import TracebackType
 
+logger = structlog.stdlib.get_logger(__name__)
+
+# Number of times a conditional write of partial state is attempted, and the
+# number of seconds to wait at most before the first retry, doubled every retry
+CONDITIONAL_WRITE_ATTEMPTS = 10
+CONDITIONAL_WRITE_BACKOFF_SECONDS = 0.05
+
 
 class UnsupportedStateBackendURIError(Exception):
     """Provided state backend URI is not supported."""
@@ -33,6 +44,10 @@ class StateIDLockedError(Exception):
     """A job attempted to acquire a lock on an already-locked state ID."""
 
 
+class StateUpdateConflictError(Exception):
+    """State kept being updated concurrently while a job attempted to update it."""
+
+
 @dataclasses.dataclass(slots=True)
 class MeltanoState:
     """State object."""
@@ -113,6 +128,14 @@ class MeltanoState:
 class StateStoreManager(ABC):
     """Base state store manager."""
 
+    # Whether the store implements `get_with_version` and `set_if_version`
+    supports_conditional_writes: bool = False
+
+    # Whether state is updated with conditional writes, which only succeed if the
+    # state wasn't updated since it was read, rather than under a lock. Only
+    # enabled if the store supports conditional writes.
+    conditional_writes: bool = False
+
     def __init__(self, **kwargs: t.Any) -> None:  # noqa: B027
         """Initialize state store manager.
 
@@ -149,6 +172,10 @@ class StateStoreManager(ABC):
         Args:
             state: the state to set.
         """
+        if self.conditional_writes:
+            self._update_conditionally(state)
+            return
+
         state_to_write = state
         with self.acquire_lock(state.state_id, retry_seconds=1):
             if not state.is_complete() and (current_state := self.get(state.state_id)):
@@ -157,6 +184,46 @@ class StateStoreManager(ABC):
 
             self.set(state_to_write)
 
+    def _update_conditionally(self, state: MeltanoState) -> None:
+        """Update state for the given `state_id` without taking a lock.
+
+        Partial state is merged with the existing state and written only if the
+        state wasn't updated in the meantime, otherwise it is read and merged again.
+
+        Args:
+            state: the state to set.
+
+        Raises:
+            StateUpdateConflictError: if the state kept being updated concurrently.
+        """
+        if state.is_complete():
+            # Complete state replaces the existing state, whatever it is
+            self.set(state)
+            return
+
+        for attempt in range(CONDITIONAL_WRITE_ATTEMPTS):
+            state_to_write = state
+            current_state, version = self.get_with_version(state.state_id)
+            if current_state:
+                current_state.merge_partial(state)
+                state_to_write = current_state
+
+            if self.set_if_version(state_to_write, version):
+                return
+
+            logger.debug(
+                "State was updated concurrently, retrying",
+                state_id=state.state_id,
+                attempt=attempt + 1,
+            )
+            sleep(random.uniform(0, CONDITIONAL_WRITE_BACKOFF_SECONDS * 2**attempt))  # noqa: S311
+
+        msg = (
+            f"State for {state.state_id!r} was updated concurrently "
+            f"{CONDITIONAL_WRITE_ATTEMPTS} times while trying to update it"
+        )
+        raise StateUpdateConflictError(msg)
+
     @t.final
     def clear(self, state_id: str) -> None:
         """Delete the job state for the given state_id.
@@ -164,6 +231,10 @@ class StateStoreManager(ABC):
         Args:
             state_id: the state_id to delete.
         """
+        if self.conditional_writes:
+            self.delete(state_id)
+            return
+
         with self.acquire_lock(state_id, retry_seconds=1):
             self.delete(state_id)
 
@@ -197,6 +268,72 @@ class StateStoreManager(ABC):
         """
         ...
 
+    def get_many(self, state_ids: Iterable[str]) -> dict[str, MeltanoState]:
+        """Get the job state for many state_ids at once.
+
+        Override this method if the store supports bulk or concurrent reads.
+
+        Args:
+            state_ids: the state_ids to get state for.
+
+        Returns:
+            The current state of every given state_id that has state, by state_id.
+        """
+        return {
+            state_id: state
+            for state_id in dict.fromkeys(state_ids)
+            if (state := self.get(state_id)) is not None
+        }
+
+    def get_with_version(
+        self,
+        state_id: str,
+    ) -> tuple[MeltanoState | None, str | None]:
+        """Get the job state for the given state_id, along with its version.
+
+        Override this method, along with `set_if_version`, and set
+        `supports_conditional_writes` if the store supports conditional writes.
+
+        Args:
+            state_id: the name of the job to get state for.
+
+        Raises:
+            NotImplementedError: if the store doesn't support conditional writes.
+        """
+        msg = f"The {self.label} state backend does not support conditional writes"
+        raise NotImplementedError(msg)
+
+    def get_version(self, state_id: str) -> str | None:
+        """Get the version of the job state for the given state_id, without reading it.
+
+        Override this method, along with `get_with_version`, if the store can read
+        the metadata of state more cheaply than state itself.
+
+        Args:
+            state_id: the name of the job to get the state version for.
+
+        Raises:
+            NotImplementedError: if the store doesn't version state.
+        """
+        msg = f"The {self.label} state backend does not version state"
+        raise NotImplementedError(msg)
+
+    def set_if_version(self, state: MeltanoState, version: str | None) -> bool:
+        """Set the job state for the given state_id, unless it changed.
+
+        Only called if the store sets `supports_conditional_writes`.
+
+        Args:
+            state: the state to set.
+            version: the version of the state the new state is based on, as
+                returned by `get_with_version`, or None if there was no state.
+
+        Raises:
+            NotImplementedError: if the store doesn't support conditional writes.
+        """
+        msg = f"The {self.label} state backend does not support conditional writes"
+        raise NotImplementedError(msg)
+
     @abstractmethod
     def delete(self, state_id: str) -> None:
         """Delete state for the given state_id.
@@ -0,0 +1,287 @@
+"""A local read-through cache of the state kept by a remote state backend."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import typing as t
+from contextlib import contextmanager, suppress
+from hashlib import sha256
+from pathlib import Path
+
+import structlog
+
+from meltano.core.state_store.base import MeltanoState, StateStoreManager
+
+if t.TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+logger = structlog.stdlib.get_logger(__name__)
+
+STATE_SUFFIX = ".state.json"
+
+
+def supports_state_versions(manager: StateStoreManager) -> bool:
+    """Check whether a state store manager can read the version of state.
+
+    Args:
+        manager: The state store manager.
+
+    Returns:
+        True if the manager implements `get_version` and `get_with_version`.
+    """
+    manager_type = type(manager)
+    return (
+        manager_type.get_version is not StateStoreManager.get_version
+        and manager_type.get_with_version is not StateStoreManager.get_with_version
+    )
+
+
+class CachedStateStoreManager(StateStoreManager):
+    """Cache the state read from another state store manager.
+
+    The state of every state ID is kept on disk along with its version, e.g. the
+    ETag or generation of the remote object. Reading state first asks the wrapped
+    manager for the current version, which is a cheap metadata request, and only
+    reads the state itself if it doesn't match the cached version. Writing state
+    drops its cached copy, since the version of the new state is unknown.
+
+    Entries are named after a hash of the state ID and written atomically, so the
+    same directory can be used by several processes at once.
+    """
+
+    def __init__(
+        self,
+        manager: StateStoreManager,
+        directory: Path,
+        **kwargs: t.Any,
+    ) -> None:
+        """Initialize a `CachedStateStoreManager`.
+
+        Args:
+            manager: The state store manager to cache the state of. It must
+                support state versions, see `supports_state_versions`.
+            directory: The directory holding the cached state.
+            kwargs: additional keyword arguments
+        """
+        super().__init__(**kwargs)
+        self.manager = manager
+        self.directory = directory
+        self.supports_conditional_writes = manager.supports_conditional_writes
+        self.conditional_writes = manager.conditional_writes
+
+    @property
+    def label(self) -> str:
+        """Get the label of the wrapped state store manager.
+
+        Returns:
+            The label of the wrapped state store manager.
+        """
+        return self.manager.label
+
+    def close(self) -> None:
+        """Close the wrapped state store manager."""
+        self.manager.close()
+
+    def _path(self, state_id: str) -> Path:
+        key = sha256(state_id.encode()).hexdigest()
+        return self.directory / f"{key}{STATE_SUFFIX}"
+
+    def _read_entry(self, state_id: str) -> tuple[MeltanoState, str] | None:
+        try:
+            with self._path(state_id).open() as entry_file:
+                entry = json.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as err:
+            logger.warning("Could not read state cache: %s", err)
+            return None
+        if not isinstance(entry, dict) or entry.get("state_id") != state_id:
+            return None
+        # Without a version, cached state can't be known to be current
+        if not isinstance(version := entry.get("version"), str):
+            return None
+        state = MeltanoState(
+            state_id=state_id,
+            completed_state=entry.get("completed", {}),
+            partial_state=entry.get("partial", {}),
+        )
+        return state, version
+
+    def _write_entry(self, state: MeltanoState, version: str) -> None:
+        tmp_name = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                dir=self.directory,
+                suffix=".tmp",
+                delete=False,
+            ) as entry_file:
+                tmp_name = entry_file.name
+                json.dump(
+                    {
+                        "state_id": state.state_id,
+                        "version": version,
+                        "completed": state.completed_state,
+                        "partial": state.partial_state,
+                    },
+                    entry_file,
+                )
+            Path(tmp_name).replace(self._path(state.state_id))
+        except OSError as err:
+            logger.warning("Could not write state cache: %s", err)
+            if tmp_name:
+                with suppress(OSError):
+                    Path(tmp_name).unlink()
+
+    def _delete_entry(self, state_id: str) -> None:
+        try:
+            self._path(state_id).unlink(missing_ok=True)
+        except OSError as err:
+            logger.warning("Could not delete from state cache: %s", err)
+
+    def get(self, state_id: str) -> MeltanoState | None:
+        """Get the job state for the given state_id, from the cache if it's current.
+
+        Args:
+            state_id: the name of the job to get state for.
+
+        Returns:
+            The current state for the given job, or None if there is no state.
+        """
+        version = self.manager.get_version(state_id)
+        if version is None:
+            self._delete_entry(state_id)
+            return None
+
+        if (entry := self._read_entry(state_id)) and entry[1] == version:
+            logger.debug("Using cached state", state_id=state_id)
+            return entry[0]
+
+        state, version = self.manager.get_with_version(state_id)
+        if state is None or version is None:
+            self._delete_entry(state_id)
+            return state
+        self._write_entry(state, version)
+        return state
+
+    def get_many(self, state_ids: Iterable[str]) -> dict[str, MeltanoState]:
+        """Get the job state for many state_ids at once, bypassing the cache.
+
+        Args:
+            state_ids: the state_ids to get state for.
+
+        Returns:
+            The current state of every given state_id that has state, by state_id.
+        """
+        return self.manager.get_many(state_ids)
+
+    def get_with_version(
+        self,
+        state_id: str,
+    ) -> tuple[MeltanoState | None, str | None]:
+        """Get the job state for the given state_id, along with its version.
+
+        Args:
+            state_id: the name of the job to get state for.
+
+        Returns:
+            The current state and its version, or None and None if there is no
+            state.
+        """
+        state, version = self.manager.get_with_version(state_id)
+        if state is not None and version is not None:
+            self._write_entry(state, version)
+        return state, version
+
+    def get_version(self, state_id: str) -> str | None:
+        """Get the version of the job state for the given state_id.
+
+        Args:
+            state_id: the name of the job to get the state version for.
+
+        Returns:
+            The version of the current state, or None if there is no state.
+        """
+        return self.manager.get_version(state_id)
+
+    def set(self, state: MeltanoState) -> None:
+        """Set the job state for the given state_id.
+
+        Args:
+            state: the state to set.
+        """
+        # The version of the new state isn't returned by the write, and state may
+        # be updated again before it's read, so it's read again next time
+        self._delete_entry(state.state_id)
+        self.manager.set(state)
+
+    def set_if_version(self, state: MeltanoState, version: str | None) -> bool:
+        """Set the job state for the given state_id, unless it changed.
+
+        Args:
+            state: the state to set.
+            version: the version of the state the new state is based on, or None
+                if there was no state.
+
+        Returns:
+            True if the state was set, False if it changed in the meantime.
+        """
+        # The version of the new state is unknown, so it's read again next time
+        self._delete_entry(state.state_id)
+        return self.manager.set_if_version(state, version)
+
+    def delete(self, state_id: str) -> None:
+        """Delete state for the given state_id, and its cached copy.
+
+        Args:
+            state_id: the state_id to clear state for
+        """
+        self.manager.delete(state_id)
+        self._delete_entry(state_id)
+
+    def clear_all(self) -> int:
+        """Clear all states, and the cache.
+
+        Returns:
+            The number of states cleared from the store.
+        """
+        count = self.manager.clear_all()
+        shutil.rmtree(self.directory, ignore_errors=True)
+        return count
+
+    def get_state_ids(self, pattern: str | None = None) -> Iterable[str]:
+        """Get all state_ids available in the wrapped state store manager.
+
+        Args:
+            pattern: glob-style pattern to filter by
+
+        Returns:
+            The state_ids available in the wrapped state store manager.
+        """
+        return self.manager.get_state_ids(pattern)
+
+    def migrate(self) -> None:
+        """Migrate state of the wrapped state store manager."""
+        self.manager.migrate()
+
+    @contextmanager
+    def acquire_lock(
+        self,
+        state_id: str,
+        *,
+        retry_seconds: int,
+    ) -> Generator[None, None, None]:
+        """Acquire a lock for the given job's state from the wrapped manager.
+
+        Args:
+            state_id: the state_id to lock
+            retry_seconds: the number of seconds to wait before retrying
+
+        Yields:
+            None
+        """
+        with self.manager.acquire_lock(state_id, retry_seconds=retry_seconds):
+            yield
@@ -0,0 +1,118 @@
+"""Compression of the state files of filesystem and cloud state backends.
+
+The compression of a state file is detected from its leading magic bytes rather
+than from settings, so state written with any compression, or none, can always
+be read back, whatever the compression used for new state files.
+"""
+
+from __future__ import annotations
+
+import gzip
+import sys
+import typing as t
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    from backports.strenum import StrEnum
+
+if t.TYPE_CHECKING:
+    from types import ModuleType
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Fast levels, since state is written on every state message that is committed
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+
+class StateCompression(StrEnum):
+    """Compression of state files."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @property
+    def content_type(self) -> str:
+        """Get the media type of state files with this compression.
+
+        Returns:
+            The media type to store state files with.
+        """
+        return {
+            StateCompression.NONE: "application/json",
+            StateCompression.GZIP: "application/gzip",
+            StateCompression.ZSTD: "application/zstd",
+        }[self]
+
+
+def _zstd() -> ModuleType:
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            msg = (
+                "The 'zstandard' package is required to read and write "
+                "zstd-compressed state on Python versions older than 3.14. "
+                "Please install it in the same environment as Meltano"
+            )
+            raise ImportError(msg) from None
+    return zstd
+
+
+def check_compression_available(compression: StateCompression) -> None:
+    """Check that state can be compressed with the given compression.
+
+    Args:
+        compression: The compression of state files.
+
+    Raises:
+        ImportError: if the package implementing the compression is missing.
+    """
+    if compression is StateCompression.ZSTD:
+        _zstd()
+
+
+def compress_state(data: bytes, compression: StateCompression) -> bytes:
+    """Compress a state file.
+
+    Args:
+        data: The JSON state file.
+        compression: The compression to use.
+
+    Returns:
+        The compressed state file.
+    """
+    if compression is StateCompression.GZIP:
+        # A fixed modification time keeps the output, and so ETags, deterministic
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if compression is StateCompression.ZSTD:
+        zstd = _zstd()
+        if zstd.__name__ == "zstandard":
+            return zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        return zstd.compress(data, level=ZSTD_LEVEL)
+    return data
+
+
+def decompress_state(data: bytes) -> bytes:
+    """Decompress a state file, detecting its compression from its magic bytes.
+
+    Args:
+        data: The state file, compressed or not.
+
+    Returns:
+        The JSON state file.
+    """
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    if data.startswith(ZSTD_MAGIC):
+        zstd = _zstd()
+        if zstd.__name__ == "zstandard":
+            # Frames written in streaming mode don't record their content size
+            return zstd.ZstdDecompressor().decompressobj().decompress(data)
+        return zstd.decompress(data)
+    return data
@@ -12,10 +12,14 @@ from meltano.core.state_store.base import MeltanoState, StateStoreManager
 from meltano.core.utils import merge
 
 if t.TYPE_CHECKING:
-    from collections.abc import Generator, Iterator
+    from collections.abc import Generator, Iterable, Iterator
 
     from sqlalchemy.orm import Session
 
+# Number of state IDs looked up by a single query, which stays below the maximum
+# number of parameters of a query in SQLite
+GET_MANY_BATCH_SIZE = 500
+
 
 class DBStateStoreManager(StateStoreManager):
     """StateStoreManager implementation for state stored in the system db."""
@@ -81,6 +85,31 @@ class DBStateStoreManager(StateStoreManager):
 
         return None
 
+    def get_many(self, state_ids: Iterable[str]) -> dict[str, MeltanoState]:
+        """Get the job state for many state_ids at once.
+
+        Args:
+            state_ids: the state_ids to get state for.
+
+        Returns:
+            The current state of every given state_id that has state, by state_id.
+        """
+        state_ids = list(dict.fromkeys(state_ids))
+        states = {}
+        for start in range(0, len(state_ids), GET_MANY_BATCH_SIZE):
+            batch = state_ids[start : start + GET_MANY_BATCH_SIZE]
+            for job_state in self.session.execute(
+                select(JobState).where(JobState.state_id.in_(batch)),
+            ).scalars():
+                states[job_state.state_id] = MeltanoState(
+                    state_id=job_state.state_id,
+                    partial_state=job_state.partial_state,
+                    completed_state=job_state.completed_state,
+                )
+        return {
+            state_id: states[state_id] for state_id in state_ids if state_id in states
+        }
+
     def delete(self, state_id: str) -> None:
         """Clear state for the given state_id.
 
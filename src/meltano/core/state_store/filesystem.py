@@ -13,6 +13,7 @@ import sys
 import typing as t
 from abc import abstractmethod
 from base64 import b64decode, b64encode
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from functools import reduce
@@ -24,6 +25,12 @@ import smart_open
 import structlog
 
 from meltano.core.state_store.base import MeltanoState, StateStoreManager
+from meltano.core.state_store.compression import (
+    StateCompression,
+    check_compression_available,
+    compress_state,
+    decompress_state,
+)
 
 if sys.version_info >= (3, 12):
     from typing import override  # noqa: ICN003
@@ -36,6 +43,14 @@ if t.TYPE_CHECKING:
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# Number of state files read at once by cloud backends, unless configured otherwise
+DEFAULT_MAX_CONCURRENCY = 10
+
+# The leading characters of a state ID pattern that match only themselves, so the
+# state IDs it matches can be listed by that prefix. A character followed by a `?`
+# or `{` quantifier may not be matched at all, so it ends the prefix.
+_PATTERN_LITERAL_PREFIX = re.compile(r"(?:[^*?.+()\[\]{}|^$\\](?![?{]))*")
+
 
 class InvalidStateBackendConfigurationException(Exception):
     """State backend configuration is invalid."""
@@ -46,18 +61,38 @@ class BaseFilesystemStateStoreManager(StateStoreManager):
 
     delimiter = "/"
 
-    def __init__(self, uri: str, lock_timeout_seconds: int, **kwargs: t.Any) -> None:
+    def __init__(
+        self,
+        uri: str,
+        lock_timeout_seconds: int,
+        compression: str | None = None,
+        **kwargs: t.Any,
+    ) -> None:
         """Initialize the BaseFilesystemStateStoreManager.
 
         Args:
             uri: the uri for the state backend
             lock_timeout_seconds: how many seconds a lock should be considered active
+            compression: the compression of the state files written, if any
             kwargs: additional keyword args to pass to parent
+
+        Raises:
+            InvalidStateBackendConfigurationException: if the compression is
+                not supported.
         """
         super().__init__(**kwargs)
         self.uri = uri
         self.lock_timeout_seconds = lock_timeout_seconds
         self.parsed = urlparse(self.uri)
+        try:
+            self.compression = StateCompression(compression or StateCompression.NONE)
+        except ValueError:
+            msg = (
+                f"Unsupported state compression {compression!r}, expected one of: "
+                f"{', '.join(StateCompression)}"
+            )
+            raise InvalidStateBackendConfigurationException(msg) from None
+        check_compression_available(self.compression)
 
     def join_path(self, *components: str) -> str:
         """Join path components in filesystem-independent manner.
@@ -119,13 +154,20 @@ class BaseFilesystemStateStoreManager(StateStoreManager):
         Yields:
             A TextIOWrapper to read the file/blob.
         """
-        transport_params = {"client": self.client} if self.client else {}
-        transport_params.update(self.extra_transport_params)
-        with smart_open.open(
-            self.uri_with_path(path),
-            "r",
-            transport_params=transport_params,
-        ) as reader:
+        with self._open_reader(path, "r") as reader:
+            yield reader
+
+    @contextmanager
+    def get_binary_reader(self, path: str) -> Iterator[t.BinaryIO]:
+        """Get binary reader for given path.
+
+        Args:
+            path: the path to get reader for.
+
+        Yields:
+            A binary file object to read the file/blob.
+        """
+        with self._open_reader(path, "rb") as reader:
             yield reader
 
     @contextmanager
@@ -138,23 +180,76 @@ class BaseFilesystemStateStoreManager(StateStoreManager):
         Yields:
             A TextIOWrapper to read the file/blob.
         """
+        with self._open_writer(path, "w") as writer:
+            yield writer
+
+    @contextmanager
+    def get_binary_writer(self, path: str) -> Iterator[t.BinaryIO]:
+        """Get binary writer for given path.
+
+        Args:
+            path: the path to get writer for.
+
+        Yields:
+            A binary file object to write the file/blob.
+        """
+        with self._open_writer(path, "wb") as writer:
+            yield writer
+
+    @contextmanager
+    def _open_reader(self, path: str, mode: str) -> Iterator[t.Any]:
+        transport_params = {"client": self.client} if self.client else {}
+        transport_params.update(self.extra_transport_params)
+        with smart_open.open(
+            self.uri_with_path(path),
+            mode,
+            transport_params=transport_params,
+        ) as reader:
+            yield reader
+
+    @contextmanager
+    def _open_writer(self, path: str, mode: str) -> Iterator[t.Any]:
         transport_params = {"client": self.client} if self.client else {}
         transport_params.update(self.extra_transport_params)
         try:
             with smart_open.open(
                 self.uri_with_path(path),
-                "w+",
+                f"{mode}+",
                 transport_params=transport_params,
             ) as writer:
                 yield writer
         except NotImplementedError:
             with smart_open.open(
                 self.uri_with_path(path),
-                "w",
+                mode,
                 transport_params=transport_params,
             ) as writer:
                 yield writer
 
+    def encode_state(self, state: MeltanoState) -> bytes:
+        """Encode state as the contents of a state file.
+
+        Args:
+            state: the state to encode.
+
+        Returns:
+            The state as JSON, compressed with the configured compression.
+        """
+        return compress_state(state.json().encode(), self.compression)
+
+    @staticmethod
+    def decode_state(state_id: str, data: bytes) -> MeltanoState:
+        """Decode the contents of a state file, compressed or not.
+
+        Args:
+            state_id: the state_id the state file belongs to.
+            data: the contents of the state file.
+
+        Returns:
+            The decoded state.
+        """
+        return MeltanoState.from_json(state_id, decompress_state(data).decode())
+
     @property
     @abstractmethod
     def client(self) -> t.Any:  # noqa: ANN401
@@ -318,9 +413,23 @@ class BaseFilesystemStateStoreManager(StateStoreManager):
             Exception: if error not indicating file is not found is thrown
         """
         logger.info("Reading state from %s", self.label)
+        return self.read_state(state_id)
+
+    def read_state(self, state_id: str) -> MeltanoState | None:
+        """Read the state file/blob of the given state_id.
+
+        Args:
+            state_id: the state_id to read state for.
+
+        Returns:
+            Current state, if any exists, else None
+
+        Raises:
+            Exception: if error not indicating file is not found is thrown
+        """
         try:
-            with self.get_reader(self.get_state_path(state_id)) as reader:
-                return MeltanoState.from_file(state_id, reader)
+            with self.get_binary_reader(self.get_state_path(state_id)) as reader:
+                return self.decode_state(state_id, reader.read())
         except Exception as e:
             if self.is_file_not_found_error(e):
                 logger.info("No state found for %s.", state_id)
@@ -338,8 +447,8 @@ class BaseFilesystemStateStoreManager(StateStoreManager):
             Exception: if error not indicating file is not found is thrown
         """
         logger.info("Writing state to %s", self.label)
-        with self.get_writer(self.get_state_path(state.state_id)) as writer:
-            writer.write(state.json())
+        with self.get_binary_writer(self.get_state_path(state.state_id)) as writer:
+            writer.write(self.encode_state(state))
 
     @abstractmethod
     def delete_file(self, file_path: str) -> None:
@@ -556,15 +665,34 @@ else:
 class CloudStateStoreManager(BaseFilesystemStateStoreManager):
     """Base class for cloud storage state store managers."""
 
-    def __init__(self, prefix: str | None = None, **kwargs: t.Any) -> None:
+    def __init__(
+        self,
+        prefix: str | None = None,
+        max_concurrency: int | None = None,
+        conditional_writes: bool = False,  # noqa: FBT001, FBT002
+        **kwargs: t.Any,
+    ) -> None:
         """Initialize the CloudStateStoreManager.
 
         Args:
             prefix: the prefix to use for state storage
+            max_concurrency: the maximum number of state files to read at once
+            conditional_writes: whether to update state with conditional writes
+                rather than under a lock
             kwargs: additional kwargs to pass to parent __init__.
         """
         super().__init__(**kwargs)
         self.prefix = prefix or self.parsed.path
+        self.max_concurrency = max(max_concurrency or DEFAULT_MAX_CONCURRENCY, 1)
+        if conditional_writes and not self.supports_conditional_writes:
+            logger.warning(
+                "State backend does not support conditional writes, "
+                "updating state under a lock",
+                state_backend=self.label,
+            )
+        self.conditional_writes = (
+            bool(conditional_writes) and self.supports_conditional_writes
+        )
 
     @override
     @property
@@ -588,6 +716,32 @@ class CloudStateStoreManager(BaseFilesystemStateStoreManager):
         """
         return self.join_path(self.uri.removesuffix(self.prefix), path)
 
+    @override
+    def get_many(self, state_ids: Iterable[str]) -> dict[str, MeltanoState]:
+        """Get the job state for many state_ids at once, reading them concurrently.
+
+        Args:
+            state_ids: the state_ids to get state for.
+
+        Returns:
+            The current state of every given state_id that has state, by state_id.
+        """
+        state_ids = list(dict.fromkeys(state_ids))
+        if not state_ids:
+            return {}
+
+        logger.info("Reading state of %d state IDs from %s", len(state_ids), self.label)
+        # Create the client once, rather than in each thread
+        _ = self.client
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(state_ids)),
+        ) as executor:
+            return {
+                state.state_id: state
+                for state in executor.map(self.read_state, state_ids)
+                if state is not None
+            }
+
     @abstractmethod
     def list_all_files(self, *, with_prefix: bool = True) -> Iterator[str]:
         """List all files in the backend.
@@ -639,26 +793,62 @@ class CloudStateStoreManager(BaseFilesystemStateStoreManager):
                     dst=new_path,
                 )
 
-    @override
-    def get_state_ids(self, pattern: str | None = None) -> list[str]:
-        """Get list of state_ids stored in the backend.
+    def get_state_dirs_prefix(self, state_id_prefix: str = "") -> str:
+        """Get the prefix of the state directories of state_ids with a given prefix.
 
         Args:
-            pattern: glob-style pattern to filter state_ids by
+            state_id_prefix: the prefix of the state_ids
 
         Returns:
-            List of state_ids
+            The prefix to list the state directories of the state_ids by.
+        """
+        if not self.state_dir:
+            return state_id_prefix
+        return f"{self.state_dir}{self.delimiter}{state_id_prefix}"
+
+    def iter_state_ids(self, state_id_prefix: str = "") -> Iterator[str]:
+        """Iterate over the state_ids with a given prefix.
+
+        Override this method to list the state directories page by page with a
+        delimiter, rather than every file under the prefix.
+
+        Args:
+            state_id_prefix: the prefix of the state_ids to list
+
+        Yields:
+            The next state_id with a state file.
         """
-        if pattern:
-            pattern_re = re.compile(pattern.replace("*", ".*"))
         state_ids = set()
         for filepath in self.list_all_files():
             if "/" not in filepath:
                 continue
 
             (state_id, filename) = filepath.split("/")[-2:]
-            if filename == "state.json" and (
-                (not pattern) or pattern_re.match(state_id)
+            if (
+                filename == "state.json"
+                and state_id.startswith(state_id_prefix)
+                and state_id not in state_ids
             ):
                 state_ids.add(state_id)
-        return list(state_ids)
+                yield state_id
+
+    @override
+    def get_state_ids(self, pattern: str | None = None) -> Iterator[str]:
+        """Lazily get the state_ids stored in the backend.
+
+        Args:
+            pattern: glob-style pattern to filter state_ids by
+
+        Yields:
+            The next state_id
+        """
+        if not pattern:
+            yield from self.iter_state_ids()
+            return
+
+        pattern_re = re.compile(pattern.replace("*", ".*"))
+        # Leave it to the backend to filter by the literal start of the pattern
+        state_id_prefix = _PATTERN_LITERAL_PREFIX.match(pattern).group()  # type: ignore[union-attr]
+        for state_id in self.iter_state_ids(state_id_prefix):
+            if pattern_re.match(state_id):
+                yield state_id
@@ -15,7 +15,9 @@ import structlog.stdlib
 from meltano.core.state_store.filesystem import CloudStateStoreManager
 
 if t.TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
+
+    from meltano.core.state_store.base import MeltanoState
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -24,6 +26,7 @@ class GCSStateStoreManager(CloudStateStoreManager):
     """State backend for Google Cloud Storage."""
 
     label = "Google Cloud Storage"
+    supports_conditional_writes = True
 
     def __init__(
         self,
@@ -127,10 +130,68 @@ class GCSStateStoreManager(CloudStateStoreManager):
         """Extra transport params for ``smart_open.open``."""
         return {
             "blob_properties": {
-                "content_type": "application/json",
+                "content_type": self.compression.content_type,
             },
         }
 
+    def get_with_version(
+        self,
+        state_id: str,
+    ) -> tuple[MeltanoState | None, str | None]:
+        """Get the job state for the given state_id, along with its generation.
+
+        Args:
+            state_id: the name of the job to get state for.
+
+        Returns:
+            The current state and its generation, or None and None if there is no
+            state.
+        """
+        blob = self.client.bucket(self.bucket).blob(self.get_state_path(state_id))
+        try:
+            data = blob.download_as_bytes()
+        except google.api_core.exceptions.NotFound:
+            return None, None
+        # The generation of the downloaded blob is read from the response
+        return self.decode_state(state_id, data), str(blob.generation)
+
+    def get_version(self, state_id: str) -> str | None:
+        """Get the generation of the job state for the given state_id, not the state.
+
+        Args:
+            state_id: the name of the job to get the state version for.
+
+        Returns:
+            The generation of the current state, or None if there is no state.
+        """
+        blob = self.client.bucket(self.bucket).get_blob(self.get_state_path(state_id))
+        return None if blob is None else str(blob.generation)
+
+    def set_if_version(self, state: MeltanoState, version: str | None) -> bool:
+        """Set the job state for the given state_id, unless its generation changed.
+
+        Args:
+            state: the state to set.
+            version: the generation of the state the new state is based on, or
+                None if there was no state.
+
+        Returns:
+            True if the state was set, False if it changed in the meantime.
+        """
+        blob = self.client.bucket(self.bucket).blob(
+            self.get_state_path(state.state_id),
+        )
+        try:
+            blob.upload_from_string(
+                self.encode_state(state),
+                content_type=self.compression.content_type,
+                # Generation 0 matches only if the blob doesn't exist
+                if_generation_match=int(version) if version else 0,
+            )
+        except google.api_core.exceptions.PreconditionFailed:
+            return False
+        return True
+
     def delete_file(self, file_path: str) -> None:
         """Delete the file/blob at the given path.
 
@@ -166,6 +227,25 @@ class GCSStateStoreManager(CloudStateStoreManager):
         ):
             yield blob.name
 
+    def iter_state_ids(self, state_id_prefix: str = "") -> Iterator[str]:
+        """Iterate over the state_ids with a given prefix, one listing page at a time.
+
+        Args:
+            state_id_prefix: the prefix of the state_ids to list
+
+        Yields:
+            The next state_id.
+        """
+        state_dirs_prefix = self.get_state_dirs_prefix()
+        blobs = self.client.list_blobs(
+            bucket_or_name=self.bucket,
+            prefix=self.get_state_dirs_prefix(state_id_prefix),
+            delimiter=self.delimiter,
+        )
+        for page in blobs.pages:
+            for state_dir in page.prefixes:
+                yield state_dir.removeprefix(state_dirs_prefix).rstrip(self.delimiter)
+
     def copy_file(self, src: str, dst: str) -> None:
         """Copy a file from one location to another.
 
@@ -6,6 +6,7 @@ import typing as t
 from functools import cached_property
 
 import boto3
+import botocore.exceptions
 
 from meltano.core.state_store.filesystem import (
     CloudStateStoreManager,
@@ -13,15 +14,18 @@ from meltano.core.state_store.filesystem import (
 )
 
 if t.TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
 
     from mypy_boto3_s3 import S3Client
 
+    from meltano.core.state_store.base import MeltanoState
+
 
 class S3StateStoreManager(CloudStateStoreManager):
     """State backend for S3."""
 
     label: str = "AWS S3"
+    supports_conditional_writes = True
 
     def __init__(
         self,
@@ -75,7 +79,7 @@ class S3StateStoreManager(CloudStateStoreManager):
         return {
             "client_kwargs": {
                 "S3.Client.create_multipart_upload": {
-                    "ContentType": "application/json",
+                    "ContentType": self.compression.content_type,
                 },
             },
         }
@@ -108,6 +112,91 @@ class S3StateStoreManager(CloudStateStoreManager):
         session = boto3.Session()
         return session.client("s3")
 
+    def get_with_version(
+        self,
+        state_id: str,
+    ) -> tuple[MeltanoState | None, str | None]:
+        """Get the job state for the given state_id, along with its ETag.
+
+        Args:
+            state_id: the name of the job to get state for.
+
+        Returns:
+            The current state and its ETag, or None and None if there is no state.
+        """
+        try:
+            response = self.client.get_object(
+                Bucket=self.bucket,
+                Key=self.get_state_path(state_id),
+            )
+        except botocore.exceptions.ClientError as err:
+            if err.response["Error"]["Code"] == "NoSuchKey":
+                return None, None
+            raise
+        state = self.decode_state(state_id, response["Body"].read())
+        return state, response["ETag"]
+
+    def get_version(self, state_id: str) -> str | None:
+        """Get the ETag of the job state for the given state_id, without reading it.
+
+        Args:
+            state_id: the name of the job to get the state version for.
+
+        Returns:
+            The ETag of the current state, or None if there is no state.
+        """
+        try:
+            response = self.client.head_object(
+                Bucket=self.bucket,
+                Key=self.get_state_path(state_id),
+            )
+        except botocore.exceptions.ClientError as err:
+            # HEAD responses have no body, so a missing key is only told by status
+            if err.response["Error"]["Code"] in {"404", "NoSuchKey"}:
+                return None
+            raise
+        return response["ETag"]
+
+    def set_if_version(self, state: MeltanoState, version: str | None) -> bool:
+        """Set the job state for the given state_id, unless its ETag changed.
+
+        Args:
+            state: the state to set.
+            version: the ETag of the state the new state is based on, or None if
+                there was no state.
+
+        Returns:
+            True if the state was set, False if it changed in the meantime.
+        """
+        key = self.get_state_path(state.state_id)
+        body = self.encode_state(state)
+        try:
+            if version:
+                self.client.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=body,
+                    ContentType=self.compression.content_type,
+                    IfMatch=version,
+                )
+            else:
+                self.client.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=body,
+                    ContentType=self.compression.content_type,
+                    IfNoneMatch="*",
+                )
+        except botocore.exceptions.ClientError as err:
+            # A concurrent conditional write to the same key may also conflict
+            if err.response["Error"]["Code"] in {
+                "PreconditionFailed",
+                "ConditionalRequestConflict",
+            }:
+                return False
+            raise
+        return True
+
     def delete_file(self, file_path: str) -> None:
         """Delete the file/blob at the given path.
 
@@ -132,8 +221,33 @@ class S3StateStoreManager(CloudStateStoreManager):
         if with_prefix:
             kwargs["Prefix"] = self.prefix
 
-        for state_obj in self.client.list_objects_v2(**kwargs).get("Contents", []):
-            yield state_obj["Key"]
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(**kwargs):
+            for state_obj in page.get("Contents", []):
+                yield state_obj["Key"]
+
+    def iter_state_ids(self, state_id_prefix: str = "") -> Iterator[str]:
+        """Iterate over the state_ids with a given prefix, one listing page at a time.
+
+        Args:
+            state_id_prefix: the prefix of the state_ids to list
+
+        Yields:
+            The next state_id.
+        """
+        state_dirs_prefix = self.get_state_dirs_prefix()
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=self.get_state_dirs_prefix(state_id_prefix),
+            Delimiter=self.delimiter,
+        ):
+            for state_dir in page.get("CommonPrefixes", []):
+                yield (
+                    state_dir["Prefix"]
+                    .removeprefix(state_dirs_prefix)
+                    .rstrip(self.delimiter)
+                )
 
     def copy_file(self, src: str, dst: str) -> None:
         """Copy a file from one path to another.
@@ -0,0 +1,103 @@
+"""Benchmarks for forwarding Singer messages between plugin processes.
+
+These benchmarks measure the throughput of `capture_subprocess_output` (one
+`readline`/`write`/`drain` per line) against `capture_subprocess_output_chunked`
+(whole runs of lines per write, drained at a high-water mark), both forwarding
+the same payload into a real OS pipe, like a tap's stdout linked to a target's
+stdin.
+
+Divide `PAYLOAD_SIZE` by the reported mean time to get the throughput in MB/s.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import typing as t
+
+import pytest
+
+from meltano.core.logging.utils import (
+    capture_subprocess_output,
+    capture_subprocess_output_chunked,
+)
+
+NUM_RECORDS = 50_000
+
+
+def generate_messages(num_records: int = NUM_RECORDS) -> bytes:
+    """Generate a realistic stream of Singer messages."""
+    schema = {
+        "type": "SCHEMA",
+        "stream": "users",
+        "schema": {"properties": {"id": {"type": "integer"}}},
+        "key_properties": ["id"],
+    }
+    lines = [json.dumps(schema)]
+    for i in range(num_records):
+        record = {
+            "id": i,
+            "name": f"user_{i}",
+            "email": f"user_{i}@example.com",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+        }
+        lines.append(
+            json.dumps({"type": "RECORD", "stream": "users", "record": record})
+        )
+        if i % 10_000 == 0:
+            state = {"bookmarks": {"users": {"updated_at": record["updated_at"]}}}
+            lines.append(json.dumps({"type": "STATE", "value": state}))
+    return "\n".join(lines).encode() + b"\n"
+
+
+PAYLOAD = generate_messages()
+PAYLOAD_SIZE = len(PAYLOAD)
+
+
+def _drain_pipe(read_fd: int) -> None:
+    with os.fdopen(read_fd, "rb") as read_file:
+        while read_file.read(1024 * 1024):
+            pass
+
+
+async def forward(
+    capture: t.Callable[..., t.Coroutine[t.Any, t.Any, None]],
+) -> None:
+    """Forward `PAYLOAD` from a `StreamReader` into an OS pipe."""
+    loop = asyncio.get_running_loop()
+
+    reader = asyncio.StreamReader(limit=PAYLOAD_SIZE)
+    reader.feed_data(PAYLOAD)
+    reader.feed_eof()
+
+    read_fd, write_fd = os.pipe()
+    consumer = threading.Thread(target=_drain_pipe, args=(read_fd,))
+    consumer.start()
+
+    transport, protocol = await loop.connect_write_pipe(
+        lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()),
+        os.fdopen(write_fd, "wb"),
+    )
+    writer = asyncio.StreamWriter(transport, protocol, None, loop)
+    try:
+        await capture(reader, writer)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.to_thread(consumer.join)
+
+
+class TestPipeBenchmarks:
+    """Benchmarks for stdout to stdin forwarding."""
+
+    @pytest.mark.benchmark
+    def test_forward_line_by_line(self) -> None:
+        """Benchmark forwarding `PAYLOAD` one line at a time."""
+        asyncio.run(forward(capture_subprocess_output))
+
+    @pytest.mark.benchmark
+    def test_forward_chunked(self) -> None:
+        """Benchmark forwarding `PAYLOAD` in chunks of complete lines."""
+        asyncio.run(forward(capture_subprocess_output_chunked))
@@ -2,7 +2,8 @@
 
 These benchmarks verify the optimization that skips locking for complete states
 (the common case during normal ELT runs), while still locking for partial states
-that require read-merge-write atomicity.
+that require read-merge-write atomicity. They also measure writing and reading
+large state files with each `state_backend.compression`.
 
 See: https://github.com/meltano/meltano/pull/8367
 """
@@ -11,11 +12,13 @@ from __future__ import annotations
 
 import platform
 import shutil
+import sys
 import typing as t
 
 import pytest
 
 from meltano.core.state_store import MeltanoState
+from meltano.core.state_store.compression import StateCompression
 from meltano.core.state_store.filesystem import (
     _LocalFilesystemStateStoreManager,
     _WindowsFilesystemStateStoreManager,
@@ -121,3 +124,81 @@ class TestStateBackendBenchmarks:
                 completed_state={},
             )
             subject.update(state)
+
+
+def large_state(
+    state_id: str,
+    num_topics: int = 200,
+    num_partitions: int = 100,
+) -> MeltanoState:
+    """Generate state with a bookmark per partition, like CDC extractors keep."""
+    return MeltanoState(
+        state_id=state_id,
+        partial_state={},
+        completed_state={
+            "singer_state": {
+                "bookmarks": {
+                    f"topic-{topic}": {
+                        "partitions": {
+                            str(partition): {
+                                "offset": (topic * num_partitions + partition)
+                                * 1_000_003,
+                                "timestamp": "2024-01-01T00:00:00.000000+00:00",
+                            }
+                            for partition in range(num_partitions)
+                        },
+                    }
+                    for topic in range(num_topics)
+                },
+            },
+        },
+    )
+
+
+class TestStateCompressionBenchmarks:
+    """Benchmarks for writing and reading large state files, compressed or not."""
+
+    @pytest.fixture(params=tuple(StateCompression))
+    def subject(
+        self,
+        tmp_path: Path,
+        request: pytest.FixtureRequest,
+    ) -> Generator[_LocalFilesystemStateStoreManager]:
+        """Create a filesystem state store manager with each compression."""
+        state_path = tmp_path / ".meltano" / "state"
+        state_path.mkdir(parents=True, exist_ok=True)
+
+        if request.param is StateCompression.ZSTD:
+            pytest.importorskip(
+                "compression.zstd" if sys.version_info >= (3, 14) else "zstandard",
+            )
+
+        manager_cls = (
+            _WindowsFilesystemStateStoreManager
+            if on_windows()
+            else _LocalFilesystemStateStoreManager
+        )
+        separator = "\\" if on_windows() else "/"
+        yield manager_cls(
+            uri=f"file://{state_path}{separator}",
+            lock_timeout_seconds=10,
+            compression=request.param,
+        )
+        shutil.rmtree(state_path, ignore_errors=True)
+
+    @pytest.mark.benchmark
+    def test_local_filesystem_set_large_state(
+        self,
+        subject: _LocalFilesystemStateStoreManager,
+    ) -> None:
+        """Benchmark writing a large state file, as every state commit does."""
+        subject.update(large_state("test-large-set"))
+
+    @pytest.mark.benchmark
+    def test_local_filesystem_get_large_state(
+        self,
+        subject: _LocalFilesystemStateStoreManager,
+    ) -> None:
+        """Benchmark reading a large state file, as every run does first."""
+        subject.update(large_state("test-large-get"))
+        assert subject.get("test-large-get") is not None
@@ -10,6 +10,7 @@ complementing the isolated _stream_redirect benchmarks.
 from __future__ import annotations
 
 import asyncio
+import io
 import json
 import typing as t
 from unittest import mock
@@ -17,6 +18,16 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from meltano.core.plugin.singer.catalog import (
+    ListSelectedExecutor,
+    MetadataExecutor,
+    MetadataRule,
+    SchemaExecutor,
+    SchemaRule,
+    SelectExecutor,
+    select_metadata_rules,
+)
+from meltano.core.plugin.singer.catalog_streaming import process_catalog
 from meltano.core.plugin_invoker import PluginInvoker
 
 if t.TYPE_CHECKING:
@@ -25,7 +36,12 @@ if t.TYPE_CHECKING:
     from meltano.core.project_add_service import ProjectAddService
 
 
-def generate_catalog(num_streams: int = 10, properties_per_stream: int = 30) -> dict:
+def generate_catalog(
+    num_streams: int = 10,
+    properties_per_stream: int = 30,
+    *,
+    property_metadata: bool = False,
+) -> dict:
     """Generate a realistic Singer catalog for benchmarking."""
     streams = []
     for i in range(num_streams):
@@ -33,12 +49,21 @@ def generate_catalog(num_streams: int = 10, properties_per_stream: int = 30) ->
             f"property_{j}": {"type": ["null", "string"]}
             for j in range(properties_per_stream)
         }
+        metadata = [{"breadcrumb": [], "metadata": {"selected": True}}]
+        if property_metadata:
+            metadata.extend(
+                {
+                    "breadcrumb": ["properties", name],
+                    "metadata": {"inclusion": "available"},
+                }
+                for name in properties
+            )
         streams.append(
             {
                 "tap_stream_id": f"stream_{i}",
                 "stream": f"stream_{i}",
                 "schema": {"type": "object", "properties": properties},
-                "metadata": [{"breadcrumb": [], "metadata": {"selected": True}}],
+                "metadata": metadata,
             }
         )
     return {"streams": streams}
@@ -174,3 +199,89 @@ class TestTapBenchmarks:
             rounds=10,
             warmup_rounds=5,
         )
+
+
+@pytest.fixture(scope="module")
+def large_catalog() -> dict:
+    """Pre-generate a catalog of 400 streams and 12k properties."""
+    return generate_catalog(400, 30, property_metadata=True)
+
+
+class TestCatalogTraversalBenchmarks:
+    """Benchmarks for traversing large catalogs with the catalog executors."""
+
+    @pytest.mark.benchmark
+    def test_select_executor(self, large_catalog: dict, benchmark) -> None:
+        """Benchmark applying select patterns to a large catalog."""
+        executor = SelectExecutor(["stream_1*.*", "!*.property_2*"])
+        benchmark(executor.visit, large_catalog)
+
+    @pytest.mark.benchmark
+    def test_metadata_executor_many_rules(self, large_catalog: dict, benchmark) -> None:
+        """Benchmark applying hundreds of select and metadata rules."""
+        rules = [
+            *select_metadata_rules(["!*.*"]),
+            *select_metadata_rules(
+                f"stream_{i}.property_{i % 30}" for i in range(0, 400, 2)
+            ),
+            *select_metadata_rules(f"!stream_{i}*.property_1?" for i in range(20)),
+            *(
+                MetadataRule(
+                    tap_stream_id=f"stream_{i}",
+                    breadcrumb=["properties", "property_0"],
+                    key="is-replication-key",
+                    value=True,
+                )
+                for i in range(400)
+            ),
+        ]
+        executor = MetadataExecutor(rules)
+        benchmark(executor.visit, large_catalog)
+
+    @pytest.mark.benchmark
+    def test_select_executor_wide_stream(self, benchmark) -> None:
+        """Benchmark selecting a stream without any property metadata."""
+        executor = SelectExecutor(["stream_0.*"])
+
+        def select() -> None:
+            executor.visit(generate_catalog(1, 5000))
+
+        benchmark(select)
+
+    @pytest.mark.benchmark
+    def test_schema_executor(self, large_catalog: dict, benchmark) -> None:
+        """Benchmark applying schema rules to a large catalog."""
+        executor = SchemaExecutor(
+            [
+                SchemaRule(
+                    tap_stream_id="stream_1*",
+                    breadcrumb=["properties", "property_1"],
+                    payload={"type": ["null", "string"], "format": "date-time"},
+                ),
+            ],
+        )
+        benchmark(executor.visit, large_catalog)
+
+    @pytest.mark.benchmark
+    def test_select_executor_streaming(self, large_catalog: dict, benchmark) -> None:
+        """Benchmark selecting streams of a catalog processed one stream at a time."""
+        executor = SelectExecutor(["stream_1*.*", "!*.property_2*"])
+        catalog_json = json.dumps(large_catalog, indent=2)
+
+        def select() -> None:
+            process_catalog(
+                io.StringIO(catalog_json),
+                io.StringIO(),
+                visit_stream=lambda stream: executor.visit({"streams": [stream]}),
+            )
+
+        benchmark(select)
+
+    @pytest.mark.benchmark
+    def test_list_selected_executor(self, large_catalog: dict, benchmark) -> None:
+        """Benchmark listing the selected streams and properties of a catalog."""
+
+        def list_selected() -> None:
+            ListSelectedExecutor().visit(large_catalog)
+
+        benchmark(list_selected)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import typing as t
+
+import pytest
+
+from asserts import assert_cli_runner
+from meltano.cli import cli
+from meltano.cli.utils import CliError
+from meltano.core.plugin.error import PluginExecutionError
+from meltano.core.plugin.singer.tap import SingerTap
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from fixtures.cli import MeltanoCliRunner
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.plugin_invoker import PluginInvoker
+    from meltano.core.project import Project
+
+
+class TestCliDiscover:
+    @pytest.mark.parametrize(
+        "args",
+        (
+            pytest.param(("tap-mock", "tap-mock-inherited"), id="names"),
+            pytest.param(("--all",), id="all"),
+        ),
+    )
+    def test_discover(
+        self,
+        project: Project,
+        cli_runner: MeltanoCliRunner,
+        tap: ProjectPlugin,
+        inherited_tap: ProjectPlugin,
+        monkeypatch: pytest.MonkeyPatch,
+        args: tuple[str, ...],
+    ) -> None:
+        async def mock_run_discovery(
+            _tap: SingerTap,
+            plugin_invoker: PluginInvoker,
+            catalog_path: Path,
+        ) -> None:
+            catalog = {"streams": [], "name": plugin_invoker.plugin.name}
+            catalog_path.write_text(json.dumps(catalog))  # noqa: ASYNC240
+
+        monkeypatch.setattr(SingerTap, "run_discovery", mock_run_discovery)
+
+        result = cli_runner.invoke(
+            cli,
+            ["--no-environment", "discover", "--refresh-catalog", *args],
+        )
+        assert_cli_runner(result)
+
+        for plugin in (tap, inherited_tap):
+            catalog_path = project.dirs.run(plugin.name, "tap.properties.json")
+            assert json.loads(catalog_path.read_text())["name"] == plugin.name
+
+    @pytest.mark.usefixtures("project")
+    def test_discover_failure(
+        self,
+        cli_runner: MeltanoCliRunner,
+        tap: ProjectPlugin,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def mock_run_discovery(*args: t.Any) -> None:  # noqa: ARG001
+            msg = "Catalog discovery failed: tap crashed"
+            raise PluginExecutionError(msg)
+
+        monkeypatch.setattr(SingerTap, "run_discovery", mock_run_discovery)
+
+        result = cli_runner.invoke(
+            cli,
+            ["--no-environment", "discover", "--refresh-catalog", tap.name],
+        )
+        assert result.exit_code == 1
+        assert isinstance(result.exception, CliError)
+        assert str(result.exception) == "Catalog discovery failed for 1 extractor(s)"
+
+    @pytest.mark.usefixtures("project")
+    def test_discover_no_extractors(self, cli_runner: MeltanoCliRunner) -> None:
+        result = cli_runner.invoke(cli, ["--no-environment", "discover"])
+        assert result.exit_code == 1
+        assert isinstance(result.exception, CliError)
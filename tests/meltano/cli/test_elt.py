@@ -903,7 +903,8 @@ class TestCliEltScratchpadOne:
         result = cli_runner.invoke(cli, args)
         assert_cli_runner(result)
 
-        assert json.loads(result.stdout) == catalog
+        # The catalog is pretty-printed
+        assert result.stdout.rstrip("\n") == json.dumps(catalog, indent=2)
 
     @pytest.mark.usefixtures("session")
     @pytest.mark.parametrize("command", ("elt", "el"), ids=["elt", "el"])
@@ -10,6 +10,8 @@ from unittest.mock import AsyncMock
 import pytest
 
 from meltano.cli import cli
+from meltano.cli.run import _run_blocks_concurrently
+from meltano.core.behavior.hookable import HookObject, hook
 from meltano.core.block.ioblock import IOBlock
 from meltano.core.logging.job_logging_service import MissingJobLogException
 from meltano.core.logging.utils import default_config
@@ -549,6 +551,37 @@ class TestCliRunScratchpadOne:
             assert completion_events[1]["success"]
             assert completion_events[1]["duration_seconds"] > 0
 
+    @pytest.mark.backend("sqlite")
+    @pytest.mark.usefixtures(
+        "use_test_log_config",
+        "project",
+        "dbt",
+        "job_logging_service",
+    )
+    def test_run_parallelism_commands_in_order(self, cli_runner, dbt_process) -> None:
+        # Command blocks are barriers, so they still run one after another
+        invoke_async = AsyncMock(side_effect=(dbt_process, dbt_process))
+        args = ["run", "--parallelism", "4", "dbt:test", "dbt:run"]
+        with mock.patch.object(PluginInvoker, "invoke_async", new=invoke_async):
+            result = cli_runner.invoke(cli, args, catch_exceptions=False)
+            assert result.exit_code == 0
+
+            assert invoke_async.call_count == 2
+            assert invoke_async.mock_calls[0][2]["command"] == "test"
+            assert invoke_async.mock_calls[1][2]["command"] == "run"
+
+            matcher = EventMatcher(result.stderr)
+            completion_events = matcher.find_by_event("Block run completed")
+            assert [event["set_number"] for event in completion_events] == [0, 1]
+            assert all(event["success"] for event in completion_events)
+
+    @pytest.mark.backend("sqlite")
+    @pytest.mark.usefixtures("use_test_log_config", "project")
+    def test_run_parallelism_invalid(self, cli_runner) -> None:
+        result = cli_runner.invoke(cli, ["run", "--parallelism", "0", "dbt:run"])
+        assert result.exit_code == 2
+        assert "--parallelism" in result.stderr
+
     @pytest.mark.backend("sqlite")
     @pytest.mark.usefixtures(
         "use_test_log_config",
@@ -1362,6 +1395,40 @@ class TestCliRunScratchpadOne:
             assert create_subprocess_exec.call_count == 0
             assert asyncio_mock.call_count == 0
 
+    @pytest.mark.backend("sqlite")
+    @pytest.mark.usefixtures("use_test_log_config", "project", "job_logging_service")
+    def test_run_dry_run_fan_out(
+        self,
+        cli_runner,
+        tap,
+        target,
+        alternative_target,
+    ) -> None:
+        loaders = f"{target.name},{alternative_target.name}"
+        args = ["run", "--dry-run", tap.name, loaders]
+        with (
+            mock.patch.object(SingerTap, "discover_catalog"),
+            mock.patch.object(SingerTap, "apply_catalog_rules"),
+        ):
+            result = cli_runner.invoke(cli, args, catch_exceptions=True)
+            assert result.exit_code == 0
+
+            matcher = EventMatcher(result.stderr)
+            events = matcher.find_by_event("Dry run, but would have run block 1/1.")
+            assert len(events) == 1
+            assert events[0]["comprised_of"] == [
+                tap.name,
+                target.name,
+                alternative_target.name,
+            ]
+
+        args = ["run", "--dry-run", tap.name, f"{target.name},{tap.name}"]
+        result = cli_runner.invoke(cli, args)
+        assert result.exit_code == 1
+        assert f"Block {tap.name} in '{target.name},{tap.name}' is not a loader" in (
+            result.stderr
+        )
+
     @pytest.mark.backend("sqlite")
     @pytest.mark.usefixtures("project")
     @pytest.mark.parametrize("colors", (True, False))
@@ -1648,3 +1715,44 @@ class TestCliRunScratchpadOne:
             completed_events = matcher.find_by_event("Block run completed")
             assert len(completed_events) == 2
             assert all(event["success"] for event in completed_events)
+
+
+@pytest.mark.asyncio
+async def test_run_blocks_concurrently_shared_plugin_hooks() -> None:
+    # Sets sharing a loader run its invoke hooks concurrently on the same object
+    class SharedPlugin(HookObject):
+        def __init__(self) -> None:
+            self.invocations = 0
+
+        @hook("before_invoke")
+        async def before_invoke(self) -> None:
+            self.invocations += 1
+
+    plugin = SharedPlugin()
+    running = []
+    both_running = asyncio.Event()
+
+    async def run_block(*args: t.Any, **kwargs: t.Any) -> None:  # noqa: ARG001
+        async with plugin.trigger_hooks("invoke"):
+            running.append(True)
+            if len(running) == 2:
+                both_running.set()
+            await both_running.wait()
+
+    parsed_blocks = [mock.Mock(), mock.Mock()]
+    with (
+        mock.patch("meltano.cli.run.block_dependencies", return_value=[[], []]),
+        mock.patch("meltano.cli.run._run_block", new=run_block),
+    ):
+        await asyncio.wait_for(
+            _run_blocks_concurrently(
+                mock.Mock(),
+                mock.Mock(),
+                parsed_blocks,
+                dry_run=False,
+                parallelism=2,
+            ),
+            timeout=5,
+        )
+
+    assert plugin.invocations == 2
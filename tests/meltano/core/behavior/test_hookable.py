@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import NoReturn  # noqa: ICN003
 from unittest import mock
 
@@ -89,3 +90,62 @@ class TestHookable:
             "after_test_2",
         ]
         process.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_trigger_hook_nested(self) -> None:
+        subject = Hooked()
+
+        async with subject.trigger_hooks("test"):
+            subject.call("process")
+            # Hooks are not triggered again while they're being triggered
+            async with subject.trigger_hooks("test"):
+                subject.call("nested_process")
+
+        assert subject.calls == [
+            "before_test",
+            "before_test_2",
+            "process",
+            "nested_process",
+            "after_test",
+            "after_test_2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_trigger_hook_concurrent(self) -> None:
+        subject = Hooked()
+        started = asyncio.Event()
+
+        async def trigger() -> None:
+            async with subject.trigger_hooks("test"):
+                started.set()
+                await asyncio.sleep(0)
+
+        async def trigger_concurrently() -> None:
+            await started.wait()
+            async with subject.trigger_hooks("test"):
+                pass
+
+        # Other tasks still trigger the hooks of the same object
+        await asyncio.gather(trigger(), trigger_concurrently())
+        assert subject.calls.count("before_test") == 2
+        assert subject.calls.count("after_test") == 2
+
+    @pytest.mark.asyncio
+    async def test_trigger_hook_after_raise(self) -> None:
+        subject = Hooked()
+        with pytest.raises(ValueError, match="failed"):  # noqa: PT012
+            async with subject.trigger_hooks("test"):
+                msg = "failed"
+                raise ValueError(msg)
+
+        async with subject.trigger_hooks("test"):
+            pass
+
+        assert subject.calls == [
+            "before_test",
+            "before_test_2",
+            "before_test",
+            "before_test_2",
+            "after_test",
+            "after_test_2",
+        ]
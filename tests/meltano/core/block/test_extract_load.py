@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+import sys
 import tempfile
 import typing as t
 import uuid
@@ -26,6 +28,8 @@ from meltano.core.environment import Environment
 from meltano.core.job import Job, Payload, State
 from meltano.core.logging import OutputLogger
 from meltano.core.plugin import PluginType
+from meltano.core.plugin.singer import SingerTap
+from meltano.core.plugin.singer.catalog import StreamPartition
 from meltano.core.plugin_invoker import PluginInvoker
 from meltano.core.project_plugins_service import PluginAlreadyAddedException
 from meltano.core.runner import RunnerError
@@ -126,6 +130,22 @@ class TestELBContextBuilder:
         assert builder._env.items() >= block.context.env.items()
         assert builder._env.items() >= block2.context.env.items()
 
+    def test_make_block_isolated_run_dirs(self, project, session, tap, target) -> None:
+        """Ensure downstream plugins get a run dir scoped to the extractor."""
+        builder = ELBContextBuilder(project).with_isolated_run_dirs(isolate=True)
+        builder.session = session
+
+        block = builder.make_block(tap)
+        assert block.invoker.plugin_config_service.run_dir == project.dirs.run(
+            tap.name,
+        )
+
+        block = builder.make_block(target)
+        assert block.invoker.plugin_config_service.run_dir == project.dirs.run(
+            target.name,
+            tap.name,
+        )
+
     @pytest.mark.asyncio
     async def test_validate_envs(self, project, session, tap, target_postgres) -> None:
         """Ensure that expected environment variables are present."""
@@ -327,6 +347,95 @@ class TestExtractLoadBlocks:
             # block2 should write output to logger and no where else
             assert len(elb.blocks[2].outputs) == 1
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("session", "subject", "log")
+    async def test_link_io_stream_metrics(
+        self,
+        monkeypatch,
+        tap_config_dir,
+        target_config_dir,
+        tap,
+        target,
+        tap_process,
+        target_process,
+        plugin_invoker_factory,
+        elb_context,
+    ) -> None:
+        monkeypatch.setenv("MELTANO_ELT_STREAM_METRICS", "true")
+        tap_invoker = plugin_invoker_factory(tap, config_dir=tap_config_dir)
+        target_invoker = plugin_invoker_factory(target, config_dir=target_config_dir)
+
+        invoke_async = AsyncMock(side_effect=(tap_process, target_process))
+        with mock.patch.object(PluginInvoker, "invoke_async", new=invoke_async):
+            blocks = tuple(
+                SingerBlock(
+                    block_ctx=elb_context,
+                    project=elb_context.project,
+                    plugin_invoker=invoker,
+                    plugin_args=[],
+                )
+                for invoker in (tap_invoker, target_invoker)
+            )
+
+            elb = ExtractLoadBlocks(elb_context, blocks)
+            for block in elb.blocks:
+                await block.pre(elb.context)
+                await block.start()
+
+            await elb._link_io()
+
+            # Only the output of the producer is measured
+            assert [metrics.string_id for metrics in elb._stream_metrics] == [
+                tap.name,
+            ]
+            assert elb._stream_metrics[0] in elb.blocks[0].outputs
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("session", "subject", "log")
+    async def test_resource_sampling(
+        self,
+        monkeypatch,
+        tap_config_dir,
+        target_config_dir,
+        tap,
+        target,
+        tap_process,
+        target_process,
+        plugin_invoker_factory,
+        elb_context,
+        test_job,
+    ) -> None:
+        monkeypatch.setenv("MELTANO_ELT_RESOURCE_SAMPLING", "true")
+        tap_process.pid = target_process.pid = os.getpid()
+        tap_invoker = plugin_invoker_factory(tap, config_dir=tap_config_dir)
+        target_invoker = plugin_invoker_factory(target, config_dir=target_config_dir)
+
+        invoke_async = AsyncMock(side_effect=(tap_process, target_process))
+        with mock.patch.object(PluginInvoker, "invoke_async", new=invoke_async):
+            blocks = tuple(
+                SingerBlock(
+                    block_ctx=elb_context,
+                    project=elb_context.project,
+                    plugin_invoker=invoker,
+                    plugin_args=[],
+                )
+                for invoker in (tap_invoker, target_invoker)
+            )
+
+            elb = ExtractLoadBlocks(elb_context, blocks)
+            elb.context.job = test_job
+            async with elb._start_blocks():
+                assert [s.string_id for s in elb._resource_samplers] == [
+                    tap.name,
+                    target.name,
+                ]
+                while not all(s.samples for s in elb._resource_samplers):  # noqa: ASYNC110
+                    await asyncio.sleep(0.01)
+
+        resources = test_job.payload["resources"]
+        assert set(resources) == {tap.name, target.name}
+        assert resources[tap.name]["rss_bytes_peak"] > 0
+
     @pytest.mark.asyncio
     @pytest.mark.usefixtures("session", "subject", "log")
     async def test_extract_load_block(
@@ -598,6 +707,223 @@ class TestExtractLoadBlocks:
         assert extract_load_blocks.context.job is not None
         assert extract_load_blocks.context.job.run_id == run_id
 
+    @pytest.mark.asyncio
+    async def test_stream_partitions_merge_state(
+        self,
+        tap,
+        target,
+        project_with_environment: Project,
+    ) -> None:
+        partitions = []
+        for index in range(2):
+            builder = ELBContextBuilder(project_with_environment).with_stream_partition(
+                StreamPartition(index, 2),
+            )
+            blocks = (builder.make_block(tap), builder.make_block(target))
+            partitions.append(ExtractLoadBlocks(builder.context(), blocks))
+
+        first, second = partitions
+        elb = ExtractLoadBlocks(first.context, first.blocks, [second])
+        assert elb.context.stream_partition == StreamPartition(0, 2)
+        assert second.context.job.job_name == elb.context.job.job_name
+        elb.state_service.clear_state(elb.context.job.job_name)
+
+        elb.context.job.payload = {
+            "singer_state": {"bookmarks": {"a": {"version": 1}}},
+        }
+        second.context.job.payload = {
+            "singer_state": {"bookmarks": {"b": {"version": 2}}},
+        }
+
+        with (
+            mock.patch.object(ExtractLoadBlocks, "_execute_blocks") as execute_blocks,
+            mock.patch.object(ExtractLoadBlocks, "_execute_with_job") as execute_job,
+        ):
+            await elb.execute()
+
+        execute_blocks.assert_awaited_once()
+        execute_job.assert_awaited_once()
+        assert elb.state_service.get_state(elb.context.job.job_name) == {
+            "singer_state": {
+                "bookmarks": {"a": {"version": 1}, "b": {"version": 2}},
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_stream_partitions_keep_unselected_state(
+        self,
+        tap,
+        target,
+        project_with_environment: Project,
+    ) -> None:
+        partitions = []
+        for index in range(2):
+            builder = ELBContextBuilder(project_with_environment).with_stream_partition(
+                StreamPartition(index, 2),
+            )
+            blocks = (builder.make_block(tap), builder.make_block(target))
+            partitions.append(ExtractLoadBlocks(builder.context(), blocks))
+
+        first, second = partitions
+        elb = ExtractLoadBlocks(first.context, first.blocks, [second])
+        state_id = elb.context.job.job_name
+        elb.state_service.clear_state(state_id)
+        elb.state_service.update_state_store(
+            state_id,
+            {
+                "singer_state": {
+                    "bookmarks": {
+                        "a": {"version": 0},
+                        "unselected": {"version": 0},
+                    },
+                },
+            },
+        )
+
+        elb.context.job.payload = {
+            "singer_state": {"bookmarks": {"a": {"version": 1}}},
+        }
+        second.context.job.payload = {
+            "singer_state": {"bookmarks": {"b": {"version": 2}}},
+        }
+
+        with (
+            mock.patch.object(ExtractLoadBlocks, "_execute_blocks"),
+            mock.patch.object(ExtractLoadBlocks, "_execute_with_job"),
+        ):
+            await elb.execute()
+
+        # Streams extracted by none of the partitions keep their bookmarks
+        assert elb.state_service.get_state(state_id) == {
+            "singer_state": {
+                "bookmarks": {
+                    "a": {"version": 1},
+                    "b": {"version": 2},
+                    "unselected": {"version": 0},
+                },
+            },
+        }
+
+    def test_stream_partition_run_dirs(
+        self,
+        tap,
+        target,
+        project_with_environment: Project,
+    ) -> None:
+        builder = ELBContextBuilder(project_with_environment).with_stream_partition(
+            StreamPartition(1, 2),
+        )
+        tap_block = builder.make_block(tap)
+        target_block = builder.make_block(target)
+
+        assert tap_block.invoker.plugin_config_service.run_dir == (
+            project_with_environment.dirs.run(tap.name, "partition-1")
+        )
+        assert target_block.invoker.plugin_config_service.run_dir == (
+            project_with_environment.dirs.run(target.name, "partition-1")
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("forwarding_mode", ("line", "chunked"))
+    async def test_resume_from_spool(
+        self,
+        tap,
+        target,
+        project: Project,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        forwarding_mode: str,
+    ) -> None:
+        monkeypatch.setenv("MELTANO_ELT_FORWARDING_MODE", forwarding_mode)
+        messages = [
+            {"type": "SCHEMA", "stream": "users", "schema": {}, "key_properties": []},
+            {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+            {"type": "STATE", "value": {"bookmark": 1}},
+            {"type": "RECORD", "stream": "users", "record": {"id": 2}},
+            {"type": "STATE", "value": {"bookmark": 2}},
+            {"type": "RECORD", "stream": "users", "record": {"id": 3}},
+            {"type": "STATE", "value": {"bookmark": 3}},
+        ]
+        received = tmp_path / "received.jsonl"
+        # The last messages are output once the loader failed, the last one
+        # split over two writes
+        last_message = json.dumps(messages[6])
+        tap_script = "; ".join(
+            (
+                "import sys, time",
+                *(f"print({json.dumps(json.dumps(m))})" for m in messages[:5]),
+                "sys.stdout.flush()",
+                "time.sleep(1)",
+                f"print({json.dumps(json.dumps(messages[5]))})",
+                f"sys.stdout.write({json.dumps(last_message[:10])})",
+                "sys.stdout.flush()",
+                "time.sleep(0.5)",
+                f"print({json.dumps(last_message[10:])})",
+            ),
+        )
+        # Emits the first state, then fails on the second one
+        failing_target_script = (
+            "import json, sys\n"
+            "states = 0\n"
+            "for line in sys.stdin:\n"
+            "    message = json.loads(line)\n"
+            "    if message['type'] == 'STATE':\n"
+            "        states += 1\n"
+            "        if states == 2:\n"
+            "            sys.exit(1)\n"
+            "        print(json.dumps(message['value']), flush=True)\n"
+        )
+        target_script = (
+            "import sys\n"
+            f"with open({str(received)!r}, 'w') as received:\n"
+            "    received.writelines(sys.stdin)\n"
+        )
+        target_scripts = iter((failing_target_script, target_script))
+
+        async def invoke_async(invoker, **kwargs):
+            script = (
+                tap_script
+                if invoker.plugin.type == PluginType.EXTRACTORS
+                else next(target_scripts)
+            )
+            return await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                script,
+                stdin=kwargs["stdin"],
+                stdout=kwargs["stdout"],
+                stderr=kwargs["stderr"],
+            )
+
+        def make_elb(*, resume_from_spool: bool) -> ExtractLoadBlocks:
+            builder = (
+                ELBContextBuilder(project)
+                .with_spool(spool=True)
+                .with_resume_from_spool(resume_from_spool=resume_from_spool)
+            )
+            blocks = (builder.make_block(tap), builder.make_block(target))
+            return ExtractLoadBlocks(builder.context(), blocks)
+
+        with (
+            mock.patch.object(PluginInvoker, "invoke_async", new=invoke_async),
+            mock.patch.object(SingerTap, "discover_catalog"),
+            mock.patch.object(SingerTap, "apply_catalog_rules"),
+        ):
+            elb = make_elb(resume_from_spool=False)
+            with pytest.raises(RunnerError, match="Loader failed"):
+                await elb.execute()
+
+            # The output of the extractor was spooled up to its end
+            assert elb.spool.complete
+            assert elb.spool.acknowledged == 1
+
+            elb = make_elb(resume_from_spool=True)
+            await elb.execute()
+
+        replayed = [json.loads(line) for line in received.read_text().splitlines()]
+        assert replayed == [messages[0], *messages[3:]]
+        assert not elb.spool.directory.exists()
+
 
 class TestExtractLoadUtils:
     def test_generate_state_id(self) -> None:
@@ -1,9 +1,46 @@
 from __future__ import annotations
 
-from meltano.core.block.block_parser import is_command_block
+from unittest import mock
+
+from meltano.core.block.block_parser import block_dependencies, is_command_block
+from meltano.core.block.extract_load import ExtractLoadBlocks
+from meltano.core.block.plugin_command import InvokerCommand
+
+
+def _elb(extractor: str, state_id: str | None = None) -> ExtractLoadBlocks:
+    elb = mock.Mock(spec=ExtractLoadBlocks)
+    elb.head = mock.Mock(string_id=extractor)
+    elb.context = mock.Mock(job=mock.Mock(job_name=state_id) if state_id else None)
+    return elb
 
 
 class TestParserUtils:
     def test_is_command_block(self, tap, dbt) -> None:
         assert not is_command_block(tap)
         assert is_command_block(dbt)
+
+    def test_block_dependencies_independent_sets(self) -> None:
+        blocks = [_elb("tap-a", "dev:a"), _elb("tap-b", "dev:b")]
+        assert block_dependencies(blocks) == [set(), set()]
+
+    def test_block_dependencies_shared_extractor(self) -> None:
+        blocks = [
+            _elb("tap-a", "dev:a-to-x"),
+            _elb("tap-b", "dev:b-to-x"),
+            _elb("tap-a", "dev:a-to-y"),
+        ]
+        assert block_dependencies(blocks) == [set(), set(), {0}]
+
+    def test_block_dependencies_shared_state_id(self) -> None:
+        blocks = [_elb("tap-a", "dev:shared"), _elb("tap-b", "dev:shared")]
+        assert block_dependencies(blocks) == [set(), {0}]
+
+    def test_block_dependencies_command_barrier(self) -> None:
+        blocks = [
+            _elb("tap-a"),
+            _elb("tap-b"),
+            mock.Mock(spec=InvokerCommand),
+            _elb("tap-a"),
+            _elb("tap-c"),
+        ]
+        assert block_dependencies(blocks) == [set(), set(), {0, 1}, {2}, {2}]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from meltano.core.block.resource_sampler import ResourceSampler
+
+ALLOCATE_AND_WAIT = """
+import sys
+import time
+
+data = bytearray(64 * 1024 * 1024)
+sys.stdout.write("ready\\n")
+sys.stdout.flush()
+time.sleep(60)
+"""
+
+
+class TestResourceSampler:
+    @pytest.fixture
+    def process(self):
+        with subprocess.Popen(
+            [sys.executable, "-c", ALLOCATE_AND_WAIT],
+            stdout=subprocess.PIPE,
+        ) as process:
+            assert process.stdout.readline() == b"ready\n"
+            yield process
+            process.kill()
+
+    def test_sample(self, process) -> None:
+        sampler = ResourceSampler("target-mock", process.pid, interval=60)
+        assert sampler.sample()
+        assert sampler.sample()
+
+        summary = sampler.summary()
+        assert summary["samples"] == 2
+        assert summary["rss_bytes_peak"] >= 64 * 1024 * 1024
+        assert summary["rss_bytes_avg"] >= 64 * 1024 * 1024
+        assert summary["cpu_percent_peak"] >= 0
+
+        process.kill()
+        process.wait()
+        assert not sampler.sample()
+        assert sampler.summary()["samples"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stop(self, process) -> None:
+        sampler = ResourceSampler("target-mock", process.pid, interval=0.01)
+        sampler.start()
+        while not sampler.samples:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+        summary = await sampler.stop()
+        assert summary["samples"] >= 1
+        assert summary["rss_bytes_peak"] >= 64 * 1024 * 1024
+
+    def test_no_process(self) -> None:
+        sampler = ResourceSampler("target-mock", 2**22 + 1, interval=60)
+        assert not sampler.sample()
+        assert sampler.summary() == {
+            "samples": 0,
+            "cpu_percent_peak": 0.0,
+            "cpu_percent_avg": 0.0,
+            "rss_bytes_peak": 0,
+            "rss_bytes_avg": 0,
+            "read_bytes": 0,
+            "write_bytes": 0,
+        }
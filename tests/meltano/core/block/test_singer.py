@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 import tempfile
 import typing as t
 from unittest import mock
@@ -10,7 +11,7 @@ import pytest
 import structlog
 from structlog.testing import capture_logs
 
-from meltano.core.block.singer import SingerBlock
+from meltano.core.block.singer import ForwardingMode, IOLinkError, SingerBlock
 from meltano.core.job import Job
 from meltano.core.logging import OutputLogger
 
@@ -243,3 +244,122 @@ class TestSingerBlocks:
         await consumer.start()
         await consumer.close_stdin()
         assert consumer.process_handle.stdin.wait_closed.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_singer_block_io_chunked(
+        self,
+        elt_context,
+        mock_tap_plugin_invoker,
+        log,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("MELTANO_ELT_FORWARDING_MODE", "chunked")
+        producer = SingerBlock(
+            block_ctx=elt_context,
+            project=elt_context.project,
+            plugin_invoker=mock_tap_plugin_invoker,
+            plugin_args={"foo": "bar"},
+        )
+        assert producer.forwarding_mode == ForwardingMode.chunked
+
+        mock_tap_plugin_invoker.output_handlers = []
+
+        output_log = OutputLogger(log)
+        log = structlog.getLogger("test")
+        producer.stdout_link(output_log.out("stdout", log))
+
+        await producer.start()
+        stdout = producer.process_handle.stdout
+        stdout.at_eof.side_effect = (False, False, True)
+        stdout.read = AsyncMock(side_effect=(b"out1\nout2\nou", b"t3\n"))
+
+        with capture_logs() as cap_logs:
+            await producer.proxy_stdout()
+
+        assert cap_logs == [
+            {"name": "stdout", "event": "out1", "log_level": "info"},
+            {"name": "stdout", "event": "out2", "log_level": "info"},
+            {"name": "stdout", "event": "out3", "log_level": "info"},
+        ]
+        stdout.readline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_singer_block_pipe_to(
+        self,
+        elt_context,
+        mock_tap_plugin_invoker,
+        mock_target_plugin_invoker,
+    ) -> None:
+        async def invoke_tap(**kwargs):
+            return await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                "print('out1'); print('out2')",
+                stdin=kwargs["stdin"],
+                stdout=kwargs["stdout"],
+                stderr=kwargs["stderr"],
+            )
+
+        async def invoke_target(**kwargs):
+            return await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                "import sys; [print(line.upper(), end='') for line in sys.stdin]",
+                stdin=kwargs["stdin"],
+                stdout=kwargs["stdout"],
+                stderr=kwargs["stderr"],
+            )
+
+        mock_tap_plugin_invoker.invoke_async = AsyncMock(side_effect=invoke_tap)
+        mock_target_plugin_invoker.invoke_async = AsyncMock(side_effect=invoke_target)
+        mock_tap_plugin_invoker.output_handlers = {}
+        mock_target_plugin_invoker.output_handlers = {}
+
+        producer = SingerBlock(
+            block_ctx=elt_context,
+            project=elt_context.project,
+            plugin_invoker=mock_tap_plugin_invoker,
+            plugin_args={"foo": "bar"},
+        )
+        consumer = SingerBlock(
+            block_ctx=elt_context,
+            project=elt_context.project,
+            plugin_invoker=mock_target_plugin_invoker,
+            plugin_args={"foo": "bar"},
+        )
+
+        with pytest.raises(IOLinkError):
+            consumer.pipe_to(producer)
+
+        producer.pipe_to(consumer)
+        await producer.start()
+        await consumer.start()
+
+        assert isinstance(
+            mock_tap_plugin_invoker.invoke_async.call_args[1]["stdout"],
+            int,
+        )
+        assert isinstance(
+            mock_target_plugin_invoker.invoke_async.call_args[1]["stdin"],
+            int,
+        )
+        assert producer.process_handle.stdout is None
+        assert consumer.stdin is None
+
+        output_lines = []
+
+        class LineWriter:
+            def writeline(self, line: str) -> None:
+                output_lines.append(line)
+
+        consumer.stdout_link(LineWriter())
+        await asyncio.gather(
+            producer.proxy_stdout(),
+            consumer.proxy_stdout(),
+            producer.process_future,
+            consumer.process_future,
+        )
+        assert output_lines == ["OUT1\n", "OUT2\n"]
+
+        with pytest.raises(IOLinkError):
+            producer.pipe_to(consumer)
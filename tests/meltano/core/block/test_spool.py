@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import typing as t
+
+import pytest
+
+from meltano.core.block.spool import Spool, SpoolAcknowledgements
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+MESSAGES = (
+    {"type": "SCHEMA", "stream": "users", "schema": {}, "key_properties": []},
+    {"type": "RECORD", "stream": "users", "record": {"id": 1}},
+    {"type": "STATE", "value": {"bookmark": 1}},
+    {"type": "SCHEMA", "stream": "teams", "schema": {}, "key_properties": []},
+    {"type": "RECORD", "stream": "teams", "record": {"id": 2}},
+    {"type": "STATE", "value": {"bookmark": 2}},
+    {"type": "RECORD", "stream": "users", "record": {"id": 3}},
+    {"type": "STATE", "value": {"bookmark": 3}},
+)
+
+
+async def read_all(spool: Spool, read_size: int = 64) -> list[dict]:
+    reader = spool.reader()
+    data = b""
+    while not reader.at_eof():
+        data += await reader.read(read_size)
+    return [json.loads(line) for line in data.splitlines()]
+
+
+class TestSpool:
+    @pytest.fixture
+    def spool(self, tmp_path: Path) -> Spool:
+        # Small segments, so messages are spread over several of them
+        spool = Spool(tmp_path / "spool", segment_size=100)
+        writer = spool.writer()
+        for message in MESSAGES:
+            writer.writeline(f"{json.dumps(message)}\n")
+        writer.close(complete=True)
+        return spool
+
+    def test_writer(self, spool: Spool, tmp_path: Path) -> None:
+        assert spool.complete
+        assert len(spool.segments) > 1
+        assert spool.acknowledged == 0
+
+        writer = Spool(tmp_path / "incomplete").writer()
+        writer.writeline("{}\n")
+        writer.close(complete=False)
+        assert not writer.spool.complete
+
+    @pytest.mark.asyncio
+    async def test_read(self, spool: Spool) -> None:
+        assert await read_all(spool) == list(MESSAGES)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("read_size", (1, 64, -1))
+    async def test_read_after_acknowledged(self, spool: Spool, read_size: int) -> None:
+        spool.acknowledge(2)
+        assert await read_all(spool, read_size) == [
+            MESSAGES[0],
+            MESSAGES[3],
+            *MESSAGES[6:],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_all_acknowledged(self, spool: Spool) -> None:
+        spool.acknowledge(3)
+        assert await read_all(spool) == [MESSAGES[0], MESSAGES[3]]
+
+    def test_acknowledgements(self, spool: Spool) -> None:
+        acknowledgements = SpoolAcknowledgements(spool, 1)
+        for message in MESSAGES:
+            acknowledgements.writeline(json.dumps(message))
+
+        acknowledgements.consumer(0).writeline(json.dumps({"bookmark": 2}))
+        assert spool.acknowledged == 2
+
+        # Replayed output starts after the acknowledged state
+        acknowledgements = SpoolAcknowledgements(spool, 1, resume=True)
+        acknowledgements.writeline(json.dumps(MESSAGES[7]))
+        acknowledgements.consumer(0).writeline(json.dumps({"bookmark": 3}))
+        assert spool.acknowledged == 3
+
+    def test_writer_replaces_spool(self, spool: Spool) -> None:
+        spool.acknowledge(2)
+        spool.writer().close(complete=False)
+        assert not spool.complete
+        assert not spool.segments
+        assert spool.acknowledged == 0
+
+        spool.remove()
+        assert not spool.directory.exists()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+
+from structlog.testing import capture_logs
+
+from meltano.core.block.stream_metrics import StreamCounts, StreamMetrics
+
+
+def message(message_type: str, **fields) -> str:
+    return json.dumps({"type": message_type, **fields}) + "\n"
+
+
+SCHEMA = message(
+    "SCHEMA",
+    stream="users",
+    schema={"type": "object", "properties": {"id": {"type": "integer"}}},
+    key_properties=["id"],
+)
+USER = message("RECORD", stream="users", record={"id": 1, "type": "admin"})
+ORDER = message("RECORD", stream="orders", record={"id": 1})
+BATCH = message("BATCH", stream="orders", encoding={}, manifest=[])
+STATE = message("STATE", value={"bookmarks": {"users": {"id": 1}}})
+
+
+class TestStreamMetrics:
+    def test_counts(self) -> None:
+        metrics = StreamMetrics("tap-mock", interval=60)
+        for line in (
+            SCHEMA,
+            USER,
+            USER,
+            ORDER,
+            BATCH,
+            STATE,
+            message("ACTIVATE_VERSION", version=1),
+            "not json\n",
+        ):
+            metrics.writeline(line)
+
+        assert metrics.streams == {
+            "users": StreamCounts(
+                records=2,
+                schemas=1,
+                bytes=len(SCHEMA) + 2 * len(USER),
+            ),
+            "orders": StreamCounts(
+                records=1,
+                batches=1,
+                bytes=len(ORDER) + len(BATCH),
+            ),
+        }
+        assert metrics.state_messages == 1
+        assert metrics.other_messages == 2
+
+    def test_escaped_stream_name(self) -> None:
+        metrics = StreamMetrics("tap-mock", interval=60)
+        metrics.writeline(message("RECORD", stream='public-"quoted"', record={}))
+        assert list(metrics.streams) == [r"public-\"quoted\""]
+
+    def test_periodic_report(self) -> None:
+        metrics = StreamMetrics("tap-mock", interval=0)
+        with capture_logs() as logs:
+            metrics.writeline(USER)
+            metrics.writeline(STATE)
+
+        # Streams without new records since the last report are not reported
+        assert [
+            (log["event"], log["stream"], log["records"])
+            for log in logs
+            if log["event"] == "Stream throughput"
+        ] == [("Stream throughput", "users", 1)]
+
+    def test_summary(self) -> None:
+        metrics = StreamMetrics("tap-mock", interval=60)
+        for line in (USER, ORDER, ORDER, STATE):
+            metrics.writeline(line)
+
+        with capture_logs() as logs:
+            metrics.log_summary()
+
+        assert [log["stream"] for log in logs[:-1]] == ["orders", "users"]
+        assert logs[-1]["event"] == "Block stream metrics summary"
+        assert logs[-1]["block"] == "tap-mock"
+        assert logs[-1]["streams"] == 2
+        assert logs[-1]["records"] == 3
+        assert logs[-1]["bytes"] == len(USER) + 2 * len(ORDER)
+        assert logs[-1]["state_messages"] == 1
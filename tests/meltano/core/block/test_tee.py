@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from meltano.core.block.tee import StateAcknowledgements, TeeBlock
+
+
+def state_message(value: dict) -> str:
+    return json.dumps({"type": "STATE", "value": value}) + "\n"
+
+
+def record_message(value: dict) -> str:
+    return json.dumps({"type": "RECORD", "stream": "users", "record": value}) + "\n"
+
+
+class LineWriter:
+    def __init__(self) -> None:
+        self.lines: list[dict] = []
+
+    def writeline(self, line: str) -> None:
+        self.lines.append(json.loads(line))
+
+
+class TestStateAcknowledgements:
+    @pytest.fixture
+    def bookmark_writer(self) -> LineWriter:
+        return LineWriter()
+
+    @pytest.fixture
+    def acknowledgements(self, bookmark_writer) -> StateAcknowledgements:
+        acknowledgements = StateAcknowledgements(bookmark_writer, consumers=2)
+        acknowledgements.writeline(record_message({"id": 1}))
+        acknowledgements.writeline(state_message({"bookmark": 1}))
+        acknowledgements.writeline(record_message({"id": 2}))
+        acknowledgements.writeline(state_message({"bookmark": 2}))
+        acknowledgements.writeline(state_message({"bookmark": 3}))
+        return acknowledgements
+
+    def test_commit_once_all_acknowledged(
+        self,
+        acknowledgements: StateAcknowledgements,
+        bookmark_writer: LineWriter,
+    ) -> None:
+        first = acknowledgements.consumer(0)
+        second = acknowledgements.consumer(1)
+
+        first.writeline(json.dumps({"bookmark": 1}))
+        first.writeline(json.dumps({"bookmark": 2}))
+        assert bookmark_writer.lines == []
+
+        second.writeline(json.dumps({"bookmark": 1}))
+        assert bookmark_writer.lines == [{"bookmark": 1}]
+
+        second.writeline(json.dumps({"bookmark": 3}))
+        assert bookmark_writer.lines == [{"bookmark": 1}, {"bookmark": 2}]
+
+        first.writeline(json.dumps({"bookmark": 3}))
+        assert bookmark_writer.lines == [
+            {"bookmark": 1},
+            {"bookmark": 2},
+            {"bookmark": 3},
+        ]
+
+    def test_skipped_state_is_acknowledged(
+        self,
+        acknowledgements: StateAcknowledgements,
+        bookmark_writer: LineWriter,
+    ) -> None:
+        acknowledgements.consumer(0).writeline(json.dumps({"bookmark": 3}))
+        acknowledgements.consumer(1).writeline(json.dumps({"bookmark": 2}))
+        assert bookmark_writer.lines == [{"bookmark": 2}]
+
+    def test_unknown_state_is_ignored(
+        self,
+        acknowledgements: StateAcknowledgements,
+        bookmark_writer: LineWriter,
+    ) -> None:
+        for index in range(2):
+            consumer = acknowledgements.consumer(index)
+            consumer.writeline(json.dumps({"bookmark": 42}))
+            consumer.writeline("not json")
+        assert bookmark_writer.lines == []
+
+    def test_repeated_state(self, bookmark_writer: LineWriter) -> None:
+        acknowledgements = StateAcknowledgements(bookmark_writer, consumers=2)
+        for _ in range(2):
+            acknowledgements.writeline(state_message({"bookmark": 1}))
+
+        for index in range(2):
+            acknowledgements.consumer(index).writeline(json.dumps({"bookmark": 1}))
+        assert bookmark_writer.lines == [{"bookmark": 1}]
+
+        # The second identical state is acknowledged separately
+        for index in range(2):
+            acknowledgements.consumer(index).writeline(json.dumps({"bookmark": 1}))
+        assert bookmark_writer.lines == [{"bookmark": 1}, {"bookmark": 1}]
+
+
+class TestTeeBlock:
+    @staticmethod
+    def consumer_block(string_id: str, exit_code: asyncio.Future) -> mock.Mock:
+        block = mock.Mock()
+        block.string_id = string_id
+        block.process_future = exit_code
+        block.stop = mock.AsyncMock()
+        return block
+
+    def test_string_id(self) -> None:
+        tee = TeeBlock(
+            [mock.Mock(string_id="target-a"), mock.Mock(string_id="target-b")],
+            buffer_size=1024,
+        )
+        assert tee.string_id == "target-a,target-b"
+        assert tee.consumer
+        assert not tee.producer
+
+    @pytest.mark.asyncio
+    async def test_process_future_success(self) -> None:
+        loop = asyncio.get_running_loop()
+        exit_codes = [loop.create_future() for _ in range(2)]
+        blocks = [
+            self.consumer_block(f"target-{idx}", exit_code)
+            for idx, exit_code in enumerate(exit_codes)
+        ]
+        tee = TeeBlock(blocks, buffer_size=1024)
+
+        for exit_code in exit_codes:
+            exit_code.set_result(0)
+
+        assert await tee.process_future == 0
+        for block in blocks:
+            block.stop.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_future_failure(self) -> None:
+        loop = asyncio.get_running_loop()
+        exit_codes = [loop.create_future() for _ in range(2)]
+        blocks = [
+            self.consumer_block(f"target-{idx}", exit_code)
+            for idx, exit_code in enumerate(exit_codes)
+        ]
+        tee = TeeBlock(blocks, buffer_size=1024)
+
+        exit_codes[1].set_result(1)
+
+        assert await tee.process_future == 1
+        blocks[0].stop.assert_awaited_once()
+        blocks[1].stop.assert_not_called()
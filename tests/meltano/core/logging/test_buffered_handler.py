@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+import threading
+import typing as t
+from unittest import mock
+
+import pytest
+
+from meltano.core.logging.buffered_handler import BufferedFileHandler, OverflowPolicy
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+class TestBufferedFileHandler:
+    @pytest.fixture
+    def log_path(self, tmp_path: Path) -> Path:
+        return tmp_path / "job.log"
+
+    def test_close_writes_queued_lines(self, log_path: Path) -> None:
+        handler = BufferedFileHandler(log_path, queue_size=10, flush_interval=60)
+        for idx in range(100):
+            handler.emit(make_record(f"line {idx}"))
+        handler.close()
+
+        assert log_path.read_text().splitlines() == [
+            f"line {idx}" for idx in range(100)
+        ]
+
+    def test_flush(self, log_path: Path) -> None:
+        handler = BufferedFileHandler(log_path, queue_size=10, flush_interval=60)
+        try:
+            handler.emit(make_record("first"))
+            handler.flush()
+            assert log_path.read_text() == "first\n"
+        finally:
+            handler.close()
+
+    def test_no_file_without_records(self, log_path: Path) -> None:
+        handler = BufferedFileHandler(log_path, queue_size=10, flush_interval=60)
+        handler.close()
+        assert not log_path.exists()
+
+    def test_drop_overflow(self, log_path: Path) -> None:
+        handler = BufferedFileHandler(
+            log_path,
+            queue_size=1,
+            flush_interval=60,
+            overflow=OverflowPolicy.drop,
+        )
+        writing = threading.Event()
+        resume = threading.Event()
+        write_line = handler._write_line
+
+        def slow_write_line(file, line) -> None:
+            writing.set()
+            resume.wait()
+            write_line(file, line)
+
+        with mock.patch.object(handler, "_write_line", side_effect=slow_write_line):
+            handler.emit(make_record("written"))
+            # The writer is stuck on the first line, so the queue fills up
+            writing.wait()
+            handler.emit(make_record("queued"))
+            handler.emit(make_record("dropped"))
+            handler.emit(make_record("dropped"))
+            assert handler.dropped == 2
+
+            resume.set()
+            handler.close()
+
+        assert log_path.read_text().splitlines() == [
+            "written",
+            "queued",
+            (
+                "2 log lines were dropped because they were emitted faster than "
+                "they could be written"
+            ),
+        ]
+
+    def test_unwritable_file(self, tmp_path: Path) -> None:
+        handler = BufferedFileHandler(
+            tmp_path / "missing" / "job.log",
+            queue_size=1,
+            flush_interval=60,
+        )
+        # Lines are still consumed, so emitting doesn't hang once the queue is full
+        for idx in range(10):
+            handler.emit(make_record(f"line {idx}"))
+        handler.close()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import os
 import typing as t
 import zoneinfo
 
@@ -13,6 +14,7 @@ from meltano.core.logging.utils import (
     LEVELS,
     LogFormat,
     capture_subprocess_output,
+    capture_subprocess_output_chunked,
     default_config,
     parse_log_level,
     setup_logging,
@@ -48,6 +50,114 @@ async def test_capture_subprocess_output() -> None:
     assert output_lines == ["LINE\n", "LINE 2\n", "�\n"]
 
 
+def _chunked_reader(*chunks: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
+@pytest.mark.asyncio
+async def test_capture_subprocess_output_chunked() -> None:
+    output_lines = []
+
+    class LineWriter:
+        def writeline(self, line: str) -> None:
+            output_lines.append(line)
+
+    reader = _chunked_reader(b"LINE\nLINE ", b"2\n\xed\n", b"LAST")
+
+    await capture_subprocess_output_chunked(reader, LineWriter(), read_size=4)
+    assert output_lines == ["LINE\n", "LINE 2\n", "�\n", "LAST"]
+
+
+@pytest.mark.asyncio
+async def test_capture_subprocess_output_chunked_stream_writer() -> None:
+    loop = asyncio.get_running_loop()
+    read_fd, write_fd = os.pipe()
+    with open(read_fd, "rb") as read_file, open(write_fd, "wb") as write_file:  # noqa: ASYNC230, PTH123
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader()),
+            write_file,
+        )
+        writer = asyncio.StreamWriter(transport, protocol, None, loop)
+        reader = _chunked_reader(*(b'{"type": "RECORD"}\n' for _ in range(100)))
+
+        await capture_subprocess_output_chunked(reader, writer, high_water=64)
+        writer.close()
+        await writer.wait_closed()
+
+        assert read_file.read() == b'{"type": "RECORD"}\n' * 100
+
+
+@pytest.mark.asyncio
+async def test_capture_subprocess_output_chunked_line_length_limit() -> None:
+    reader = _chunked_reader(b"x" * 10, b"x" * 10, b"\n")
+
+    with pytest.raises(ValueError, match="Separator is not found") as exc_info:
+        await capture_subprocess_output_chunked(
+            reader,
+            read_size=8,
+            line_length_limit=12,
+        )
+
+    assert isinstance(exc_info.value.__context__, asyncio.LimitOverrunError)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("data", "read_size"),
+    (
+        pytest.param(b"OK\n" + b"x" * 20 + b"\nOK\n", 64, id="single-chunk"),
+        pytest.param(b"x" * 15 + b"\nOK\n", 10, id="pending"),
+    ),
+)
+async def test_capture_subprocess_output_chunked_line_length_limit_complete_line(
+    data: bytes,
+    read_size: int,
+) -> None:
+    reader = _chunked_reader(data)
+
+    with pytest.raises(ValueError, match="Separator is found") as exc_info:
+        await capture_subprocess_output_chunked(
+            reader,
+            read_size=read_size,
+            line_length_limit=12,
+        )
+
+    assert isinstance(exc_info.value.__context__, asyncio.LimitOverrunError)
+
+
+@pytest.mark.asyncio
+async def test_capture_subprocess_output_chunked_line_length_limit_fast_path(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    output_lines = []
+
+    class LineWriter:
+        def writeline(self, line: str) -> None:
+            output_lines.append(line)
+
+    checked = []
+    monkeypatch.setattr(
+        "meltano.core.logging.utils._check_line_lengths",
+        lambda *args: checked.append(args),
+    )
+    reader = _chunked_reader(b"OK\nOK\n", b"x" * 12 + b"\n")
+
+    await capture_subprocess_output_chunked(
+        reader,
+        LineWriter(),
+        read_size=6,
+        line_length_limit=12,
+    )
+
+    # Lines are only measured one by one once a chunk could hold a long line
+    assert output_lines == ["OK\n", "OK\n", "x" * 12 + "\n"]
+    assert len(checked) == 1
+
+
 @pytest.mark.parametrize(
     ("log_format", "expected"),
     (
@@ -13,6 +13,7 @@ import pytest
 import structlog
 from structlog.testing import LogCapture
 
+from meltano.core.logging.buffered_handler import BufferedFileHandler
 from meltano.core.logging.models import ParsedLogRecord
 from meltano.core.logging.output_logger import Out, OutputLogger
 
@@ -263,6 +264,23 @@ class TestOutputLogger:
             {"event": "error"},
         )
 
+    @pytest.mark.usefixtures("log_output")
+    def test_logging_redirect_buffered(self, log: t.IO[str]) -> None:
+        subject = OutputLogger(log.name, queue_size=10, flush_interval=60)
+        logging_out = subject.out("logging")
+
+        with logging_out.redirect_logging():
+            handler = logging.getLogger().handlers[-1]  # noqa: TID251
+            assert isinstance(handler, BufferedFileHandler)
+            for idx in range(50):
+                logging.warning("warning %d", idx)
+
+        # Queued lines are written once logging is no longer redirected
+        assert handler not in logging.getLogger().handlers  # noqa: TID251
+        lines = log.read().splitlines()
+        assert len(lines) == 50
+        assert "warning 49" in lines[-1]
+
     @pytest.mark.skipif(
         platform.system() == "Windows",
         reason="Test fails if even attempted to be run, xfail can't save us here.",
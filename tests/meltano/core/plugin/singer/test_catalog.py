@@ -13,11 +13,13 @@ from meltano.core.plugin.singer.catalog import (
     ListSelectedExecutor,
     MetadataExecutor,
     MetadataRule,
+    RuleIndex,
     SchemaExecutor,
     SchemaRule,
     SelectExecutor,
     SelectionType,
     SelectPattern,
+    StreamPartition,
     path_property,
     select_filter_metadata_rules,
     select_metadata_rules,
@@ -1772,6 +1774,54 @@ class TestMetadataExecutor:
             hash_property_metadata_node["metadata"]["custom-metadata"] == "custom-value"
         )
 
+    def test_visit_missing_metadata(self) -> None:
+        catalog = {
+            "streams": [
+                {
+                    "tap_stream_id": "users",
+                    "schema": {
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "name": {"type": "string"},
+                            "address": {
+                                "type": "object",
+                                "properties": {"city": {"type": "string"}},
+                            },
+                        },
+                    },
+                    "metadata": [
+                        {
+                            "breadcrumb": ["properties", "id"],
+                            "metadata": {"inclusion": "automatic"},
+                        },
+                        {
+                            "breadcrumb": ["properties", "id"],
+                            "metadata": {"inclusion": "available"},
+                        },
+                    ],
+                },
+            ],
+        }
+        executor = MetadataExecutor(
+            [MetadataRule("users", ["*"], "selected", value=True)]
+        )
+        visit(catalog, executor)
+
+        metadata = catalog["streams"][0]["metadata"]
+        assert [entry["breadcrumb"] for entry in metadata] == [
+            ["properties", "id"],
+            ["properties", "id"],
+            [],
+            ["properties", "name"],
+            ["properties", "address"],
+            ["properties", "address", "properties", "city"],
+        ]
+        assert metadata[-1]["metadata"]["inclusion"] == "available"
+
+        # Entries added by an earlier visit are found again
+        visit(catalog, executor)
+        assert len(catalog["streams"][0]["metadata"]) == len(metadata)
+
 
 class TestSchemaExecutor:
     @pytest.fixture
@@ -1869,6 +1919,116 @@ class TestListExecutor:
             },
         }
 
+    def test_visit_schema_structure(self) -> None:
+        catalog = {
+            "streams": [
+                {
+                    "tap_stream_id": "events",
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "user-id": {"type": "string"},
+                            "@timestamp": {"type": "string"},
+                            "properties": {
+                                "type": "object",
+                                "properties": {"first name": {"type": "string"}},
+                            },
+                            "tags": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {"label": {"type": "string"}},
+                                },
+                            },
+                        },
+                    },
+                },
+            ],
+        }
+        executor = ListExecutor()
+        visit(catalog, executor)
+
+        # Properties of array items are not visited
+        assert executor.properties == {
+            "events": {
+                "user-id",
+                "@timestamp",
+                "properties",
+                "properties.first name",
+                "tags",
+            },
+        }
+
+
+class TestRuleIndex:
+    @pytest.fixture
+    def rules(self) -> list[MetadataRule]:
+        return [
+            *select_metadata_rules(["!*.*"]),
+            *select_metadata_rules(
+                [
+                    "users.*",
+                    "orders.id",
+                    "orders.payload.*",
+                    "!orders.secret",
+                    "audit_[0-9]*.created_?t",
+                    "!*.password",
+                ],
+            ),
+            *select_filter_metadata_rules(["users", "orders", "!audit_2"]),
+            MetadataRule(
+                tap_stream_id=["orders", "users"],
+                breadcrumb=bc(["id"]),
+                key="is-replication-key",
+                value=True,
+            ),
+        ]
+
+    @pytest.mark.parametrize(
+        "tap_stream_id",
+        ("users", "orders", "audit_1", "audit_2", "audit_x", "other"),
+    )
+    @pytest.mark.parametrize(
+        "breadcrumb",
+        (
+            None,
+            [],
+            bc(["id"]),
+            bc(["password"]),
+            bc(["secret"]),
+            bc(["payload"]),
+            bc(["payload", "content"]),
+            bc(["created_at"]),
+            bc(["created_xt", "nested"]),
+        ),
+    )
+    def test_matching(self, rules, tap_stream_id, breadcrumb) -> None:
+        index = RuleIndex(rules)
+        expected = MetadataRule.matching(rules, tap_stream_id, breadcrumb)
+        assert index.matching(tap_stream_id, breadcrumb) == expected
+        # Results are the same once the stream rules are cached
+        assert index.matching(tap_stream_id, breadcrumb) == expected
+
+    def test_no_stream_patterns(self) -> None:
+        index = RuleIndex(
+            [
+                MetadataRule.select(value=False),
+                MetadataRule.select(value=False, negated=True),
+            ],
+        )
+        assert index.matching("users") == [index.rules[1]]
+
+
+class TestStreamPartition:
+    def test_streams(self) -> None:
+        stream_ids = ["d", "b", "e", "a", "c"]
+        partitions = [StreamPartition(index, 2).streams(stream_ids) for index in (0, 1)]
+
+        assert partitions == [{"a", "c", "e"}, {"b", "d"}]
+
+    def test_streams_more_partitions_than_streams(self) -> None:
+        assert StreamPartition(2, 4).streams(["a", "b"]) == set()
+
 
 class TestSelectPattern:
     def test_parse(self) -> None:
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import typing as t
+
+import pytest
+
+from meltano.core.plugin.singer.catalog_cache import SharedCatalogCache
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from meltano.core.project import Project
+
+
+class TestSharedCatalogCache:
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> SharedCatalogCache:
+        return SharedCatalogCache(tmp_path / "cache", max_size=0)
+
+    def test_get_put(self, cache: SharedCatalogCache, tmp_path: Path) -> None:
+        catalog_path = tmp_path / "tap.properties.json"
+        assert cache.get("key", catalog_path) is None
+        assert not catalog_path.exists()
+
+        catalog_path.write_text('{"streams": []}')
+        cache.put("key", catalog_path, discovered_at=1000.5)
+        catalog_path.unlink()
+
+        assert cache.get("key", catalog_path) == 1000.5
+        assert catalog_path.read_text() == '{"streams": []}'
+        assert cache.get("other-key", catalog_path) is None
+
+        # Only complete catalogs are left in the cache directory
+        assert sorted(path.name for path in cache.directory.iterdir()) == [
+            "key.catalog.json",
+            "key.discovered",
+        ]
+
+    def test_get_discovered_at(
+        self,
+        cache: SharedCatalogCache,
+        tmp_path: Path,
+    ) -> None:
+        catalog_path = tmp_path / "tap.properties.json"
+        catalog_path.write_text('{"streams": []}')
+        cache.put("key", catalog_path, discovered_at=1000)
+
+        # Reading the catalog doesn't make it any younger
+        assert cache.get("key", tmp_path / "a.json") == 1000
+        assert cache.get("key", tmp_path / "b.json") == 1000
+
+        # Catalogs without a discovery time are not used
+        (cache.directory / "key.discovered").unlink()
+        assert cache.get("key", tmp_path / "c.json") is None
+
+    def test_evict(self, cache: SharedCatalogCache, tmp_path: Path) -> None:
+        catalog_path = tmp_path / "tap.properties.json"
+        catalog_path.write_text("x" * 10)
+
+        for mtime, key in enumerate(("a", "b", "c")):
+            cache.put(key, catalog_path)
+            os.utime(cache.directory / f"{key}.catalog.json", (mtime, mtime))
+
+        # Reading a catalog marks it as recently used
+        assert cache.get("a", tmp_path / "a.json")
+
+        cache.max_size = 20
+        cache.evict()
+        assert sorted(path.name for path in cache.directory.iterdir()) == [
+            "a.catalog.json",
+            "a.discovered",
+            "c.catalog.json",
+            "c.discovered",
+        ]
+
+        # The new catalog is kept, the least recently used one evicted
+        cache.put("d", catalog_path)
+        assert sorted(path.name for path in cache.directory.iterdir()) == [
+            "a.catalog.json",
+            "a.discovered",
+            "d.catalog.json",
+            "d.discovered",
+        ]
+
+    def test_from_project(self, project: Project, monkeypatch) -> None:
+        assert SharedCatalogCache.from_project(project) is None
+
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_DIR", "catalogs")
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_MAX_SIZE", "1024")
+        cache = SharedCatalogCache.from_project(project)
+        assert cache is not None
+        assert cache.directory == project.root / "catalogs"
+        assert cache.max_size == 1024
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import copy
+import io
+import json
+import typing as t
+
+import pytest
+
+from meltano.core.plugin.singer.catalog_fingerprint import (
+    FINGERPRINT_VERSION,
+    CatalogChanges,
+    StreamChanges,
+    diff_fingerprints,
+    fingerprint_catalog,
+    read_fingerprints,
+    write_fingerprints,
+)
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+CATALOG = {
+    "streams": [
+        {
+            "tap_stream_id": "users",
+            "key_properties": ["id"],
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": ["string", "null"]},
+                    "email": {"type": ["string", "null"]},
+                },
+            },
+            "metadata": [
+                {"breadcrumb": [], "metadata": {"table-key-properties": ["id"]}},
+                {
+                    "breadcrumb": ["properties", "id"],
+                    "metadata": {"inclusion": "automatic"},
+                },
+            ],
+        },
+        {
+            "tap_stream_id": "orders",
+            "schema": {"type": "object", "properties": {"id": {"type": "integer"}}},
+            "metadata": [],
+        },
+        {"tap_stream_id": "items", "schema": {}, "metadata": []},
+    ],
+}
+
+
+def fingerprint(catalog: dict) -> dict:
+    return fingerprint_catalog(io.StringIO(json.dumps(catalog)))
+
+
+def test_fingerprint_catalog() -> None:
+    fingerprints = fingerprint(CATALOG)
+    assert fingerprints.keys() == {"users", "orders", "items"}
+    assert fingerprints["users"]["properties"].keys() == {"id", "name", "email"}
+    assert fingerprints["items"]["properties"] == {}
+
+    # Formatting, key order and selection don't change fingerprints
+    catalog = copy.deepcopy(CATALOG)
+    users = catalog["streams"][0]
+    users["schema"]["properties"] = dict(
+        reversed(users["schema"]["properties"].items()),
+    )
+    users["metadata"][0]["metadata"]["selected"] = True
+    catalog["streams"].reverse()
+    assert fingerprint_catalog(io.StringIO(json.dumps(catalog, indent=4))) == (
+        fingerprints
+    )
+
+
+def test_diff_fingerprints() -> None:
+    catalog = copy.deepcopy(CATALOG)
+    users, orders, _ = catalog["streams"]
+    users["schema"]["properties"]["name"]["type"] = "string"
+    users["schema"]["properties"]["created_at"] = {"type": "string"}
+    del users["schema"]["properties"]["email"]
+    users["metadata"][1]["metadata"]["inclusion"] = "available"
+    orders["key_properties"] = ["id"]
+    catalog["streams"][2] = {"tap_stream_id": "refunds", "schema": {}}
+
+    assert diff_fingerprints(fingerprint(CATALOG), fingerprint(catalog)) == (
+        CatalogChanges(
+            added_streams=["refunds"],
+            removed_streams=["items"],
+            changed_streams={
+                "users": StreamChanges(
+                    added_properties=["created_at"],
+                    removed_properties=["email"],
+                    changed_properties=["id", "name"],
+                ),
+                "orders": StreamChanges(),
+            },
+        )
+    )
+    assert not diff_fingerprints(fingerprint(CATALOG), fingerprint(CATALOG))
+
+
+@pytest.mark.parametrize(
+    ("index", "expected"),
+    (
+        pytest.param(None, None, id="missing"),
+        pytest.param("Not JSON", None, id="invalid"),
+        pytest.param(
+            json.dumps({"version": FINGERPRINT_VERSION + 1, "streams": {}}),
+            None,
+            id="other-version",
+        ),
+        pytest.param(
+            json.dumps({"version": FINGERPRINT_VERSION, "streams": {}}),
+            {},
+            id="valid",
+        ),
+    ),
+)
+def test_read_fingerprints(
+    tmp_path: Path,
+    index: str | None,
+    expected: dict | None,
+) -> None:
+    path = tmp_path / "fingerprints.json"
+    if index is not None:
+        path.write_text(index)
+    assert read_fingerprints(path) == expected
+
+
+def test_write_fingerprints(tmp_path: Path) -> None:
+    path = tmp_path / "fingerprints.json"
+    fingerprints = fingerprint(CATALOG)
+    write_fingerprints(path, fingerprints)
+    assert read_fingerprints(path) == fingerprints
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from meltano.core.plugin.singer.catalog import MetadataExecutor, MetadataRule
+from meltano.core.plugin.singer.catalog_streaming import (
+    format_catalog,
+    process_catalog,
+)
+from meltano.core.setting_definition import json_dumps
+
+CATALOG = {
+    "version": 1,
+    "streams": [
+        {
+            "tap_stream_id": "users",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer", "maximum": 12345678901234567890},
+                    "name": {"type": ["string", "null"], "default": "multi\nline"},
+                },
+            },
+            "metadata": [{"breadcrumb": [], "metadata": {"selected": True}}],
+        },
+        {"tap_stream_id": "orders", "schema": {}, "metadata": []},
+        "not a stream",
+    ],
+    "extra": {"nested": [1.5, None, False, {}]},
+}
+
+
+def process(document: str, *, read_size: int, **kwargs) -> str:
+    output = io.StringIO()
+    process_catalog(io.StringIO(document), output, read_size=read_size, **kwargs)
+    return output.getvalue()
+
+
+class TestProcessCatalog:
+    @pytest.mark.parametrize("read_size", (1, 7, 1024 * 1024))
+    @pytest.mark.parametrize(
+        "catalog",
+        (
+            CATALOG,
+            {},
+            {"streams": []},
+            {"streams": {"users": {}}},
+            {"version": 12345678901234567890},
+        ),
+        ids=("catalog", "empty", "no-streams", "streams-object", "number"),
+    )
+    @pytest.mark.parametrize("indent", (None, 0, 2))
+    def test_format(self, catalog: dict, read_size: int, indent: int | None) -> None:
+        # Output is identical to dumping the whole catalog at once
+        if indent is None:
+            expected = json_dumps(catalog, separators=(",", ":"))
+        else:
+            expected = json_dumps(catalog, indent=indent)
+        for document in (json.dumps(catalog), json.dumps(catalog, indent=4)):
+            assert process(document, read_size=read_size, indent=indent) == expected
+
+    @pytest.mark.parametrize("read_size", (1, 1024 * 1024))
+    def test_visit_stream(self, read_size: int) -> None:
+        visited = []
+        executor = MetadataExecutor(
+            [MetadataRule("orders", [], "selected", value=True)],
+        )
+
+        def visit_stream(stream: dict) -> None:
+            visited.append(stream["tap_stream_id"])
+            executor.visit({"streams": [stream]})
+
+        output = process(
+            json.dumps(CATALOG),
+            read_size=read_size,
+            visit_stream=visit_stream,
+        )
+
+        expected = json.loads(json.dumps(CATALOG))
+        executor.visit(expected)
+        assert visited == ["users", "orders"]
+        assert output == json_dumps(expected, separators=(",", ":"))
+
+    @pytest.mark.parametrize("read_size", (1, 3, 1024 * 1024))
+    @pytest.mark.parametrize(
+        "document",
+        (
+            "",
+            "[]",
+            '{"streams": [{}, ]}',
+            '{"streams": [{"a": }]}',
+            '{"a" 1}',
+            '{"a": 1',
+            '{"a": tru}',
+            '{"a": 1} {}',
+        ),
+    )
+    def test_invalid(self, document: str, read_size: int) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            process_catalog(io.StringIO(document), read_size=read_size)
+
+
+def test_format_catalog() -> None:
+    assert format_catalog(json.dumps(CATALOG)) == json_dumps(CATALOG, indent=2)
+    assert format_catalog("Not JSON") == "Not JSON"
@@ -3,8 +3,11 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+import shutil
 import subprocess
 import sys
+import time
 import typing as t
 from contextlib import contextmanager, suppress
 from datetime import date, datetime, timezone
@@ -14,6 +17,7 @@ from unittest.mock import AsyncMock
 import anyio
 import pytest
 import structlog
+from structlog.testing import capture_logs
 
 from meltano.core.job import Job, Payload
 from meltano.core.plugin import PluginType
@@ -21,9 +25,12 @@ from meltano.core.plugin.error import PluginExecutionError
 from meltano.core.plugin.singer import SingerTap
 from meltano.core.plugin.singer.catalog import (
     ListSelectedExecutor,
+    MetadataExecutor,
+    StreamPartition,
     property_breadcrumb,
     select_metadata_rules,
 )
+from meltano.core.plugin.singer.catalog_cache import SharedCatalogCache
 from meltano.core.state_service import InvalidJobStateError, StateService
 
 if t.TYPE_CHECKING:
@@ -70,6 +77,13 @@ class TestSingerTap:
     def fixture_configure_structlog(self) -> None:
         structlog.stdlib.recreate_defaults(log_level=logging.INFO)
 
+    @pytest.fixture(autouse=True)
+    def clean_run_dir(self, subject: SingerTap, project: Project) -> None:
+        # Don't let catalogs cached by other tests, in any order, be used
+        shutil.rmtree(
+            project.dirs.run(subject.name, make_dirs=False), ignore_errors=True
+        )
+
     @pytest.mark.order(0)
     @pytest.mark.asyncio
     async def test_exec_args(
@@ -347,6 +361,311 @@ class TestSingerTap:
                 assert cause.doc == 'Not JSON {"discovered": true}'
                 assert cause.pos == 0
 
+    @pytest.mark.asyncio
+    async def test_discover_catalog_shared_cache(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+        monkeypatch,
+        tmp_path,
+    ) -> None:
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_DIR", str(tmp_path))
+        invoker = plugin_invoker_factory(subject)
+        catalog_path = invoker.files["catalog"]
+        discovered = '{"discovered": true}'
+
+        def mock_discovery(*args, **kwargs):  # noqa: ARG001
+            future = asyncio.Future()
+            future.set_result(catalog_path.write_text(discovered))
+            return future
+
+        async with invoker.prepared(session):
+            with mock.patch.object(
+                SingerTap,
+                "run_discovery",
+                side_effect=mock_discovery,
+            ) as mocked_run_discovery:
+                # The discovered catalog is stored in the shared cache
+                await subject.discover_catalog(invoker)
+                mocked_run_discovery.assert_called_once()
+                assert [
+                    path.read_text() for path in tmp_path.glob("*.catalog.json")
+                ] == [discovered]
+
+                # Without a catalog of its own, e.g. in another project, the
+                # catalog is read from the shared cache instead of discovered
+                catalog_path.unlink()
+                invoker.files["catalog_cache_key"].unlink(missing_ok=True)
+                mocked_run_discovery.reset_mock()
+                await subject.discover_catalog(invoker)
+                mocked_run_discovery.assert_not_called()
+                assert catalog_path.read_text() == discovered
+
+        # Catalogs discovered with another configuration are stored apart
+        monkeypatch.setitem(
+            invoker.settings_service.config_override,
+            "_metadata",
+            {"*": {"replication-method": "FULL_TABLE"}},
+        )
+        async with invoker.prepared(session):
+            with mock.patch.object(
+                SingerTap,
+                "run_discovery",
+                side_effect=mock_discovery,
+            ) as mocked_run_discovery:
+                await subject.discover_catalog(invoker)
+                mocked_run_discovery.assert_called_once()
+                assert len(list(tmp_path.glob("*.catalog.json"))) == 2
+
+        # Invalid catalogs are not stored
+        discovered = "Not JSON"
+        for path in tmp_path.iterdir():
+            path.unlink()
+        async with invoker.prepared(session):
+            with (
+                mock.patch.object(
+                    SingerTap,
+                    "run_discovery",
+                    side_effect=mock_discovery,
+                ),
+                pytest.raises(PluginExecutionError, match="Invalid catalog"),
+            ):
+                await subject.discover_catalog(invoker)
+            assert not list(tmp_path.iterdir())
+
+    @pytest.mark.asyncio
+    async def test_discover_catalog_shared_cache_max_age(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+        monkeypatch,
+        tmp_path,
+    ) -> None:
+        monkeypatch.setenv("MELTANO_CATALOG_CACHE_DIR", str(tmp_path))
+        invoker = plugin_invoker_factory(subject)
+        monkeypatch.setitem(
+            invoker.settings_service.config_override, "_catalog_max_age", 3600
+        )
+        monkeypatch.setitem(
+            invoker.settings_service.config_override,
+            "_catalog_refresh_age",
+            60,
+        )
+        catalog_path = invoker.files["catalog"]
+        discovered_path = invoker.files["catalog_discovered"]
+        discovered = '{"discovered": 1}'
+
+        def mock_discovery(plugin_invoker, path):  # noqa: ARG001
+            future = asyncio.Future()
+            future.set_result(path.write_text(discovered))
+            return future
+
+        def share_catalog(seconds: int) -> None:
+            # As discovered long ago by another project
+            shared_cache = SharedCatalogCache.from_project(invoker.project)
+            key = shared_cache.key(subject, subject.catalog_cache_key(invoker))
+            catalog_path.write_text(discovered)
+            shared_cache.put(key, catalog_path, discovered_at=time.time() - seconds)
+            catalog_path.unlink()
+            invoker.files["catalog_cache_key"].unlink(missing_ok=True)
+
+        with mock.patch.object(
+            SingerTap,
+            "run_discovery",
+            side_effect=mock_discovery,
+        ) as mocked_run_discovery:
+            async with invoker.prepared(session):
+                # A stale shared catalog is used, and keeps its age, while it is
+                # rediscovered in the background
+                share_catalog(120)
+                await subject.discover_catalog(invoker)
+                assert json.loads(catalog_path.read_text()) == {"discovered": 1}
+                assert time.time() - discovered_path.stat().st_mtime >= 120
+            mocked_run_discovery.assert_called_once_with(
+                invoker,
+                invoker.files["catalog_refresh"],
+            )
+
+            # An expired shared catalog is rediscovered before the run
+            async with invoker.prepared(session):
+                share_catalog(7200)
+                discovered = '{"discovered": 2}'
+                mocked_run_discovery.reset_mock()
+                await subject.discover_catalog(invoker)
+                mocked_run_discovery.assert_called_once_with(invoker, catalog_path)
+                assert json.loads(catalog_path.read_text()) == {"discovered": 2}
+                assert time.time() - discovered_path.stat().st_mtime < 60
+
+    @pytest.mark.asyncio
+    async def test_discover_catalog_max_age(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+        monkeypatch,
+    ) -> None:
+        invoker = plugin_invoker_factory(subject)
+        monkeypatch.setitem(
+            invoker.settings_service.config_override, "_catalog_max_age", 3600
+        )
+        monkeypatch.setitem(
+            invoker.settings_service.config_override,
+            "_catalog_refresh_age",
+            60,
+        )
+        catalog_path = invoker.files["catalog"]
+        refresh_path = invoker.files["catalog_refresh"]
+        discovered_path = invoker.files["catalog_discovered"]
+        discovered = '{"discovered": 1}'
+
+        def mock_discovery(plugin_invoker, path):  # noqa: ARG001
+            future = asyncio.Future()
+            future.set_result(path.write_text(discovered))
+            return future
+
+        def age_catalog(seconds: int) -> None:
+            discovered_at = time.time() - seconds
+            os.utime(discovered_path, (discovered_at, discovered_at))
+
+        with mock.patch.object(
+            SingerTap,
+            "run_discovery",
+            side_effect=mock_discovery,
+        ) as mocked_run_discovery:
+            async with invoker.prepared(session):
+                await subject.discover_catalog(invoker)
+                mocked_run_discovery.assert_called_once_with(invoker, catalog_path)
+                invoker.files["catalog_cache_key"].write_text(
+                    subject.catalog_cache_key(invoker),
+                )
+
+                # A fresh catalog is used as is
+                mocked_run_discovery.reset_mock()
+                await subject.discover_catalog(invoker)
+                mocked_run_discovery.assert_not_called()
+
+            # A stale catalog is used, while it is rediscovered in the background
+            # and swapped in for the next run if it changed
+            age_catalog(120)
+            discovered = '{"discovered": 2}'
+            async with invoker.prepared(session):
+                await subject.discover_catalog(invoker)
+                assert json.loads(catalog_path.read_text()) == {"discovered": 1}
+            mocked_run_discovery.assert_called_once_with(invoker, refresh_path)
+            assert json.loads(catalog_path.read_text()) == {"discovered": 2}
+            assert not refresh_path.exists()
+            assert time.time() - discovered_path.stat().st_mtime < 60
+
+            # An unchanged catalog is kept, but counts as discovered again
+            age_catalog(120)
+            catalog_mtime = catalog_path.stat().st_mtime_ns
+            mocked_run_discovery.reset_mock()
+            async with invoker.prepared(session):
+                await subject.discover_catalog(invoker)
+            mocked_run_discovery.assert_called_once_with(invoker, refresh_path)
+            assert catalog_path.stat().st_mtime_ns == catalog_mtime
+            assert not refresh_path.exists()
+            assert time.time() - discovered_path.stat().st_mtime < 60
+
+            # Failing background discovery keeps the cached catalog
+            age_catalog(120)
+            discovered = "Not JSON"
+            async with invoker.prepared(session):
+                await subject.discover_catalog(invoker)
+            assert json.loads(catalog_path.read_text()) == {"discovered": 2}
+            assert not refresh_path.exists()
+
+            # An expired catalog is rediscovered before the run
+            age_catalog(7200)
+            discovered = '{"discovered": 3}'
+            mocked_run_discovery.reset_mock()
+            async with invoker.prepared(session):
+                await subject.discover_catalog(invoker)
+                mocked_run_discovery.assert_called_once_with(invoker, catalog_path)
+                assert json.loads(catalog_path.read_text()) == {"discovered": 3}
+
+    @pytest.mark.asyncio
+    async def test_discover_catalog_changes(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+        monkeypatch,
+    ) -> None:
+        invoker = plugin_invoker_factory(subject)
+        monkeypatch.setitem(
+            invoker.settings_service.config_override,
+            "_use_cached_catalog",
+            False,  # noqa: FBT003
+        )
+        fingerprints_path = invoker.files["catalog_fingerprints"]
+        fingerprints_path.unlink(missing_ok=True)
+        users = {
+            "tap_stream_id": "users",
+            "schema": {"properties": {"id": {"type": "integer"}}},
+            "metadata": [],
+        }
+        discovered = json.dumps({"streams": [users]})
+
+        def mock_discovery(plugin_invoker, path):  # noqa: ARG001
+            future = asyncio.Future()
+            future.set_result(path.write_text(discovered))
+            return future
+
+        def changes_logged(logs: list[dict]) -> list[dict]:
+            return [
+                log
+                for log in logs
+                if log["event"] == "Catalog schema changed since the previous discovery"
+            ]
+
+        with mock.patch.object(
+            SingerTap,
+            "run_discovery",
+            side_effect=mock_discovery,
+        ):
+            async with invoker.prepared(session):
+                # There is nothing to compare the first discovery to
+                with capture_logs() as logs:
+                    await subject.discover_catalog(invoker)
+                assert not changes_logged(logs)
+                assert fingerprints_path.exists()
+
+                # An unchanged catalog isn't reported
+                with capture_logs() as logs:
+                    await subject.discover_catalog(invoker)
+                assert not changes_logged(logs)
+
+                # Added, removed and changed streams and properties are reported
+                users["schema"]["properties"]["name"] = {"type": "string"}
+                discovered = json.dumps(
+                    {"streams": [users, {"tap_stream_id": "orders", "schema": {}}]},
+                )
+                with capture_logs() as logs:
+                    await subject.discover_catalog(invoker)
+                (log,) = changes_logged(logs)
+                assert log["added_streams"] == ["orders"]
+                assert log["removed_streams"] == []
+                assert log["changed_streams"] == {
+                    "users": {
+                        "added_properties": ["name"],
+                        "removed_properties": [],
+                        "changed_properties": [],
+                    },
+                }
+
+                # Invalid catalogs are compared to the last valid one
+                discovered = "Not JSON"
+                with pytest.raises(PluginExecutionError):
+                    await subject.discover_catalog(invoker)
+                discovered = json.dumps({"streams": [users]})
+                with capture_logs() as logs:
+                    await subject.discover_catalog(invoker)
+                (log,) = changes_logged(logs)
+                assert log["removed_streams"] == ["orders"]
+
     @pytest.mark.asyncio
     async def test_discover_catalog_custom(
         self,
@@ -872,6 +1191,238 @@ class TestSingerTap:
             with pytest.raises(PluginExecutionError, match=r"invalid"):
                 await subject.apply_catalog_rules(invoker, [])
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", (False, True))
+    async def test_apply_catalog_rules_write(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+        monkeypatch,
+        streaming: bool,  # noqa: FBT001
+    ) -> None:
+        invoker = plugin_invoker_factory(subject)
+        monkeypatch.setitem(
+            invoker.settings_service.config_override,
+            "_catalog_streaming",
+            streaming,
+        )
+        catalog_path = invoker.files["catalog"]
+        catalog = {
+            "streams": [
+                {
+                    "tap_stream_id": "users",
+                    "schema": {"properties": {"id": {"type": "integer"}}},
+                    "metadata": [],
+                },
+            ],
+        }
+
+        async with invoker.prepared(session):
+            # An interrupted write leaves the catalog as it was
+            catalog_path.write_text(json.dumps(catalog, indent=2))
+            with (
+                mock.patch(
+                    "meltano.core.plugin.singer.tap.process_catalog"
+                    if streaming
+                    else "meltano.core.plugin.singer.tap.json_dumps",
+                    side_effect=KeyboardInterrupt,
+                ),
+                pytest.raises(KeyboardInterrupt),
+            ):
+                await subject.apply_catalog_rules(invoker, [])
+            assert json.loads(catalog_path.read_text()) == catalog
+            assert list(catalog_path.parent.glob("*.tmp")) == []
+
+            # The catalog is stored compactly
+            await subject.apply_catalog_rules(invoker, [])
+            stored = catalog_path.read_text()
+            assert stored == json.dumps(json.loads(stored), separators=(",", ":"))
+
+    @pytest.mark.asyncio
+    async def test_apply_catalog_rules_cached(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+        monkeypatch,
+    ) -> None:
+        invoker = plugin_invoker_factory(subject)
+
+        catalog_path = invoker.files["catalog"]
+        catalog_rules_cache_key_path = invoker.files["catalog_rules_cache_key"]
+        catalog = json.dumps(
+            {
+                "streams": [
+                    {
+                        "tap_stream_id": "UniqueEntitiesName",
+                        "schema": {"properties": {"code": {"type": "string"}}},
+                        "metadata": [],
+                    },
+                ],
+            },
+        )
+
+        async def apply_catalog_rules() -> int:
+            with mock.patch(
+                "meltano.core.plugin.singer.tap.MetadataExecutor",
+                wraps=MetadataExecutor,
+            ) as metadata_executor:
+                async with invoker.prepared(session):
+                    await subject.apply_catalog_rules(invoker)
+            return metadata_executor.call_count
+
+        catalog_path.write_text(catalog)
+        assert await apply_catalog_rules() == 1
+        assert catalog_rules_cache_key_path.exists()
+        applied_catalog = catalog_path.read_text()
+
+        # The catalog the rules were applied to is reused as is
+        assert await apply_catalog_rules() == 0
+        assert catalog_path.read_text() == applied_catalog
+
+        # Rules are applied again once selection rules change
+        monkeypatch.setitem(invoker.plugin.extras, "select", ["*.code"])
+        assert await apply_catalog_rules() == 1
+        assert await apply_catalog_rules() == 0
+
+        # Or once the catalog file is replaced, e.g. by discovery
+        catalog_path.write_text(catalog)
+        assert await apply_catalog_rules() == 1
+
+        # Or once a stream partition is extracted from it
+        async with invoker.prepared(session):
+            await subject.apply_stream_partition(invoker, StreamPartition(0, 1))
+        assert not catalog_rules_cache_key_path.exists()
+        assert await apply_catalog_rules() == 1
+
+    @pytest.mark.asyncio
+    async def test_apply_catalog_rules_streaming(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+        monkeypatch,
+    ) -> None:
+        invoker = plugin_invoker_factory(subject)
+        catalog_path = invoker.files["catalog"]
+
+        monkeypatch.setitem(invoker.plugin.extras, "select", ["users.id", "missing.*"])
+        monkeypatch.setitem(
+            invoker.plugin.extras,
+            "schema",
+            {"users": {"created_at": {"type": "string", "format": "date-time"}}},
+        )
+        monkeypatch.setitem(
+            invoker.plugin.extras,
+            "metadata",
+            {"users": {"replication-key": "created_at"}},
+        )
+
+        catalog = json.dumps(
+            {
+                "streams": [
+                    {
+                        "tap_stream_id": stream,
+                        "schema": {"properties": {"id": {"type": "integer"}}},
+                        "metadata": [],
+                    }
+                    for stream in ("users", "orders")
+                ],
+            },
+        )
+
+        async def apply_catalog_rules(*, streaming: bool) -> str:
+            monkeypatch.setitem(
+                invoker.settings_service.config_override,
+                "_catalog_streaming",
+                streaming,
+            )
+            catalog_path.write_text(catalog)
+            async with invoker.prepared(session):
+                await subject.apply_catalog_rules(invoker)
+            return catalog_path.read_text()
+
+        # Processing the catalog one stream at a time writes the same catalog
+        expected = await apply_catalog_rules(streaming=False)
+        assert await apply_catalog_rules(streaming=True) == expected
+        assert not catalog_path.with_suffix(".json.tmp").exists()
+
+        # An invalid catalog is removed
+        catalog = '{"streams": [{"tap_stream_id": "users"}'
+        with pytest.raises(PluginExecutionError, match=r"invalid"):
+            await apply_catalog_rules(streaming=True)
+        assert not catalog_path.exists()
+        assert not catalog_path.with_suffix(".json.tmp").exists()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("streaming", (False, True))
+    async def test_apply_stream_partition(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+        monkeypatch,
+        streaming: bool,  # noqa: FBT001
+    ) -> None:
+        invoker = plugin_invoker_factory(subject)
+        monkeypatch.setitem(
+            invoker.settings_service.config_override,
+            "_catalog_streaming",
+            streaming,
+        )
+        catalog = {
+            "streams": [
+                {
+                    "tap_stream_id": stream,
+                    "schema": {"properties": {}},
+                    "metadata": [
+                        {"breadcrumb": [], "metadata": {"selected": selected}},
+                    ],
+                }
+                for stream, selected in (
+                    ("a", True),
+                    ("b", True),
+                    ("c", True),
+                    ("d", False),
+                )
+            ],
+        }
+        state = {
+            "bookmarks": {stream: {"version": 1} for stream in "abcd"},
+            "currently_syncing": "a",
+        }
+
+        async with invoker.prepared(session):
+            invoker.files["catalog"].write_text(json.dumps(catalog))
+            invoker.files["state"].write_text(json.dumps(state))
+
+            await subject.apply_stream_partition(invoker, StreamPartition(1, 2))
+
+            partitioned_catalog = json.loads(invoker.files["catalog"].read_text())
+            partitioned_state = json.loads(invoker.files["state"].read_text())
+
+        selected = ListSelectedExecutor()
+        selected.visit(partitioned_catalog)
+        assert {stream for stream, selection in selected.streams if selection} == {
+            "b",
+        }
+        assert partitioned_state == {"bookmarks": {"b": {"version": 1}}}
+
+    @pytest.mark.asyncio
+    async def test_apply_stream_partition_invalid(
+        self,
+        session,
+        plugin_invoker_factory: Callable[[ProjectPlugin], PluginInvoker],
+        subject: SingerTap,
+    ) -> None:
+        invoker = plugin_invoker_factory(subject)
+        async with invoker.prepared(session):
+            invoker.files["catalog"].write_text("this is invalid json")
+
+            with pytest.raises(PluginExecutionError, match=r"invalid"):
+                await subject.apply_stream_partition(invoker, StreamPartition(0, 2))
+
     @pytest.mark.asyncio
     async def test_catalog_cache_key(
         self,
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 import typing as t
+from unittest import mock
 
 import pytest
 
 from meltano.core.job import Job, Payload
 from meltano.core.plugin import PluginType
-from meltano.core.plugin.singer.target import BookmarkWriter
+from meltano.core.plugin.singer.target import (
+    BookmarkWriter,
+    CoalescingBookmarkWriter,
+)
 from meltano.core.project_plugins_service import PluginAlreadyAddedException
 from meltano.core.state_service import StateService
 
@@ -69,6 +75,147 @@ class TestBookmarkWriter:
         assert state_service.get_state(job.job_name) == expected_state
 
 
+class TestCoalescingBookmarkWriter:
+    @pytest.mark.asyncio
+    async def test_flush_count(self, session: Session) -> None:
+        state_service = StateService(session=session)
+        job = Job(job_name="pytest_test_runner", payload={})
+        job.save(session)
+
+        writer = CoalescingBookmarkWriter(
+            job,
+            session,
+            state_service=state_service,
+            flush_count=2,
+        )
+        writer.writeline('{"bookmark": 1}')
+        assert state_service.get_state(job.job_name) == {}
+
+        writer.writeline("invalid")
+        writer.writeline('{"bookmark": 2}')
+        assert state_service.get_state(job.job_name) == {
+            "singer_state": {"bookmark": 2},
+        }
+
+        writer.writeline('{"bookmark": 3}')
+        assert writer.states_received == 3
+        assert writer.states_persisted == 1
+
+        await writer.close()
+        assert writer.states_persisted == 2
+        assert state_service.get_state(job.job_name) == {
+            "singer_state": {"bookmark": 3},
+        }
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_off_event_loop(self, session: Session) -> None:
+        persisted = []
+
+        def update_state_store(
+            state_id: str,
+            new_state: dict,
+            payload_flags: Payload,
+        ) -> None:
+            persisted.append((state_id, new_state, payload_flags))
+            assert threading.current_thread() is not threading.main_thread()
+
+        state_service = mock.Mock(spec=StateService)
+        state_service.update_state_store.side_effect = update_state_store
+
+        job = Job(job_name="pytest_test_runner", payload={})
+        job.save(session)
+        writer = CoalescingBookmarkWriter(
+            job,
+            session,
+            state_service=state_service,
+            flush_interval=3600,
+        )
+        for bookmark in range(100):
+            writer.writeline(json.dumps({"bookmark": bookmark}))
+
+        await writer.close()
+        assert writer.states_received == 100
+        assert writer.states_persisted == 1
+        assert persisted == [
+            (
+                "pytest_test_runner",
+                {"singer_state": {"bookmark": 99}},
+                Payload.STATE,
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_without_further_state(
+        self,
+        session: Session,
+    ) -> None:
+        state_service = mock.Mock(spec=StateService)
+        job = Job(job_name="pytest_test_runner", payload={})
+        job.save(session)
+        writer = CoalescingBookmarkWriter(
+            job,
+            session,
+            state_service=state_service,
+            flush_interval=0.05,
+        )
+        writer.writeline('{"bookmark": 1}')
+        assert writer.states_persisted == 0
+
+        # The tap doesn't emit any further state, the timer writes it anyway
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if writer.states_persisted:
+                break
+
+        assert writer.states_persisted == 1
+        state_service.update_state_store.assert_called_once_with(
+            "pytest_test_runner",
+            {"singer_state": {"bookmark": 1}},
+            Payload.STATE,
+        )
+        await writer.close()
+        assert writer.states_persisted == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_after_write_in_progress(self, session: Session) -> None:
+        write_started = threading.Event()
+        release_write = threading.Event()
+
+        def update_state_store(*args: t.Any) -> None:  # noqa: ARG001
+            write_started.set()
+            release_write.wait(timeout=5)
+
+        state_service = mock.Mock(spec=StateService)
+        state_service.update_state_store.side_effect = update_state_store
+
+        job = Job(job_name="pytest_test_runner", payload={})
+        job.save(session)
+        writer = CoalescingBookmarkWriter(
+            job,
+            session,
+            state_service=state_service,
+            flush_count=1,
+        )
+        writer.writeline('{"bookmark": 1}')
+        await asyncio.to_thread(write_started.wait, 5)
+
+        # Due, but the first write is still in progress
+        writer.writeline('{"bookmark": 2}')
+        assert state_service.update_state_store.call_count == 1
+
+        release_write.set()
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if writer.states_persisted == 2:
+                break
+
+        assert writer.states_persisted == 2
+        assert state_service.update_state_store.call_args.args[1] == {
+            "singer_state": {"bookmark": 2},
+        }
+        await writer.close()
+
+
 class TestSingerTarget:
     @pytest.fixture
     def subject(self, project_add_service: ProjectAddService):
@@ -160,3 +307,36 @@ class TestSingerTarget:
                 invoker.output_handlers.get(invoker.StdioSource.STDOUT)[0].payload_flag
                 is Payload.INCOMPLETE_STATE
             )
+
+    @pytest.mark.asyncio
+    async def test_setup_coalescing_bookmark_writer(
+        self,
+        subject: SingerTarget,
+        session,
+        plugin_invoker_factory,
+        elt_context_builder: ELTContextBuilder,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("MELTANO_ELT_STATE_FLUSH_INTERVAL", "30")
+        job = Job(job_name="pytest_test_runner", payload={})
+        job.save(session)
+        elt_context = (
+            elt_context_builder.with_session(session)
+            .with_loader(subject.name)
+            .with_job(job)
+            .context()
+        )
+
+        invoker = plugin_invoker_factory(subject, context=elt_context)
+        async with invoker.prepared(session):
+            subject.setup_bookmark_writer(invoker)
+            (writer,) = invoker.output_handlers.get(invoker.StdioSource.STDOUT)
+            assert isinstance(writer, CoalescingBookmarkWriter)
+            assert writer.flush_interval == 30
+            assert writer.flush_count == 0
+
+            writer.writeline('{"bookmark": 1}')
+            assert writer.states_persisted == 0
+
+        # State held back by the writer is persisted when the invoker is cleaned up
+        assert writer.states_persisted == 1
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+import typing as t
+from unittest.mock import patch
+
+import moto
+import pytest
+
+from meltano.core.state_store.base import MeltanoState
+from meltano.core.state_store.cache import (
+    CachedStateStoreManager,
+    supports_state_versions,
+)
+from meltano.core.state_store.filesystem import _LocalFilesystemStateStoreManager
+from meltano.core.state_store.s3.backend import S3StateStoreManager
+
+if t.TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+URI = "s3://test_access_key_id:test_secret_access_key@meltano/state"
+
+
+class TestCachedStateStoreManager:
+    @pytest.fixture
+    def remote(self) -> Generator[S3StateStoreManager, None, None]:
+        with moto.mock_aws():
+            manager = S3StateStoreManager(uri=URI, lock_timeout_seconds=10)
+            manager.client.create_bucket(Bucket=manager.bucket)
+            yield manager
+
+    @pytest.fixture
+    def subject(
+        self,
+        remote: S3StateStoreManager,  # noqa: ARG002
+        tmp_path: Path,
+    ) -> CachedStateStoreManager:
+        return CachedStateStoreManager(
+            S3StateStoreManager(uri=URI, lock_timeout_seconds=10),
+            tmp_path / "state_cache",
+        )
+
+    def test_supports_state_versions(self, remote: S3StateStoreManager) -> None:
+        assert supports_state_versions(remote)
+        assert not supports_state_versions(
+            _LocalFilesystemStateStoreManager(
+                uri="file:///tmp/meltano/state",
+                lock_timeout_seconds=10,
+            ),
+        )
+
+    def test_get(
+        self,
+        remote: S3StateStoreManager,
+        subject: CachedStateStoreManager,
+    ) -> None:
+        state = MeltanoState(
+            state_id="state-id",
+            partial_state={},
+            completed_state={"singer_state": {"a": 1}},
+        )
+        remote.set(state)
+
+        with patch.object(
+            subject.manager,
+            "get_with_version",
+            wraps=subject.manager.get_with_version,
+        ) as get_with_version:
+            # State is downloaded the first time only
+            assert subject.get("state-id") == state
+            assert subject.get("state-id") == state
+            assert get_with_version.call_count == 1
+
+            # State changed remotely is downloaded again
+            state.completed_state = {"singer_state": {"a": 2}}
+            remote.set(state)
+            assert subject.get("state-id") == state
+            assert get_with_version.call_count == 2
+
+            # State deleted remotely is not read from the cache
+            remote.delete("state-id")
+            assert subject.get("state-id") is None
+            assert not list(subject.directory.iterdir())
+
+    def test_update(
+        self,
+        remote: S3StateStoreManager,
+        subject: CachedStateStoreManager,
+    ) -> None:
+        subject.update(
+            MeltanoState(
+                state_id="state-id",
+                partial_state={"singer_state": {"a": 1}},
+                completed_state={},
+            ),
+        )
+        subject.update(
+            MeltanoState(
+                state_id="state-id",
+                partial_state={"singer_state": {"b": 2}},
+                completed_state={},
+            ),
+        )
+        expected = MeltanoState(
+            state_id="state-id",
+            partial_state={"singer_state": {"a": 1, "b": 2}},
+            completed_state={},
+        )
+        assert remote.get("state-id") == expected
+
+        # Written state isn't cached, as its version is unknown
+        assert not list(subject.directory.iterdir())
+        with patch.object(
+            subject.manager,
+            "get_with_version",
+            wraps=subject.manager.get_with_version,
+        ) as get_with_version:
+            assert subject.get("state-id") == expected
+            assert subject.get("state-id") == expected
+        assert get_with_version.call_count == 1
+
+        subject.clear("state-id")
+        assert remote.get("state-id") is None
+        assert subject.get("state-id") is None
+
+    def test_update_conditional_writes(
+        self,
+        remote: S3StateStoreManager,
+        subject: CachedStateStoreManager,
+    ) -> None:
+        subject.manager.conditional_writes = subject.conditional_writes = True
+        state = MeltanoState(
+            state_id="state-id",
+            partial_state={"singer_state": {"a": 1}},
+            completed_state={},
+        )
+        subject.update(state)
+        assert remote.get("state-id") == state
+        assert subject.get("state-id") == state
+
+        # State written conditionally isn't cached, as its version is unknown
+        subject.update(
+            MeltanoState(
+                state_id="state-id",
+                partial_state={"singer_state": {"b": 2}},
+                completed_state={},
+            ),
+        )
+        assert not list(subject.directory.iterdir())
+        assert subject.get("state-id") == remote.get("state-id")
+
+    def test_invalid_cache(
+        self,
+        remote: S3StateStoreManager,
+        subject: CachedStateStoreManager,
+    ) -> None:
+        state = MeltanoState(
+            state_id="state-id",
+            partial_state={},
+            completed_state={"singer_state": {"a": 1}},
+        )
+        remote.set(state)
+        assert subject.get("state-id") == state
+
+        (entry_path,) = subject.directory.iterdir()
+        entry_path.write_text("Not JSON")
+        assert subject.get("state-id") == state
+
+        # Entries without a version are not used
+        entry_path.write_text(
+            json.dumps(
+                {
+                    "state_id": "state-id",
+                    "completed": {"singer_state": {"a": 0}},
+                    "partial": {},
+                },
+            ),
+        )
+        assert subject.get("state-id") == state
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from meltano.core.state_store.compression import (
+    GZIP_MAGIC,
+    ZSTD_MAGIC,
+    StateCompression,
+    check_compression_available,
+    compress_state,
+    decompress_state,
+)
+
+STATE = b'{"completed": {"singer_state": {"bookmarks": {}}}, "partial": {}}'
+
+
+@pytest.mark.parametrize(
+    ("compression", "magic"),
+    (
+        pytest.param(StateCompression.NONE, b"{", id="none"),
+        pytest.param(StateCompression.GZIP, GZIP_MAGIC, id="gzip"),
+        pytest.param(StateCompression.ZSTD, ZSTD_MAGIC, id="zstd"),
+    ),
+)
+def test_compress_state(compression: StateCompression, magic: bytes) -> None:
+    if compression is StateCompression.ZSTD:
+        pytest.importorskip(
+            "compression.zstd" if sys.version_info >= (3, 14) else "zstandard",
+        )
+
+    data = compress_state(STATE, compression)
+    assert data.startswith(magic)
+    assert decompress_state(data) == STATE
+    # Compressing the same state twice gives the same output
+    assert compress_state(STATE, compression) == data
+
+
+def test_zstd_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A None entry makes the import fail
+    monkeypatch.setitem(sys.modules, "compression", None)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    check_compression_available(StateCompression.GZIP)
+    with pytest.raises(ImportError, match="'zstandard' package is required"):
+        check_compression_available(StateCompression.ZSTD)
+    with pytest.raises(ImportError, match="'zstandard' package is required"):
+        decompress_state(ZSTD_MAGIC)
@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from meltano.core.state_store import DBStateStoreManager, MeltanoState
+from meltano.core.state_store import DBStateStoreManager, MeltanoState, db
 
 
 class TestDBStateStoreManager:
@@ -24,6 +24,19 @@ class TestDBStateStoreManager:
         for state_id, expected_state in state_ids_with_expected_states:
             assert json.loads(subject.get(state_id).json_merged()) == expected_state
 
+    def test_get_many(
+        self,
+        subject: DBStateStoreManager,
+        state_ids_with_expected_states,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(db, "GET_MANY_BATCH_SIZE", 2)
+        state_ids = [state_id for state_id, _ in state_ids_with_expected_states]
+        states = subject.get_many([*state_ids, "nonexistent", state_ids[0]])
+        assert list(states) == state_ids
+        for state_id, expected_state in state_ids_with_expected_states:
+            assert json.loads(states[state_id].json_merged()) == expected_state
+
     def test_set_state(self, subject: DBStateStoreManager) -> None:
         # New partial is set
         partial_only = MeltanoState(
@@ -10,6 +10,7 @@ import os
 import platform
 import shutil
 import string
+import sys
 import typing as t
 from base64 import b64encode
 from contextlib import contextmanager
@@ -17,18 +18,27 @@ from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import botocore.exceptions
+import google.api_core.exceptions
 import moto
 import pytest
 import time_machine
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceModifiedError, ResourceNotFoundError
+from azure.storage.blob import BlobPrefix
 from azure.storage.blob._models import BlobProperties
 from boto3 import client
 from botocore.stub import Stubber
-from google.cloud.storage import Blob, Bucket
 
 from meltano.core.state_store import MeltanoState
 from meltano.core.state_store.azure.backend import AZStorageStateStoreManager
+from meltano.core.state_store.base import StateUpdateConflictError
+from meltano.core.state_store.compression import (
+    GZIP_MAGIC,
+    StateCompression,
+    decompress_state,
+)
 from meltano.core.state_store.filesystem import (
+    InvalidStateBackendConfigurationException,
     _LocalFilesystemStateStoreManager,
     _WindowsFilesystemStateStoreManager,
 )
@@ -205,6 +215,46 @@ class TestLocalFilesystemStateStoreManager:
     ) -> None:
         assert subject.get("nonexistent") is None
 
+    def test_get_many(self, subject: _LocalFilesystemStateStoreManager) -> None:
+        states = [
+            MeltanoState(state_id=f"state-{i}", completed_state={"i": i})
+            for i in range(3)
+        ]
+        for state in states:
+            subject.update(state)
+        assert subject.get_many(
+            ["state-2", "nonexistent", "state-0", "state-1", "state-2"],
+        ) == {"state-2": states[2], "state-0": states[0], "state-1": states[1]}
+
+    @pytest.mark.usefixtures("state_path")
+    @pytest.mark.parametrize("compression", ("gzip", "zstd"))
+    def test_compression(
+        self,
+        subject: _LocalFilesystemStateStoreManager,
+        compression: str,
+    ) -> None:
+        if compression == "zstd":
+            pytest.importorskip(
+                "compression.zstd" if sys.version_info >= (3, 14) else "zstandard",
+            )
+
+        state = MeltanoState(
+            state_id="state_id",
+            partial_state={},
+            completed_state={"singer_state": {"bookmarks": ["a"] * 1000}},
+        )
+        # State written before compression was enabled is still read
+        subject.update(state)
+        subject.compression = StateCompression(compression)
+        assert subject.get("state_id") == state
+
+        subject.update(state)
+        with open(subject.get_state_path("state_id"), "rb") as state_file:
+            data = state_file.read()
+        assert decompress_state(data) == state.json().encode()
+        assert len(data) < len(state.json())
+        assert subject.get("state_id") == state
+
     def test_update(
         self,
         subject: _LocalFilesystemStateStoreManager,
@@ -386,6 +436,47 @@ class TestAZStorageStateStoreManager:
             assert not subject.is_file_not_found_error(e)  # noqa: PT017
         assert not got_reader
 
+    @pytest.mark.usefixtures("mock_client")
+    def test_conditional_writes(self, subject: AZStorageStateStoreManager) -> None:
+        state = MeltanoState(
+            state_id="state_id",
+            partial_state={"singer_state": {"a": 1}},
+            completed_state={},
+        )
+        mock_blob_client = subject.client.get_blob_client.return_value
+        downloader = mock_blob_client.download_blob.return_value
+        downloader.readall.return_value = state.json().encode()
+        downloader.properties.etag = '"etag"'
+
+        assert subject.get_with_version("state_id") == (state, '"etag"')
+        subject.client.get_blob_client.assert_called_with(
+            container="meltano",
+            blob="state/state_id/state.json",
+        )
+
+        assert subject.set_if_version(state, '"etag"')
+        upload_kwargs = mock_blob_client.upload_blob.call_args.kwargs
+        assert upload_kwargs["etag"] == '"etag"'
+        assert upload_kwargs["match_condition"] == MatchConditions.IfNotModified
+
+        mock_blob_client.upload_blob.side_effect = ResourceModifiedError("Modified")
+        assert not subject.set_if_version(state, '"etag"')
+
+        mock_blob_client.get_blob_properties.return_value.etag = '"etag"'
+        assert subject.get_version("state_id") == '"etag"'
+
+        mock_blob_client.download_blob.side_effect = ResourceNotFoundError(
+            "Operation returned an invalid status 'The specified blob does "
+            "not exist.'\nErrorCode:BlobNotFound",
+        )
+        assert subject.get_with_version("state_id") == (None, None)
+
+        mock_blob_client.get_blob_properties.side_effect = ResourceNotFoundError(
+            "Operation returned an invalid status 'The specified blob does "
+            "not exist.'\nErrorCode:BlobNotFound",
+        )
+        assert subject.get_version("state_id") is None
+
     def test_state_path(self, subject: AZStorageStateStoreManager) -> None:
         assert subject.state_dir == "state"
 
@@ -399,13 +490,17 @@ class TestAZStorageStateStoreManager:
     @pytest.mark.usefixtures("mock_client")
     def test_get_state_ids(self, subject) -> None:
         mock_container_client = MagicMock()
-        mock_container_client.list_blobs.return_value = (
-            BlobProperties(name=f"state/state_id_{i}/state.json") for i in range(10)
+        mock_container_client.walk_blobs.return_value = itertools.chain(
+            (BlobPrefix(prefix=f"state/state_id_{i}/") for i in range(10)),
+            (BlobProperties(name="state/not-a-state-dir.json"),),
         )
         subject.client.get_container_client.return_value = mock_container_client
-        assert set(subject.get_state_ids()) == {f"state_id_{i}" for i in range(10)}
-        mock_container_client.list_blobs.assert_called_once_with(
-            name_starts_with="state/",
+        assert set(subject.get_state_ids("state_id_*")) == {
+            f"state_id_{i}" for i in range(10)
+        }
+        mock_container_client.walk_blobs.assert_called_once_with(
+            name_starts_with="state/state_id_",
+            delimiter="/",
         )
 
 
@@ -487,6 +582,179 @@ class TestS3StateStoreManager:
             store_manager.client.create_bucket(Bucket=store_manager.bucket)
             store_manager.set(MeltanoState(state_id=state_id, completed_state={}))
 
+    def test_get_many(self) -> None:
+        with moto.mock_aws():
+            store_manager = S3StateStoreManager(
+                uri="s3://test_access_key_id:test_secret_access_key@meltano/state",
+                lock_timeout_seconds=10,
+                max_concurrency=4,
+            )
+            store_manager.client.create_bucket(Bucket=store_manager.bucket)
+            states = [
+                MeltanoState(
+                    state_id=f"state-{i}",
+                    completed_state={"singer_state": {"i": i}},
+                    partial_state={},
+                )
+                for i in range(20)
+            ]
+            for state in states:
+                store_manager.set(state)
+
+            with patch.object(
+                store_manager,
+                "read_state",
+                wraps=store_manager.read_state,
+            ) as read_state:
+                got = store_manager.get_many(
+                    [state.state_id for state in states] + ["nonexistent"],
+                )
+            assert got == {state.state_id: state for state in states}
+            assert read_state.call_count == 21
+            assert store_manager.get_many([]) == {}
+
+    def test_compression(self) -> None:
+        state = MeltanoState(
+            state_id="state-id",
+            partial_state={"singer_state": {"a": 1}},
+            completed_state={},
+        )
+        with moto.mock_aws():
+            store_manager = S3StateStoreManager(
+                uri="s3://test_access_key_id:test_secret_access_key@meltano/state",
+                lock_timeout_seconds=10,
+                compression="gzip",
+            )
+            store_manager.client.create_bucket(Bucket=store_manager.bucket)
+            store_manager.update(state)
+            assert store_manager.get("state-id") == state
+
+            store_manager.conditional_writes = True
+            store_manager.update(
+                MeltanoState(
+                    state_id="state-id",
+                    partial_state={"singer_state": {"b": 2}},
+                    completed_state={},
+                ),
+            )
+            state.partial_state = {"singer_state": {"a": 1, "b": 2}}
+            assert store_manager.get_with_version("state-id")[0] == state
+
+            response = store_manager.client.get_object(
+                Bucket=store_manager.bucket,
+                Key=store_manager.get_state_path("state-id"),
+            )
+            assert response["ContentType"] == "application/gzip"
+            assert response["Body"].read().startswith(GZIP_MAGIC)
+
+    def test_invalid_compression(self) -> None:
+        with pytest.raises(
+            InvalidStateBackendConfigurationException,
+            match="Unsupported state compression 'lz4'",
+        ):
+            S3StateStoreManager(
+                uri="s3://meltano/state",
+                lock_timeout_seconds=10,
+                compression="lz4",
+            )
+
+    def test_update_conditional_writes(self) -> None:
+        state_id = "state-id"
+        with moto.mock_aws():
+            store_manager = S3StateStoreManager(
+                uri="s3://test_access_key_id:test_secret_access_key@meltano/state",
+                lock_timeout_seconds=10,
+                conditional_writes=True,
+            )
+            store_manager.client.create_bucket(Bucket=store_manager.bucket)
+            store_manager.update(
+                MeltanoState(
+                    state_id=state_id,
+                    partial_state={"singer_state": {"a": 1}},
+                    completed_state={},
+                ),
+            )
+
+            # A concurrent update between reading and writing state is merged
+            set_if_version = store_manager.set_if_version
+            concurrent_update = True
+
+            def set_after_concurrent_update(
+                state: MeltanoState,
+                version: str | None,
+            ) -> bool:
+                nonlocal concurrent_update
+                if concurrent_update:
+                    concurrent_update = False
+                    store_manager.update(
+                        MeltanoState(
+                            state_id=state_id,
+                            partial_state={"singer_state": {"b": 2}},
+                        ),
+                    )
+                return set_if_version(state, version)
+
+            with patch.object(
+                store_manager,
+                "set_if_version",
+                side_effect=set_after_concurrent_update,
+            ) as mock_set_if_version:
+                store_manager.update(
+                    MeltanoState(
+                        state_id=state_id,
+                        partial_state={"singer_state": {"c": 3}},
+                    ),
+                )
+            assert mock_set_if_version.call_count == 3
+            assert store_manager.get(state_id).partial_state == {
+                "singer_state": {"a": 1, "b": 2, "c": 3},
+            }
+
+            # Complete state replaces the existing state
+            complete_state = MeltanoState(
+                state_id=state_id,
+                completed_state={"singer_state": {"d": 4}},
+                partial_state={},
+            )
+            store_manager.update(complete_state)
+            assert store_manager.get(state_id) == complete_state
+
+            # No lock files are written
+            objects = store_manager.client.list_objects_v2(Bucket=store_manager.bucket)
+            assert [obj["Key"] for obj in objects["Contents"]] == [
+                f"state/{state_id}/state.json",
+            ]
+
+            # Retries are bounded
+            with (
+                patch.object(store_manager, "set_if_version", return_value=False),
+                patch("meltano.core.state_store.base.sleep") as mock_sleep,
+                pytest.raises(StateUpdateConflictError),
+            ):
+                store_manager.update(
+                    MeltanoState(
+                        state_id=state_id,
+                        partial_state={"singer_state": {"e": 5}},
+                    ),
+                )
+            assert mock_sleep.call_count == 10
+
+            store_manager.clear(state_id)
+            assert store_manager.get_with_version(state_id) == (None, None)
+
+    def test_conditional_writes_unsupported(self) -> None:
+        with patch.object(
+            S3StateStoreManager,
+            "supports_conditional_writes",
+            new=False,
+        ):
+            store_manager = S3StateStoreManager(
+                uri="s3://meltano/state",
+                lock_timeout_seconds=10,
+                conditional_writes=True,
+            )
+        assert not store_manager.conditional_writes
+
     def test_update_fail_object_in_glacier(
         self,
         monkeypatch: pytest.MonkeyPatch,
@@ -577,102 +845,81 @@ class TestS3StateStoreManager:
             subject.delete_file("/state/test_delete")
 
     def test_get_state_ids(self, subject: S3StateStoreManager) -> None:
-        response = {
-            "ResponseMetadata": {
-                "RequestId": "test_get_state_ids",
-                "HostId": "",
-                "HTTPStatusCode": 200,
-                "HTTPHeaders": {
-                    "accept-ranges": "bytes",
-                    "content-length": "993",
-                    "content-security-policy": "block-all-mixed-content",
-                    "content-type": "application/xml",
-                    "server": "test_get_state_ids",
-                    "strict-transport-security": "max-age=31536000; includeSubDomains",
-                    "vary": "Origin, Accept-Encoding",
-                    "x-amz-request-id": "test_get_state_ids",
-                    "x-content-type-options": "nosniff",
-                    "x-xss-protection": "1; mode=block",
-                    "date": "Wed, 26 Oct 2022 01:15:33 GMT",
-                },
-                "RetryAttempts": 0,
+        pages = (
+            {
+                "IsTruncated": True,
+                "NextContinuationToken": "page-2",
+                "CommonPrefixes": [{"Prefix": "state/state_id_1/"}],
             },
-            "IsTruncated": False,
-            "Contents": [
-                {
-                    "Key": "state/state_id_2/state.json",
-                    "LastModified": datetime.datetime(
-                        2022,
-                        10,
-                        26,
-                        1,
-                        15,
-                        26,
-                        173000,
-                        tzinfo=datetime.timezone.utc,
-                    ),
-                    "ETag": '"test_get_state_ids"',
-                    "Size": 60,
-                    "StorageClass": "STANDARD",
-                    "Owner": {
-                        "DisplayName": "test_get_state_ids",
-                        "ID": "test_get_state_ids",
-                    },
-                },
-                {
-                    "Key": "state/state_id_1/state.json",
-                    "LastModified": datetime.datetime(
-                        2022,
-                        10,
-                        24,
-                        1,
-                        15,
-                        12,
-                        450000,
-                        tzinfo=datetime.timezone.utc,
-                    ),
-                    "ETag": '"test_get_state_ids"',
-                    "Size": 60,
-                    "StorageClass": "STANDARD",
-                    "Owner": {
-                        "DisplayName": "test_get_state_ids",
-                        "ID": "test_get_state_ids",
-                    },
+            {
+                "IsTruncated": False,
+                "CommonPrefixes": [{"Prefix": "state/state_id_2/"}],
+            },
+        )
+        with self.stubber() as stubber:
+            stubber.add_response(
+                "list_objects_v2",
+                pages[0],
+                expected_params={
+                    "Bucket": subject.bucket,
+                    "Prefix": "state/",
+                    "Delimiter": "/",
                 },
-                {
-                    "Key": "state.json",
-                    "LastModified": datetime.datetime(
-                        2022,
-                        10,
-                        24,
-                        1,
-                        15,
-                        12,
-                        450000,
-                        tzinfo=datetime.timezone.utc,
-                    ),
-                    "ETag": '"test_get_state_ids"',
-                    "Size": 60,
-                    "StorageClass": "STANDARD",
-                    "Owner": {
-                        "DisplayName": "test_get_state_ids",
-                        "ID": "test_get_state_ids",
-                    },
+            )
+            stubber.add_response(
+                "list_objects_v2",
+                pages[1],
+                expected_params={
+                    "Bucket": subject.bucket,
+                    "Prefix": "state/",
+                    "Delimiter": "/",
+                    "ContinuationToken": "page-2",
                 },
-            ],
-            "Name": subject.bucket,
-            "Delimiter": "",
-            "MaxKeys": 1000,
-            "EncodingType": "url",
-            "KeyCount": 2,
-        }
-        with self.stubber() as stubber:
+            )
+            assert list(subject.get_state_ids()) == ["state_id_1", "state_id_2"]
+
+            # The literal start of a pattern is used to filter the listing
             stubber.add_response(
                 "list_objects_v2",
-                response,
-                expected_params={"Bucket": subject.bucket, "Prefix": "/state"},
+                pages[1],
+                expected_params={
+                    "Bucket": subject.bucket,
+                    "Prefix": "state/state_id_",
+                    "Delimiter": "/",
+                },
+            )
+            assert list(subject.get_state_ids("state_id_*2")) == ["state_id_2"]
+
+    def test_get_state_ids_pattern(self) -> None:
+        with moto.mock_aws():
+            store_manager = S3StateStoreManager(
+                uri="s3://test_access_key_id:test_secret_access_key@meltano/state",
+                lock_timeout_seconds=10,
+            )
+            store_manager.client.create_bucket(Bucket=store_manager.bucket)
+            for state_id in ("dev:a-to-b", "dev:c-to-d", "prod:a-to-b"):
+                store_manager.set(MeltanoState(state_id=state_id, completed_state={}))
+            store_manager.client.put_object(
+                Bucket=store_manager.bucket,
+                Key="state/not-a-state-dir.json",
+                Body=b"{}",
             )
-            assert set(subject.get_state_ids()) == {"state_id_1", "state_id_2"}
+
+            # Only state directories are listed
+            assert set(store_manager.get_state_ids()) == {
+                "dev:a-to-b",
+                "dev:c-to-d",
+                "prod:a-to-b",
+            }
+            assert list(store_manager.get_state_ids("dev:*-to-b")) == ["dev:a-to-b"]
+            assert list(store_manager.get_state_ids("prod.*")) == ["prod:a-to-b"]
+
+            # A quantified character may be missing from matching state IDs
+            store_manager.set(MeltanoState(state_id="tap-a", completed_state={}))
+            assert list(store_manager.get_state_ids("tap-ab?")) == ["tap-a"]
+            assert list(store_manager.get_state_ids("dev:a-to-bx{0,1}")) == [
+                "dev:a-to-b",
+            ]
 
 
 class TestGCSStateStoreManager:
@@ -736,6 +983,43 @@ class TestGCSStateStoreManager:
             assert not subject.is_file_not_found_error(e)  # noqa: PT017
         assert not got_reader
 
+    @pytest.mark.usefixtures("mock_client")
+    def test_conditional_writes(self, subject: GCSStateStoreManager) -> None:
+        state = MeltanoState(
+            state_id="state_id",
+            partial_state={"singer_state": {"a": 1}},
+            completed_state={},
+        )
+        mock_bucket = subject.client.bucket.return_value
+        mock_blob = mock_bucket.blob.return_value
+        mock_blob.download_as_bytes.return_value = state.json().encode()
+        mock_blob.generation = 42
+
+        assert subject.get_with_version("state_id") == (state, "42")
+        mock_bucket.blob.assert_called_with("state/state_id/state.json")
+
+        assert subject.set_if_version(state, "42")
+        assert (
+            mock_blob.upload_from_string.call_args.kwargs["if_generation_match"] == 42
+        )
+
+        mock_blob.upload_from_string.side_effect = (
+            google.api_core.exceptions.PreconditionFailed("Changed")
+        )
+        assert not subject.set_if_version(state, None)
+        assert mock_blob.upload_from_string.call_args.kwargs["if_generation_match"] == 0
+
+        mock_blob.download_as_bytes.side_effect = google.api_core.exceptions.NotFound(
+            "No such object: meltano/state/state_id/state.json",
+        )
+        assert subject.get_with_version("state_id") == (None, None)
+
+        mock_bucket.get_blob.return_value.generation = 43
+        assert subject.get_version("state_id") == "43"
+        mock_bucket.get_blob.assert_called_with("state/state_id/state.json")
+        mock_bucket.get_blob.return_value = None
+        assert subject.get_version("state_id") is None
+
     def test_state_path(self, subject: GCSStateStoreManager) -> None:
         assert subject.state_dir == "state"
 
@@ -750,32 +1034,27 @@ class TestGCSStateStoreManager:
 
     @pytest.mark.usefixtures("mock_client")
     def test_get_state_ids(self, subject: GCSStateStoreManager) -> None:
-        subject.client.list_blobs.return_value = (
-            Blob(bucket=Bucket("meltano"), name=f"state/state_id_{i}/state.json")
-            for i in range(10)
+        subject.client.list_blobs.return_value.pages = (
+            MagicMock(prefixes=[f"state/state_id_{i}/" for i in range(5)]),
+            MagicMock(prefixes=[f"state/state_id_{i}/" for i in range(5, 10)]),
         )
-        assert set(subject.get_state_ids()) == {f"state_id_{i}" for i in range(10)}
+        assert list(subject.get_state_ids()) == [f"state_id_{i}" for i in range(10)]
         subject.client.list_blobs.assert_called_once_with(
             bucket_or_name="meltano",
-            prefix="state",
+            prefix="state/",
+            delimiter="/",
         )
 
     @pytest.mark.usefixtures("mock_client")
-    def test_get_state_ids_when_any_files_was_located_in_root(
-        self,
-        subject: GCSStateStoreManager,
-    ) -> None:
-        subject.client.list_blobs.return_value = itertools.chain(
-            (Blob(bucket=Bucket("meltano"), name="my-file.txt") for _ in range(2)),
-            (
-                Blob(bucket=Bucket("meltano"), name=f"state/state_id_{i}/state.json")
-                for i in range(10)
-            ),
+    def test_get_state_ids_pattern(self, subject: GCSStateStoreManager) -> None:
+        subject.client.list_blobs.return_value.pages = (
+            MagicMock(prefixes=["state/dev:a-to-b/", "state/dev:c-to-d/"]),
         )
-        assert len(set(subject.get_state_ids())) == 10
+        assert list(subject.get_state_ids("dev:*-to-b")) == ["dev:a-to-b"]
         subject.client.list_blobs.assert_called_once_with(
             bucket_or_name="meltano",
-            prefix="state",
+            prefix="state/dev:",
+            delimiter="/",
         )
 
     @pytest.fixture
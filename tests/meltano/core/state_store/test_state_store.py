@@ -19,6 +19,7 @@ from meltano.core.error import MeltanoError
 from meltano.core.setting_definition import SettingDefinition
 from meltano.core.state_store import (
     SYSTEMDB,
+    CachedStateStoreManager,
     DBStateStoreManager,
     MeltanoState,
     StateBackend,
@@ -163,6 +164,9 @@ def test_settings_to_manager_kwargs(
     assert kwargs.pop("uri") == "custom://"
     assert kwargs.pop("lock_timeout_seconds") is not None
     assert kwargs.pop("lock_retry_seconds") is not None
+    assert kwargs.pop("max_concurrency") is not None
+    assert kwargs.pop("conditional_writes") is not None
+    assert kwargs.pop("compression") is not None
     assert kwargs == expected
 
 
@@ -189,6 +193,16 @@ class TestLocalFilesystemStateBackend:
         assert isinstance(file_state_store, _LocalFilesystemStateStoreManager)
         assert file_state_store.state_dir == state_path
 
+        # Local state has no versions to revalidate a cache with
+        project.settings.set(["state_cache", "dir"], ".meltano/state_cache")
+        try:
+            file_state_store = state_store_manager_from_project_settings(
+                project.settings,
+            )
+        finally:
+            project.settings.unset(["state_cache", "dir"])
+        assert isinstance(file_state_store, _LocalFilesystemStateStoreManager)
+
 
 class TestAzureStateBackend:
     def test_manager_from_settings(self, project: Project) -> None:
@@ -393,6 +407,21 @@ class TestS3StateBackend:
             s3_state_store_direct_creds.aws_secret_access_key == "a_different_key"  # noqa: S105
         )
 
+    def test_manager_from_settings_state_cache(
+        self,
+        project: Project,
+        s3_uri: str,
+    ) -> None:
+        project.settings.set(["state_backend", "uri"], s3_uri)
+        project.settings.set(["state_cache", "dir"], ".meltano/state_cache")
+        try:
+            state_store = state_store_manager_from_project_settings(project.settings)
+        finally:
+            project.settings.unset(["state_cache", "dir"])
+        assert isinstance(state_store, CachedStateStoreManager)
+        assert isinstance(state_store.manager, S3StateStoreManager)
+        assert state_store.directory.parent == project.root / ".meltano/state_cache"
+
     def test_missing_aws_secret_access_key(
         self,
         aws_access_key_id: str,
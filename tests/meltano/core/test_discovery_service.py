@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import typing as t
+
+import pytest
+
+from meltano.core.discovery_service import CatalogDiscoveryService
+from meltano.core.logging import setup_logging
+from meltano.core.plugin.error import PluginExecutionError
+from meltano.core.plugin.singer.tap import SingerTap
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from sqlalchemy.orm.session import Session
+
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+    from meltano.core.plugin_invoker import PluginInvoker
+    from meltano.core.project import Project
+
+
+@pytest.fixture(autouse=True)
+def _setup_logging() -> None:
+    # Invoking plugins relies on the logging configuration of Meltano
+    setup_logging()
+
+
+class TestCatalogDiscoveryService:
+    @pytest.mark.asyncio
+    async def test_discover_catalogs(
+        self,
+        project: Project,
+        session: Session,
+        tap: ProjectPlugin,
+        inherited_tap: ProjectPlugin,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        running = 0
+        all_running = asyncio.Event()
+
+        async def mock_run_discovery(
+            _tap: SingerTap,
+            plugin_invoker: PluginInvoker,
+            catalog_path: Path,
+        ) -> None:
+            nonlocal running
+            running += 1
+            if running == 2:
+                all_running.set()
+            # Fails unless both extractors are run in discovery mode at once
+            await asyncio.wait_for(all_running.wait(), timeout=10)
+
+            name = plugin_invoker.plugin.name
+            catalog_path.write_text(json.dumps({"streams": [], "name": name}))  # noqa: ASYNC240
+
+        monkeypatch.setattr(SingerTap, "run_discovery", mock_run_discovery)
+
+        reported = []
+        service = CatalogDiscoveryService(
+            project,
+            session,
+            status_cb=reported.append,
+            parallelism=2,
+            refresh=True,
+        )
+        # Found in the project, the extractors share the plugin object their hooks
+        # are triggered on
+        plugins = [
+            project.plugins.find_plugin(plugin.name, plugin_type=plugin.type)
+            for plugin in (tap, inherited_tap, tap)
+        ]
+        results = await service.discover_catalogs(plugins)
+
+        assert [result.plugin.name for result in results] == [
+            tap.name,
+            inherited_tap.name,
+        ]
+        assert all(result.successful for result in results), [
+            result.error for result in results
+        ]
+        assert sorted(result.plugin.name for result in reported) == sorted(
+            [tap.name, inherited_tap.name],
+        )
+
+        for plugin in (tap, inherited_tap):
+            catalog_path = project.dirs.run(plugin.name, "tap.properties.json")
+            assert json.loads(catalog_path.read_text())["name"] == plugin.name
+
+    @pytest.mark.asyncio
+    async def test_discover_catalogs_failure(
+        self,
+        project: Project,
+        session: Session,
+        tap: ProjectPlugin,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def mock_run_discovery(*args: t.Any) -> None:  # noqa: ARG001
+            msg = "Catalog discovery failed: tap crashed"
+            raise PluginExecutionError(msg)
+
+        monkeypatch.setattr(SingerTap, "run_discovery", mock_run_discovery)
+
+        service = CatalogDiscoveryService(project, session, refresh=True)
+        (result,) = await service.discover_catalogs([tap])
+
+        assert not result.successful
+        assert result.error == "Catalog discovery failed: tap crashed"
+        assert result.duration >= 0
+
+    @pytest.mark.asyncio
+    async def test_discover_catalogs_without_capabilities(
+        self,
+        project: Project,
+        session: Session,
+        tap: ProjectPlugin,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Neither the extractor nor its parent advertise any capabilities
+        monkeypatch.setattr(tap, "capabilities", None)
+        monkeypatch.setattr(tap.parent, "capabilities", None)
+
+        service = CatalogDiscoveryService(project, session, refresh=True)
+        (result,) = await service.discover_catalogs([tap])
+
+        assert not result.successful
+        assert "`discover` capability is not advertised" in result.error